@@ -0,0 +1,120 @@
+"""
+카테고리 배정 벤치마크: 기존 3단계 리스트 필터링 방식과 category_allocator.allocate_videos 비교
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_category_allocator.py
+    python benchmarks/bench_category_allocator.py --videos 10000 --categories 10 --max-per-category 500
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from category_allocator import allocate_videos
+
+
+def legacy_allocate(sorted_videos, category_ids, max_per_category):
+    """search_youtube_videos_by_category에 있던 기존 배정 로직 (비교 기준)"""
+    result = {category_id: [] for category_id in category_ids}
+    used_video_ids = set()
+
+    for video in sorted_videos:
+        if len(video["category_matches"]) == 1 and len(result[video["category_matches"][0]]) < max_per_category:
+            category_id = video["category_matches"][0]
+            video_copy = video.copy()
+            video_copy["category"] = category_id
+            result[category_id].append(video_copy)
+            used_video_ids.add(video["video_id"])
+
+    for category_id in category_ids:
+        needed_videos = max_per_category - len(result[category_id])
+        if needed_videos <= 0:
+            continue
+        matching_videos = [
+            video for video in sorted_videos
+            if video["video_id"] not in used_video_ids and category_id in video["category_matches"]
+        ]
+        for i, video in enumerate(matching_videos):
+            if i >= needed_videos:
+                break
+            video_copy = video.copy()
+            video_copy["category"] = category_id
+            result[category_id].append(video_copy)
+            used_video_ids.add(video["video_id"])
+
+    for category_id in category_ids:
+        needed_videos = max_per_category - len(result[category_id])
+        if needed_videos <= 0:
+            continue
+        unused_videos = [video for video in sorted_videos if video["video_id"] not in used_video_ids]
+        for i, video in enumerate(unused_videos):
+            if i >= needed_videos:
+                break
+            video_copy = video.copy()
+            video_copy["category"] = category_id
+            result[category_id].append(video_copy)
+            used_video_ids.add(video["video_id"])
+
+    return result
+
+
+def make_videos(video_count, category_ids, seed):
+    """임의의 조회수와 1~3개 카테고리 매칭을 가진 합성 비디오 목록 (조회수 내림차순)"""
+    rng = random.Random(seed)
+    videos = []
+    for i in range(video_count):
+        matches = [rng.choice(category_ids) for _ in range(rng.choice([1, 1, 1, 2, 3]))]
+        videos.append({
+            "video_id": f"video{i}",
+            "view_count": rng.randint(0, 1_000_000),
+            "category_matches": matches,
+        })
+    videos.sort(key=lambda x: x["view_count"], reverse=True)
+    return videos
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카테고리 배정 벤치마크")
+    parser.add_argument("--videos", type=int, default=10000)
+    parser.add_argument("--categories", type=int, default=10)
+    parser.add_argument("--max-per-category", type=int, nargs="*", default=[3, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    category_ids = [f"category{i}" for i in range(args.categories)]
+    print(f"{'videos':>8} {'max/cat':>8} {'legacy(ms)':>12} {'indexed(ms)':>12} {'speedup':>8}")
+
+    for video_count in sorted({args.videos // 10, args.videos // 2, args.videos}):
+        videos = make_videos(video_count, category_ids, args.seed)
+        for max_per_category in args.max_per_category:
+            legacy = legacy_allocate(videos, category_ids, max_per_category)
+            indexed = allocate_videos(videos, category_ids, max_per_category)
+            # 두 방식의 배정 결과(순서 포함)가 같은지 확인
+            for category_id in category_ids:
+                expected = [video["video_id"] for video in legacy[category_id]]
+                actual = [videos[index]["video_id"] for index in indexed[category_id]]
+                assert expected == actual, f"{category_id} 배정 결과가 다릅니다."
+
+            legacy_time = best_of(args.repeat, lambda: legacy_allocate(videos, category_ids, max_per_category))
+            indexed_time = best_of(args.repeat, lambda: allocate_videos(videos, category_ids, max_per_category))
+            print(
+                f"{video_count:>8} {max_per_category:>8} {legacy_time * 1000:>12.2f} "
+                f"{indexed_time * 1000:>12.2f} {legacy_time / indexed_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
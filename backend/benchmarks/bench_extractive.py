@@ -0,0 +1,150 @@
+"""
+추출 단계 벤치마크: 기존 경로(앞부분 담기/map-reduce)와 extractive 추출 경로의 입력 토큰, 호출 수, 예상 비용, 추출 시간 비교
+
+--llm을 주면 같은 합성 자막을 두 경로로 실제 요약하여 결과 HTML을 --out 디렉터리에 나란히 저장하고
+엔드포인트별 토큰 사용량을 출력 (OPENAI_API_BASE로 로컬 OpenAI 호환 스텁 서버를 지정할 수 있음)
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_extractive.py
+    python benchmarks/bench_extractive.py --hours 0.3 1 3 --videos 3
+    OPENAI_API_BASE=http://127.0.0.1:8000/v1 python benchmarks/bench_extractive.py --llm --out extractive_out
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_transcript_pipeline import make_auto_captions
+from extractive import EXTRACTIVE_OFF, EXTRACTIVE_ON, extract_comparison, extract_sentences, render_flagged
+from llm_client import MODEL_PRICES_PER_1K
+from token_budget import load_token_counter, pack_texts
+from transcript_pipeline import normalize_transcript
+
+MODEL = "gpt-3.5-turbo"
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def input_cost(tokens):
+    return tokens / 1000 * MODEL_PRICES_PER_1K[MODEL][0]
+
+
+def bench_summary(args, counter):
+    print(
+        f"{'hours':>6} {'source tok':>10} {'base tok':>9} {'base calls':>10} {'base $':>9} "
+        f"{'ext tok':>8} {'ext $':>9} {'saved':>6} {'extract(ms)':>11}"
+    )
+    read_budget = args.map_chunk_tokens * args.max_map_chunks
+    for hours in args.hours:
+        cleaned = normalize_transcript(make_auto_captions(hours, args.seed), read_budget, counter)
+        source_tokens = counter.count(cleaned)
+        if source_tokens > args.summary_budget:
+            base_tokens = source_tokens
+            base_calls = math.ceil(source_tokens / args.map_chunk_tokens) + 1
+        else:
+            base_tokens, base_calls = source_tokens, 1
+
+        elapsed, extracted = best_of(
+            args.repeat, lambda: extract_sentences(cleaned, args.summary_budget, counter, source_tokens)
+        )
+        extracted_tokens = counter.count(extracted)
+        print(
+            f"{hours:>6g} {source_tokens:>10} {base_tokens:>9} {base_calls:>10} {input_cost(base_tokens):>9.5f} "
+            f"{extracted_tokens:>8} {input_cost(extracted_tokens):>9.5f} "
+            f"{1 - extracted_tokens / base_tokens:>6.0%} {elapsed * 1000:>11.2f}"
+        )
+
+
+def bench_comparison(args, counter):
+    read_budget = args.map_chunk_tokens * args.max_map_chunks
+    hours = args.hours[0]
+    transcripts = [
+        normalize_transcript(make_auto_captions(hours, args.seed + index), read_budget, counter)
+        for index in range(args.videos)
+    ]
+    baseline = pack_texts(transcripts, args.comparison_budget, counter)
+    elapsed, flagged = best_of(
+        args.repeat, lambda: extract_comparison(transcripts, args.comparison_budget, counter)
+    )
+    extracted = [render_flagged(sentences) for sentences in flagged]
+    shared = sum(flag == "shared" for sentences in flagged for _, flag in sentences)
+    unique = sum(flag == "unique" for sentences in flagged for _, flag in sentences)
+    print(
+        f"\n비교 요약 ({args.videos}개 영상, 각 {hours:g}시간): 기존 {sum(counter.count(t) for t in baseline)}토큰 "
+        f"(앞부분) / 추출 {sum(counter.count(t) for t in extracted)}토큰 (전체에서 선택, 공통 {shared}문장 "
+        f"고유 {unique}문장), 추출 {elapsed * 1000:.2f}ms"
+    )
+
+
+def bench_llm(args, counter):
+    """두 경로로 실제 요약하여 결과와 토큰 사용량을 비교"""
+    from llm_client import LLMClient
+    from summary_cache import SummaryCache
+    from summary_service import SUMMARY_FORMAT_HTML, SummaryService
+
+    os.makedirs(args.out, exist_ok=True)
+    llm_client = LLMClient(
+        api_key=os.getenv("OPENAI_API_KEY", "stub"),
+        api_base=os.getenv("OPENAI_API_BASE") or None,
+        model=MODEL,
+        token_counter=counter,
+    )
+    context = {"title": "취업 준비 강의", "keyword": "취업"}
+    for mode in (EXTRACTIVE_OFF, EXTRACTIVE_ON):
+        service = SummaryService(
+            llm_client.api_key, summary_cache=SummaryCache(), token_counter=counter, llm_client=llm_client,
+            summary_input_tokens=args.summary_budget, map_chunk_tokens=args.map_chunk_tokens,
+            max_map_chunks=args.max_map_chunks, extractive_mode=mode,
+        )
+        for hours in args.hours:
+            started = time.perf_counter()
+            summary = service.summarize(make_auto_captions(hours, args.seed), context, SUMMARY_FORMAT_HTML)
+            elapsed = time.perf_counter() - started
+            path = os.path.join(args.out, f"summary_{hours:g}h_{mode}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(summary)
+            print(f"[{mode}] {hours:g}시간 자막 요약 {elapsed:.2f}초 → {path}")
+
+    print("\n엔드포인트별 사용량 (on/off 합계):")
+    for endpoint, usage in llm_client.stats()["usage_by_endpoint"].items():
+        print(
+            f"  {endpoint:<16} 요청 {usage['requests']:>3} 입력 {usage['prompt_tokens']:>7} "
+            f"출력 {usage['completion_tokens']:>6} ${usage['cost_usd']:.5f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요약 전 추출 단계 벤치마크")
+    parser.add_argument("--hours", type=float, nargs="*", default=[0.3, 1, 3])
+    parser.add_argument("--videos", type=int, default=3)
+    parser.add_argument("--summary-budget", type=int, default=2000)
+    parser.add_argument("--comparison-budget", type=int, default=3000)
+    parser.add_argument("--map-chunk-tokens", type=int, default=2500)
+    parser.add_argument("--max-map-chunks", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--llm", action="store_true", help="실제 요약 결과까지 비교 (OpenAI 또는 스텁 서버 호출)")
+    parser.add_argument("--out", default="extractive_out")
+    args = parser.parse_args()
+
+    counter = load_token_counter()
+    print(f"토큰 계산기: {counter.name}")
+    bench_summary(args, counter)
+    bench_comparison(args, counter)
+    if args.llm:
+        print()
+        bench_llm(args, counter)
+
+
+if __name__ == "__main__":
+    main()
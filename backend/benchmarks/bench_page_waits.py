@@ -0,0 +1,107 @@
+"""
+Selenium 페이지 전환 대기 벤치마크: 페이지 버튼을 눌러 넘기는 순차 크롤러(_scrape_data_*_selenium)를 PageWaiter로 실행해
+전체 시간, 전환별 대기 시간, 전환을 확인한 신호, 학습된 제한 시간을 출력하고 결과를 expected_{prefix}.json과 비교
+(이전에는 페이지를 넘길 때마다 time.sleep(2)를 해서 전환 지연과 관계없이 "고정 대기" 만큼은 항상 걸렸음)
+
+기본은 WebDriver 스텁(webdriver_stub.py)이 클릭 후 --transition-latency초 동안 blockUI 오버레이를 띄웠다가 다음 페이지로 바꾸며
+--chrome이면 로컬 헤드리스 Chrome, --remote면 원격 WebDriver에서 fixture 페이지의 goPage()로 넘김
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_page_waits.py
+    python benchmarks/bench_page_waits.py --transition-latency 0.05 0.5 1.5 --prefix senior
+    python benchmarks/bench_page_waits.py --chrome
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium import webdriver
+
+import webdriver_stub
+from bench_work24_crawler import FIXTURE_DIR, fixture_pages, start_fixture_server, without_host
+from d_sup import _scrape_data_disabled_selenium
+from driver_pool import DriverPool, create_chrome_driver, default_chrome_options
+from o_sup import _scrape_data_senior_selenium
+from page_waits import PageWaiter
+
+SCRAPERS = {"senior": _scrape_data_senior_selenium, "disabled": _scrape_data_disabled_selenium}
+FIXED_SLEEP_SECONDS = 2  # 이전 페이지 전환 대기
+
+
+def driver_factory(args, transition_latency):
+    """(드라이버 생성 함수, 스텁 서버 또는 None)"""
+    if args.chrome:
+        return create_chrome_driver, None
+    if args.remote:
+        return lambda: webdriver.Remote(command_executor=args.remote, options=default_chrome_options()), None
+    server = webdriver_stub.make_server(
+        port=0, command_latency=args.command_latency, transition_latency=transition_latency
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    return lambda: webdriver.Remote(command_executor=url, options=default_chrome_options()), server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Selenium 페이지 전환 대기 벤치마크 (저장된 HTML 사용)")
+    parser.add_argument("--prefix", default="senior", choices=sorted(SCRAPERS), help="fixture 파일 접두사")
+    parser.add_argument("--transition-latency", type=float, nargs="*", default=[0.1, 0.5],
+                        help="스텁 사용 시 클릭 후 다음 페이지가 보일 때까지 걸리는 시간(초)")
+    parser.add_argument("--command-latency", type=float, default=0.003, help="스텁 사용 시 WebDriver 명령당 지연(초)")
+    parser.add_argument("--repeat", type=int, default=2, help="같은 PageWaiter로 반복할 크롤링 수 (제한 시간 학습 확인)")
+    parser.add_argument("--chrome", action="store_true", help="로컬 헤드리스 Chrome 사용")
+    parser.add_argument("--remote", help="원격 WebDriver 주소")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    pages = fixture_pages(args.prefix)
+    if not pages:
+        sys.exit(f"{FIXTURE_DIR}에 {args.prefix}_page1.html이 없습니다.")
+    with open(os.path.join(FIXTURE_DIR, f"expected_{args.prefix}.json"), encoding="utf-8") as f:
+        expected = json.load(f)
+    fixture_server, target_url = start_fixture_server(pages, 0)
+    scrape = SCRAPERS[args.prefix]
+    transitions = len(pages) - 1
+    print(
+        f"fixture {args.prefix}: 페이지 {len(pages)}개 (전환 {transitions}번), "
+        f"이전 고정 대기만 {transitions * FIXED_SLEEP_SECONDS}초/회"
+    )
+
+    latencies = [None] if args.chrome or args.remote else args.transition_latency
+    for transition_latency in latencies:
+        factory, stub_server = driver_factory(args, transition_latency)
+        driver_pool = DriverPool(size=1, factory=factory)
+        waiter = PageWaiter()
+        label = "실제 브라우저" if transition_latency is None else f"전환 지연 {transition_latency:g}초"
+        try:
+            for run in range(1, args.repeat + 1):
+                started = time.perf_counter()
+                result = scrape(target_url=target_url, max_pages=len(pages), driver_pool=driver_pool, waiter=waiter)
+                elapsed = time.perf_counter() - started
+                matched = without_host(result) == expected
+                print(f"{label} #{run}: {elapsed:.2f}초, 행 {len(result)}개, expected와 {'일치' if matched else '불일치'}")
+        finally:
+            driver_pool.close()
+            if stub_server is not None:
+                stub_server.shutdown()
+
+        stats = waiter.stats()
+        for kind, kind_stats in stats["kinds"].items():
+            print(
+                f"  {kind:<6} 대기 {kind_stats['waits']}번 평균 {kind_stats['avg_seconds'] * 1000:.0f}ms "
+                f"최대 {kind_stats['max_seconds'] * 1000:.0f}ms 시간 초과 {kind_stats['timeouts']}번, "
+                f"학습된 제한 시간 {kind_stats['timeout_seconds']:.1f}초"
+            )
+        print(f"  전환 확인 신호: {stats['signals']}")
+
+    fixture_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Selenium 결과 행 추출 벤치마크: 요소별 WebDriver 호출(extract_rows_by_element) vs execute_script 한 번(extract_rows)
+
+benchmarks/fixtures/work24의 저장된 목록 페이지를 로컬 HTTP 서버로 제공하고 페이지마다 두 방식으로 행을 읽어
+WebDriver 명령 수(왕복 수)와 시간을 비교하고, extract_rows 결과를 o_sup의 행 처리/전처리에 넣어 expected_{prefix}.json과 비교
+기본은 Chrome 없이 WebDriver 스텁(webdriver_stub.py, 명령마다 --command-latency초 지연)을 사용하며
+--chrome이면 로컬 헤드리스 Chrome, --remote면 Selenium Grid 등 원격 WebDriver에서 측정
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_row_extraction.py
+    python benchmarks/bench_row_extraction.py --command-latency 0.02 --repeat 3
+    python benchmarks/bench_row_extraction.py --chrome
+    python benchmarks/bench_row_extraction.py --remote http://127.0.0.1:4444/wd/hub --prefix disabled
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+import webdriver_stub
+from bench_work24_crawler import FIXTURE_DIR, fixture_pages, start_fixture_server, without_host
+from driver_pool import create_chrome_driver, default_chrome_options
+from o_sup import _row_job_data, preprocess_job_data
+from work24_crawler import extract_rows, extract_rows_by_element, page_url
+
+
+class CommandCounter:
+    """driver.command_executor.execute를 감싸 WebDriver 명령(HTTP 왕복) 수를 셈"""
+
+    def __init__(self, driver):
+        self.count = 0
+        executor = driver.command_executor
+        execute = executor.execute
+
+        def counted(command, params):
+            self.count += 1
+            return execute(command, params)
+
+        executor.execute = counted
+
+
+def open_driver(args):
+    if args.chrome:
+        return create_chrome_driver(), None
+    if args.remote:
+        return webdriver.Remote(command_executor=args.remote, options=default_chrome_options()), None
+    server = webdriver_stub.make_server(port=0, command_latency=args.command_latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    return webdriver.Remote(command_executor=url, options=default_chrome_options()), server
+
+
+def measure(counter, fn, repeat):
+    """(평균 시간(초), 1회당 명령 수, 마지막 결과)"""
+    timings = []
+    result = None
+    started_count = counter.count
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.mean(timings), (counter.count - started_count) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Selenium 결과 행 추출 벤치마크 (저장된 HTML 사용)")
+    parser.add_argument("--prefix", default="senior", help="fixture 파일 접두사 ({prefix}_page{N}.html)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--command-latency", type=float, default=0.003, help="스텁 사용 시 WebDriver 명령당 지연(초)")
+    parser.add_argument("--chrome", action="store_true", help="로컬 헤드리스 Chrome 사용")
+    parser.add_argument("--remote", help="원격 WebDriver 주소")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    pages = fixture_pages(args.prefix)
+    if not pages:
+        sys.exit(f"{FIXTURE_DIR}에 {args.prefix}_page1.html이 없습니다.")
+    fixture_server, target_url = start_fixture_server(pages, 0)
+    driver, stub_server = open_driver(args)
+    counter = CommandCounter(driver)
+    backend = "Chrome" if args.chrome else args.remote or f"WebDriver 스텁 (명령당 {args.command_latency * 1000:g}ms)"
+    print(f"fixture {args.prefix}: 페이지 {len(pages)}개, {backend}")
+    print(f"\n{'page':>4} {'rows':>5} {'by element':>16} {'bulk':>16} {'saved':>9} {'same':>5}")
+
+    all_rows = []
+    totals = {"element": [0.0, 0.0], "bulk": [0.0, 0.0]}
+    try:
+        for page_index in range(1, len(pages) + 1):
+            driver.get(page_url(target_url, page_index))
+            table = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CLASS_NAME, "box_table.type_pd24"))
+            )
+            element_seconds, element_commands, element_rows = measure(
+                counter, lambda: extract_rows_by_element(table), args.repeat
+            )
+            bulk_seconds, bulk_commands, bulk_rows = measure(
+                counter, lambda: extract_rows(driver, table), args.repeat
+            )
+            totals["element"][0] += element_seconds
+            totals["element"][1] += element_commands
+            totals["bulk"][0] += bulk_seconds
+            totals["bulk"][1] += bulk_commands
+            all_rows.extend(bulk_rows)
+            print(
+                f"{page_index:>4} {len(bulk_rows):>5} "
+                f"{element_commands:>5.0f}회 {element_seconds * 1000:>7.1f}ms "
+                f"{bulk_commands:>5.0f}회 {bulk_seconds * 1000:>7.1f}ms "
+                f"{(element_seconds - bulk_seconds) * 1000:>7.1f}ms {'예' if bulk_rows == element_rows else '아니오':>5}"
+            )
+    finally:
+        driver.quit()
+        fixture_server.shutdown()
+        if stub_server is not None:
+            stub_server.shutdown()
+
+    count = len(pages)
+    print(
+        f"\n페이지당 평균: 요소별 {totals['element'][1] / count:.0f}회 {totals['element'][0] / count * 1000:.1f}ms → "
+        f"한 번에 {totals['bulk'][1] / count:.0f}회 {totals['bulk'][0] / count * 1000:.1f}ms"
+    )
+
+    expected_path = os.path.join(FIXTURE_DIR, f"expected_{args.prefix}.json")
+    if os.path.exists(expected_path):
+        jobs = [_row_job_data(row) for row in all_rows]
+        jobs = [{**job, "data": preprocess_job_data(job["data"])} for job in jobs if job]
+        with open(expected_path, encoding="utf-8") as f:
+            expected = json.load(f)
+        print(f"expected_{args.prefix}.json과 비교: {'일치' if without_host(jobs) == expected else '불일치'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+요약 파이프라인 벤치마크: 로컬 OpenAI 호환 스텁 서버(llm_stub.py)를 띄워 OpenAI 비용과 네트워크 없이
+preprocess_payload, postprocess_summary, summarize, summarize_multiple_videos의 단계별 시간과 메모리,
+동시 요청 수별 처리량을 측정
+
+자막은 --transcripts 디렉터리의 녹화된 자막(JSON: 세그먼트 텍스트 목록)을 쓰고, 없으면 합성 자동 자막을 사용
+녹화: python benchmarks/bench_summary.py --record VIDEO_ID1 VIDEO_ID2 --transcripts recorded
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_summary.py
+    python benchmarks/bench_summary.py --transcripts recorded --concurrency 1 4 16 --requests 32
+    python benchmarks/bench_summary.py --latency 0.5 --tokens-per-second 60 --error-rate 0.05
+    python benchmarks/bench_summary.py --stub-url http://127.0.0.1:8001/v1   # 이미 실행 중인 스텁 사용
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_transcript_pipeline import make_auto_captions
+from llm_stub import COMPARISON_HTML, SUMMARY_HTML
+from llm_client import LLMClient
+from summary_cache import SummaryCache
+from summary_service import SummaryService
+from token_budget import load_token_counter
+
+STUB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "llm_stub.py")
+
+
+def record_transcripts(video_ids, directory):
+    """YouTube 자막 세그먼트를 JSON 파일로 저장 (벤치마크 입력 고정용)"""
+    from youtube_service import YouTubeService
+
+    os.makedirs(directory, exist_ok=True)
+    youtube_service = YouTubeService(api_key=None)
+    for video_id in video_ids:
+        segments = youtube_service.get_transcript_segments(video_id)
+        path = os.path.join(directory, f"{video_id}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(list(segments), f, ensure_ascii=False)
+        print(f"{video_id}: 세그먼트 {len(segments)}개 → {path}")
+
+
+def load_transcripts(directory, hours, seed):
+    """녹화된 자막 (이름, 세그먼트 목록), 디렉터리가 없으면 hours 길이의 합성 자막"""
+    if directory:
+        transcripts = []
+        for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+            with open(path, encoding="utf-8") as f:
+                segments = json.load(f)
+            segments = [segment["text"] if isinstance(segment, dict) else segment for segment in segments]
+            transcripts.append((os.path.splitext(os.path.basename(path))[0], segments))
+        if transcripts:
+            return transcripts
+        print(f"{directory}에 녹화된 자막이 없어 합성 자막을 사용합니다.")
+    return [(f"synthetic-{h:g}h", list(make_auto_captions(h, seed + index))) for index, h in enumerate(hours)]
+
+
+def start_stub(args):
+    """스텁 서버를 별도 프로세스로 실행하고 (프로세스, api_base) 반환 (메모리 측정에 섞이지 않도록)"""
+    process = subprocess.Popen(
+        [
+            sys.executable, STUB_PATH, "--port", "0",
+            "--latency", str(args.latency),
+            "--tokens-per-second", str(args.tokens_per_second),
+            "--error-rate", str(args.error_rate),
+            "--seed", str(args.seed),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stdout.readline().strip()
+    return process, line.split(": ", 1)[1]
+
+
+def stub_stats(api_base, reset=False):
+    try:
+        url = api_base.rsplit("/v1", 1)[0] + "/stats" + ("?reset" if reset else "")
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return json.loads(response.read())
+    except Exception:
+        return None
+
+
+def measure(fn, repeat=1):
+    """실행 시간 목록(초), tracemalloc 기준 최대 추가 메모리(바이트), 마지막 결과"""
+    timings = []
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timings, peak - baseline, result
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def print_stage(stage, timings, peak):
+    print(
+        f"{stage:<44} {len(timings):>5} {statistics.mean(timings) * 1000:>10.2f} "
+        f"{percentile(timings, 0.95) * 1000:>10.2f} {peak / 1024:>10.1f}"
+    )
+
+
+def make_service(args, api_base, counter, concurrency):
+    llm_client = LLMClient(
+        api_key="stub",
+        api_base=api_base,
+        model=SummaryService.MODEL,
+        token_counter=counter,
+        initial_concurrency=concurrency,
+        max_concurrency=max(concurrency, 16),
+        backoff_base=0.1,
+    )
+    # 요약 캐시를 비워 두어(max_bytes=0) 매 호출이 스텁까지 가도록 함
+    return SummaryService(
+        "stub",
+        summary_cache=SummaryCache(max_bytes=0),
+        token_counter=counter,
+        llm_client=llm_client,
+        extractive_mode=args.extractive,
+    )
+
+
+def bench_stages(args, service, transcripts):
+    print(f"\n{'stage':<44} {'calls':>5} {'mean(ms)':>10} {'p95(ms)':>10} {'peak(KiB)':>10}")
+    for name, segments in transcripts:
+        timings, peak, _ = measure(lambda: service.preprocess_payload(segments), args.repeat)
+        print_stage(f"preprocess_payload [{name}]", timings, peak)
+
+    for name, html in (("summary", SUMMARY_HTML), ("comparison", COMPARISON_HTML)):
+        timings, peak, _ = measure(lambda: service.postprocess_summary(html), args.repeat)
+        print_stage(f"postprocess_summary [{name}]", timings, peak)
+
+    for name, segments in transcripts:
+        context = {"title": name, "keyword": "취업"}
+        timings, peak, _ = measure(lambda: service.summarize(segments, context), args.llm_repeat)
+        print_stage(f"summarize [{name}]", timings, peak)
+
+    video_data_list = [
+        {"transcript": segments, "video_info": {"title": name, "channel": "bench", "url": ""}}
+        for name, segments in transcripts
+    ]
+    timings, peak, _ = measure(
+        lambda: service.summarize_multiple_videos(video_data_list, "벤치마크"), args.llm_repeat
+    )
+    print_stage(f"summarize_multiple_videos [{len(video_data_list)}개]", timings, peak)
+
+    usage = service.llm_client.stats()["usage_by_endpoint"]
+    print("\nLLM 엔드포인트별 평균 지연 (스텁 응답 대기 포함)")
+    for endpoint, stats in usage.items():
+        print(
+            f"  {endpoint:<16} 요청 {stats['requests']:>4} 재시도 {stats['retries']:>3} 오류 {stats['errors']:>3} "
+            f"평균 {stats['latency_seconds'] / max(stats['requests'], 1) * 1000:>8.1f}ms"
+        )
+
+
+def bench_throughput(args, api_base, counter, transcripts):
+    print(f"\n{'concurrency':>11} {'requests':>8} {'req/s':>8} {'p50(ms)':>9} {'p95(ms)':>9} {'errors':>6} {'stub max':>8}")
+    # stub max: 이 단계에서 스텁 서버가 동시에 처리한 최대 요청 수 (map 단계 동시 호출 포함)
+    for concurrency in args.concurrency:
+        service = make_service(args, api_base, counter, concurrency)
+        stub_stats(api_base, reset=True)
+        jobs = [transcripts[index % len(transcripts)] for index in range(args.requests)]
+
+        def run(job):
+            name, segments = job
+            started = time.perf_counter()
+            try:
+                service.summarize(segments, {"title": name, "keyword": "취업"})
+                return time.perf_counter() - started, False
+            except Exception:
+                return time.perf_counter() - started, True
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(run, jobs))
+        elapsed = time.perf_counter() - started
+
+        service.llm_client.close()
+        latencies = [latency for latency, _ in results]
+        stats = stub_stats(api_base) or {}
+        print(
+            f"{concurrency:>11} {len(jobs):>8} {len(jobs) / elapsed:>8.2f} {percentile(latencies, 0.5) * 1000:>9.1f} "
+            f"{percentile(latencies, 0.95) * 1000:>9.1f} {sum(error for _, error in results):>6} "
+            f"{stats.get('max_in_flight', '-'):>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요약 파이프라인 벤치마크 (로컬 LLM 스텁 사용)")
+    parser.add_argument("--transcripts", help="녹화된 자막 JSON 디렉터리")
+    parser.add_argument("--record", nargs="*", help="자막을 녹화할 video_id (녹화 후 종료)")
+    parser.add_argument("--hours", type=float, nargs="*", default=[0.3, 1], help="합성 자막 길이(시간)")
+    parser.add_argument("--stub-url", help="이미 실행 중인 스텁/OpenAI 호환 서버 주소 (없으면 스텁을 실행)")
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--tokens-per-second", type=float, default=400.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--extractive", default="off", choices=["off", "on", "compare"])
+    parser.add_argument("--concurrency", type=int, nargs="*", default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=16, help="동시 요청 수 단계마다 보낼 요약 요청 수")
+    parser.add_argument("--repeat", type=int, default=5, help="로컬 단계 반복 횟수")
+    parser.add_argument("--llm-repeat", type=int, default=2, help="LLM을 거치는 단계 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.record:
+        record_transcripts(args.record, args.transcripts or "recorded")
+        return
+
+    counter = load_token_counter()
+    transcripts = load_transcripts(args.transcripts, args.hours, args.seed)
+    print(f"토큰 계산기: {counter.name}, 자막 {len(transcripts)}개, 추출 모드 {args.extractive}")
+
+    process = None
+    api_base = args.stub_url
+    if api_base is None:
+        process, api_base = start_stub(args)
+        print(
+            f"스텁 서버: {api_base} (지연 {args.latency}초, {args.tokens_per_second:g}토큰/초, "
+            f"오류율 {args.error_rate:.0%})"
+        )
+
+    try:
+        service = make_service(args, api_base, counter, 4)
+        bench_stages(args, service, transcripts)
+        service.llm_client.close()
+        bench_throughput(args, api_base, counter, transcripts)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
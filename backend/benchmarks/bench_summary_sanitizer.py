@@ -0,0 +1,113 @@
+"""
+요약 HTML 정제 벤치마크: 기존 BeautifulSoup + prettify 방식과 html_sanitizer의 한 번 훑기 방식 비교
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_summary_sanitizer.py
+    python benchmarks/bench_summary_sanitizer.py --sections 3 12 48 --repeat 20
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from html_sanitizer import ALLOWED_TAGS, sanitize
+from summary_service import INLINE_SUMMARY_CSS
+
+
+def legacy_postprocess(summary):
+    """summary_service에 있던 기존 후처리 (비교 기준, 인라인 CSS 포함)"""
+    summary = re.sub(r"```html|```", "", summary)
+    summary = re.sub(r"위의 HTML.*$", "", summary, flags=re.MULTILINE)
+    summary = re.sub(r"이 HTML.*$", "", summary, flags=re.MULTILINE)
+    summary = re.sub(r"요약된 내용.*$", "", summary, flags=re.MULTILINE)
+
+    soup = BeautifulSoup(summary, "html.parser")
+
+    seen_titles = set()
+    for section in soup.find_all(['section', 'div']):
+        title = section.find('h3')
+        if title:
+            title_text = title.get_text().strip()
+            if title_text in seen_titles:
+                section.decompose()
+            else:
+                seen_titles.add(title_text)
+
+    for tag in soup.find_all(True):
+        if tag.name not in ALLOWED_TAGS:
+            tag.unwrap()
+        else:
+            if tag.get('class'):
+                tag['class'] = [c for c in tag['class'] if c in ALLOWED_TAGS[tag.name]]
+
+    for video_title in soup.find_all('h4', class_='video-title'):
+        title_text = video_title.get_text().strip()
+        if re.match(r'비디오\s*\d+\s*제목', title_text):
+            video_title.string = "영상 제목 형식 오류"
+
+    final_html = INLINE_SUMMARY_CSS + str(soup.prettify())
+    return re.sub(r'\n\s*\n', '\n', final_html)
+
+
+def make_model_output(section_count, rng):
+    """모델이 생성한 것과 비슷한 요약 HTML (코드 펜스, 허용되지 않은 태그/속성, 중복 섹션 포함)"""
+    parts = ["```html\n<div class='summary-container' style='x'>"]
+    for index in range(section_count):
+        # 네 번째 섹션마다 앞 섹션 제목을 반복
+        title = f"섹션 {index - 1 if index % 4 == 3 else index}"
+        parts.append(
+            f"  <section class='summary-section'>\n    <h3 class='section-title'>{title}</h3>\n"
+            "    <div class='content-block'>\n"
+        )
+        for paragraph in ("main-point", "detail-point", "supporting-info"):
+            parts.append(
+                f"      <p class='{paragraph} extra'>취업 지원금은 <b>{rng.randint(1, 500)}만원</b>까지 "
+                f"<span>받을 수 있으며</span> 신청 기간은 {rng.randint(1, 12)}월입니다.</p>\n"
+            )
+        parts.append("    </div>\n  </section>\n")
+    parts.append("</div>\n```\n위의 HTML은 요약입니다.")
+    return "".join(parts)
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요약 HTML 정제 벤치마크")
+    parser.add_argument("--sections", type=int, nargs="*", default=[3, 12, 48])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'sections':>8} {'input(B)':>9} {'legacy(ms)':>11} {'fast(ms)':>9} {'speedup':>8} "
+        f"{'legacy out(B)':>14} {'fast out(B)':>12} {'inline out(B)':>14}"
+    )
+    for section_count in args.sections:
+        summary = make_model_output(section_count, rng)
+        legacy_out = legacy_postprocess(summary)
+        fast_out = sanitize(summary)[0]
+
+        legacy_time = best_of(args.repeat, lambda: legacy_postprocess(summary))
+        fast_time = best_of(args.repeat, lambda: sanitize(summary))
+        print(
+            f"{section_count:>8} {len(summary.encode()):>9} {legacy_time * 1000:>11.3f} {fast_time * 1000:>9.3f} "
+            f"{legacy_time / fast_time:>7.1f}x {len(legacy_out.encode()):>14} {len(fast_out.encode()):>12} "
+            f"{len((INLINE_SUMMARY_CSS + fast_out).encode()):>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
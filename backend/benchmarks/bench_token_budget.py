@@ -0,0 +1,129 @@
+"""
+자막 담기 벤치마크: 기존 글자 수 자르기와 token_budget의 토큰 예산 문장 담기 비교
+
+합성 자막의 모든 문장에는 고유한 "사실 번호"가 들어 있어, 요청에 온전히 담긴 문장 수로
+보존된 정보량을, 중간에 잘린 문장 수로 손상된 정보량을 셈
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_token_budget.py
+    python benchmarks/bench_token_budget.py --comparison-budget 3000 --summary-budget 2000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from token_budget import load_token_counter, pack_sentences, pack_texts
+
+SUBJECTS = ["이력서", "자기소개서", "면접", "직무 교육", "취업 지원금", "근로 계약", "재택 근무", "경력 전환"]
+PREDICATES = [
+    "준비할 때 가장 먼저 확인해야 합니다",
+    "신청 기간을 놓치지 않는 것이 중요합니다",
+    "지원 자격에 따라 달라집니다",
+    "담당자에게 미리 문의하면 도움이 됩니다",
+    "작년보다 지원 규모가 늘었습니다",
+]
+FACT_PATTERN = re.compile(r"사실(\d+)번")
+
+
+def make_transcript(sentence_count, rng, start_fact):
+    """문장마다 고유한 사실 번호가 들어간 합성 한국어 자막"""
+    sentences = []
+    for offset in range(sentence_count):
+        fact = start_fact + offset
+        sentences.append(
+            f"사실{fact}번, {rng.choice(SUBJECTS)}은 {rng.randint(1, 99)}개월 기준으로 {rng.choice(PREDICATES)}."
+        )
+    return " ".join(sentences)
+
+
+def fact_stats(original, packed):
+    """온전히 담긴 사실 수와 중간에 잘린 문장 수"""
+    original_sentences = {FACT_PATTERN.search(s).group(1): s for s in original.split(". ") if FACT_PATTERN.search(s)}
+    kept = 0
+    broken = 0
+    for sentence in packed.split(". "):
+        match = FACT_PATTERN.search(sentence)
+        if not match:
+            if sentence.strip():
+                broken += 1
+            continue
+        if original_sentences.get(match.group(1), "").rstrip(".") == sentence.rstrip("."):
+            kept += 1
+        else:
+            broken += 1
+    return kept, broken
+
+
+def legacy_preprocess(payload, max_length):
+    """summary_service에 있던 기존 글자 수 기준 전처리 (비교 기준)"""
+    cleaned = re.sub(r'\s+', ' ', payload)
+    cleaned = re.sub(r'[^\w\s.,!?()\'\"가-힣]', '', cleaned)
+    sentences = re.split(r'(?<=[.!?]) +', cleaned)
+    return " ".join(sentences[:max_length // 15]) if len(cleaned) > max_length else cleaned
+
+
+def print_row(label, counter, budget, originals, packed_list):
+    tokens = [counter.count(text) for text in packed_list]
+    total_tokens = sum(tokens)
+    kept = 0
+    broken = 0
+    total_facts = 0
+    for original, packed in zip(originals, packed_list):
+        video_kept, video_broken = fact_stats(original, packed)
+        kept += video_kept
+        broken += video_broken
+        total_facts += len(FACT_PATTERN.findall(original))
+    status = "초과" if total_tokens > budget else "ok"
+    print(
+        f"{label:<28} {total_tokens:>8} {budget:>8} {status:>6} {total_tokens / budget:>7.0%} "
+        f"{kept:>6}/{total_facts:<6} {broken:>6} {kept / max(total_tokens, 1) * 1000:>10.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자막 토큰 예산 담기 벤치마크")
+    parser.add_argument("--summary-budget", type=int, default=2000)
+    parser.add_argument("--comparison-budget", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    counter = load_token_counter()
+    rng = random.Random(args.seed)
+    print(f"토큰 계산기: {counter.name}")
+    print(
+        f"{'방식':<28} {'tokens':>8} {'budget':>8} {'상태':>6} {'사용률':>7} "
+        f"{'보존 사실':>13} {'잘린문장':>6} {'사실/1k토큰':>10}"
+    )
+
+    # 단일 요약: 짧은/중간/긴 자막 하나씩
+    for sentence_count in (20, 80, 600):
+        transcript = make_transcript(sentence_count, rng, 0)
+        print(f"-- 단일 요약, 문장 {sentence_count}개 ({len(transcript)}자)")
+        # 기존: 1200자를 넘으면 앞 80문장만 남기고 1200자씩 순서대로 요청
+        legacy = legacy_preprocess(transcript, 1200)
+        legacy_chunks = [legacy[i:i + 1200] for i in range(0, len(legacy), 1200)]
+        print_row(f"글자 자르기 (요청 {len(legacy_chunks)}회)", counter, args.summary_budget * len(legacy_chunks),
+                  [transcript], [" ".join(legacy_chunks)])
+        print_row("토큰 예산 문장 담기 (요청 1회)", counter, args.summary_budget,
+                  [transcript], [pack_sentences(transcript, args.summary_budget, counter)])
+
+    # 비교 요약: 길이가 크게 다른 자막 여러 개
+    for sentence_counts in ((10, 40, 300), (200, 200, 200, 200), (5, 8, 12)):
+        transcripts = []
+        start_fact = 0
+        for sentence_count in sentence_counts:
+            transcripts.append(make_transcript(sentence_count, rng, start_fact))
+            start_fact += sentence_count
+        print(f"-- 비교 요약, 비디오별 문장 수 {sentence_counts}")
+        legacy = [legacy_preprocess(transcript, 1500)[:1500] for transcript in transcripts]
+        print_row("글자 자르기 (비디오당 1500자)", counter, args.comparison_budget, transcripts, legacy)
+        print_row("토큰 예산 길이 비례 배분", counter, args.comparison_budget, transcripts,
+                  pack_texts(transcripts, args.comparison_budget, counter))
+
+
+if __name__ == "__main__":
+    main()
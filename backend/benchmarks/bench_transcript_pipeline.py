@@ -0,0 +1,117 @@
+"""
+자막 정리 벤치마크: 기존 전체 문자열 방식(get_transcript + preprocess_payload)과
+transcript_pipeline.normalize_transcript의 세그먼트 스트리밍 방식 비교 (CPU 시간, 최대 메모리)
+
+여러 시간 길이의 자동 생성 자막처럼 앞 세그먼트의 끝부분이 다음 세그먼트 앞에 반복되는 합성 자막을 사용
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_transcript_pipeline.py
+    python benchmarks/bench_transcript_pipeline.py --hours 1 3 10 --repeat 3
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from token_budget import load_token_counter
+from transcript_pipeline import normalize_transcript
+
+WORDS = [
+    "오늘은", "이력서", "작성법을", "알아보겠습니다", "면접에서", "가장", "중요한", "것은", "자기소개", "경력",
+    "지원", "동기", "회사", "직무", "준비", "그리고", "이렇게", "하시면", "됩니다", "여러분",
+]
+SEGMENTS_PER_HOUR = 1800  # 자동 자막은 약 2초마다 한 줄
+
+
+def make_auto_captions(hours, seed):
+    """롤링 자동 자막: 각 줄은 직전 줄의 끝 3단어로 시작하고, 가끔 효과음 표기와 같은 줄 반복이 섞임"""
+    rng = random.Random(seed)
+    segments = []
+    previous = [rng.choice(WORDS) for _ in range(6)]
+    for _ in range(int(hours * SEGMENTS_PER_HOUR)):
+        roll = rng.random()
+        if roll < 0.03:
+            segments.append("[음악]")
+            continue
+        if roll < 0.10:
+            segments.append(" ".join(previous))
+            continue
+        words = previous[-3:] + [rng.choice(WORDS) for _ in range(rng.randint(3, 6))]
+        if rng.random() < 0.2:
+            words[-1] += "."
+        segments.append(" ".join(words))
+        previous = words
+    return tuple(segments)
+
+
+def legacy_preprocess(segments, max_length=1200):
+    """기존 방식: 세그먼트를 전부 이어 붙인 뒤 전체 문자열에 정규식을 여러 번 적용하고 앞부분만 남김"""
+    payload = " ".join(segments)
+    cleaned = re.sub(r'\s+', ' ', payload)
+    cleaned = re.sub(r'[^\w\s.,!?()\'\"가-힣]', '', cleaned)
+    sentences = re.split(r'(?<=[.!?]) +', cleaned)
+    return " ".join(sentences[:max_length // 15]) if len(cleaned) > max_length else cleaned
+
+
+def measure(repeat, fn):
+    """가장 빠른 실행 시간(초)과 tracemalloc 기준 최대 추가 메모리(바이트), 결과"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자막 정리 파이프라인 벤치마크")
+    parser.add_argument("--hours", type=float, nargs="*", default=[1, 3, 10])
+    parser.add_argument("--summary-budget", type=int, default=2000)
+    parser.add_argument("--map-reduce-budget", type=int, default=2500 * 24)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    counter = load_token_counter()
+    print(f"토큰 계산기: {counter.name}")
+    print(
+        f"{'hours':>6} {'segments':>9} {'방식':<26} {'time(ms)':>10} {'peak(KiB)':>10} "
+        f"{'out chars':>10} {'out tokens':>10}"
+    )
+
+    for hours in args.hours:
+        segments = make_auto_captions(hours, args.seed)
+        cases = [
+            ("기존 전체 문자열", lambda: legacy_preprocess(segments)),
+            (f"파이프라인 (예산 {args.summary_budget})",
+             lambda: normalize_transcript(segments, args.summary_budget, counter)),
+            (f"파이프라인 (예산 {args.map_reduce_budget})",
+             lambda: normalize_transcript(segments, args.map_reduce_budget, counter)),
+            ("파이프라인 (예산 없음)", lambda: normalize_transcript(segments)),
+        ]
+        for label, fn in cases:
+            elapsed, peak, result = measure(args.repeat, fn)
+            print(
+                f"{hours:>6g} {len(segments):>9} {label:<26} {elapsed * 1000:>10.2f} {peak / 1024:>10.1f} "
+                f"{len(result):>10} {counter.count(result):>10}"
+            )
+
+    # 반복 제거 효과: 예산 없이 전체를 정리했을 때 기존 방식 대비 남은 단어 비율
+    segments = make_auto_captions(1, args.seed)
+    joined_words = len(" ".join(segments).split())
+    normalized_words = len(normalize_transcript(segments).split())
+    print(f"\n반복 제거 후 남은 단어: {normalized_words}/{joined_words} ({normalized_words / joined_words:.0%})")
+
+
+if __name__ == "__main__":
+    main()
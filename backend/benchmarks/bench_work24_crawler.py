@@ -0,0 +1,195 @@
+"""
+고용24 채용 목록 HTTP 크롤러 벤치마크/오프라인 검증
+
+benchmarks/fixtures/work24의 저장된 목록 페이지 HTML을 로컬 HTTP 서버로 제공하고
+(pageIndex=N → {prefix}_page{N}.html, 마지막 페이지 이후는 work24처럼 마지막 페이지를 반복)
+Work24Crawler로 크롤링한 시간/메모리(동시 요청 수별)와 preprocess_job_data 결과를 expected_{prefix}.json과 비교
+--selenium이면 같은 페이지를 기존 Selenium 크롤러로도 크롤링해 결과가 같은지 확인 (Chrome 필요)
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/bench_work24_crawler.py
+    python benchmarks/bench_work24_crawler.py --prefix disabled --latency 0.15 --selenium
+    python benchmarks/bench_work24_crawler.py --workers 1 3 10 --rate 4 --burst 4
+    python benchmarks/bench_work24_crawler.py --record "https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do?srcKeyword=경비&pageIndex=1" --prefix live --pages 3
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_client import HttpClient
+from o_sup import _scrape_data_senior_selenium, preprocess_job_data
+from crawl_scheduler import CrawlScheduler, HostRateLimiter
+from work24_crawler import Work24CrawlError, Work24Crawler, page_url
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "work24")
+LIST_PATH = "/wk/a/b/1200/retriveDtlEmpSrchList.do"
+
+
+def fixture_pages(prefix):
+    pages = []
+    while os.path.exists(os.path.join(FIXTURE_DIR, f"{prefix}_page{len(pages) + 1}.html")):
+        with open(os.path.join(FIXTURE_DIR, f"{prefix}_page{len(pages) + 1}.html"), "rb") as f:
+            pages.append(f.read())
+    return pages
+
+
+def start_fixture_server(pages, latency):
+    """pageIndex별 저장된 HTML을 돌려주는 로컬 서버 (latency초 지연으로 네트워크 왕복을 흉내)"""
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            return
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path != LIST_PATH:
+                self.send_error(404)
+                return
+            page_index = int(parse_qs(parts.query).get("pageIndex", ["1"])[0])
+            time.sleep(latency)
+            body = pages[min(page_index, len(pages)) - 1]
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}{LIST_PATH}?srcKeyword=bench&pageIndex=1"
+
+
+def processed(rows):
+    return [{**row, "data": preprocess_job_data(row["data"])} for row in rows]
+
+
+def without_host(jobs):
+    # 로컬 서버 주소는 실행마다 달라지므로 링크는 경로만 비교
+    return [
+        {**job, "second_link": urlsplit(job["second_link"])._replace(scheme="", netloc="").geturl()}
+        for job in jobs
+    ]
+
+
+def record_pages(url, prefix, pages):
+    """실제 목록 페이지를 fixtures에 저장 (expected 파일은 --write-expected로 따로 생성)"""
+    http_client = HttpClient()
+    crawler = Work24Crawler(http_client)
+    for page_index in range(1, pages + 1):
+        html = crawler.fetch_page(page_url(url, page_index))
+        path = os.path.join(FIXTURE_DIR, f"{prefix}_page{page_index}.html")
+        with open(path, "wb") as f:
+            f.write(html)
+        print(f"{path} ({len(html)} bytes)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="고용24 HTTP 크롤러 벤치마크 (저장된 HTML 사용)")
+    parser.add_argument("--prefix", default="senior", help="fixture 파일 접두사 ({prefix}_page{N}.html)")
+    parser.add_argument("--max-pages", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.08, help="페이지 응답 지연(초)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="*", default=[1, 5], help="동시에 요청할 페이지 수")
+    parser.add_argument("--rate", type=float, default=20.0, help="호스트별 초당 요청 수 제한 (0이면 제한 없음)")
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--verbose", action="store_true", help="크롤러 페이지별 로그 출력")
+    parser.add_argument("--selenium", action="store_true", help="기존 Selenium 크롤러와 결과/시간 비교")
+    parser.add_argument("--write-expected", action="store_true", help="현재 결과로 expected_{prefix}.json 갱신")
+    parser.add_argument("--record", help="실제 목록 URL을 fixture로 저장 (저장 후 종료)")
+    parser.add_argument("--pages", type=int, default=3, help="--record로 저장할 페이지 수")
+    args = parser.parse_args()
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    if args.record:
+        record_pages(args.record, args.prefix, args.pages)
+        return
+
+    pages = fixture_pages(args.prefix)
+    if not pages:
+        sys.exit(f"{FIXTURE_DIR}에 {args.prefix}_page1.html이 없습니다.")
+    server, target_url = start_fixture_server(pages, args.latency)
+    http_client = HttpClient(max_retries=0)
+    print(
+        f"fixture {args.prefix}: 페이지 {len(pages)}개, 지연 {args.latency}초/페이지, "
+        f"속도 제한 {args.rate:g}회/초 (버스트 {args.burst})"
+    )
+
+    results = []
+    for workers in args.workers:
+        limiter = HostRateLimiter(rate=args.rate, burst=args.burst)
+        crawler = Work24Crawler(http_client, scheduler=CrawlScheduler(max_workers=workers, limiter=limiter))
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            result = processed(crawler.crawl(target_url, max_pages=args.max_pages))
+            timings.append(time.perf_counter() - started)
+        stats = crawler.stats()["scheduler"]
+
+        # 메모리는 시간 측정과 따로 한 번 더 크롤링해서 측정 (tracemalloc이 실행을 느리게 하므로)
+        tracemalloc.start()
+        processed(crawler.crawl(target_url, max_pages=args.max_pages))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results.append(result)
+        print(
+            f"HTTP 크롤러 (동시 {workers}): 행 {len(result)}개, "
+            f"요청 페이지 {stats['pages_requested'] / stats['crawls']:.1f}개/회, "
+            f"평균 {statistics.mean(timings) * 1000:.1f}ms (최소 {min(timings) * 1000:.1f}ms), "
+            f"최대 추가 메모리 {peak / 1024:.0f}KiB"
+        )
+    if any(other != result for other in results):
+        print("동시 요청 수에 따라 결과가 다릅니다.")
+
+    expected_path = os.path.join(FIXTURE_DIR, f"expected_{args.prefix}.json")
+    if args.write_expected:
+        with open(expected_path, "w", encoding="utf-8") as f:
+            json.dump(without_host(result), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"{expected_path} 갱신")
+    elif os.path.exists(expected_path):
+        with open(expected_path, encoding="utf-8") as f:
+            expected = json.load(f)
+        matched = without_host(result) == expected
+        print(f"expected_{args.prefix}.json과 비교: {'일치' if matched else '불일치'}")
+
+    blocked_server, blocked_url = start_fixture_server(
+        [open(os.path.join(FIXTURE_DIR, "blocked.html"), "rb").read()], 0
+    )
+    try:
+        crawler.crawl(blocked_url)
+        print("결과 표가 없는 페이지: 오류가 발생하지 않음 (Selenium 대체가 동작하지 않음)")
+    except Work24CrawlError as e:
+        print(f"결과 표가 없는 페이지: Work24CrawlError → Selenium으로 대체 ({e})")
+    blocked_server.shutdown()
+
+    if args.selenium:
+        started = time.perf_counter()
+        selenium_result = _scrape_data_senior_selenium(target_url=target_url, max_pages=args.max_pages)
+        elapsed = time.perf_counter() - started
+        http_result = processed(crawler.crawl(target_url, max_pages=args.max_pages))
+        print(
+            f"Selenium 크롤러: 행 {len(selenium_result)}개, {elapsed * 1000:.0f}ms, "
+            f"HTTP 결과와 {'일치' if selenium_result == http_result else '불일치'}"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
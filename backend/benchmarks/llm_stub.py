@@ -0,0 +1,261 @@
+"""
+OpenAI 호환 로컬 스텁 서버 (POST /v1/chat/completions, 스트리밍 포함)
+
+요청 프롬프트 형식에 맞춘 고정 HTML(단일 요약/비교 요약)이나 map 단계 메모를 돌려주며,
+첫 토큰 지연, 초당 토큰 수, 오류율(429/500)을 설정할 수 있어 OpenAI 비용과 네트워크 없이 요약 파이프라인을 측정 가능
+GET /stats로 받은 요청 수, 오류 수, 최대 동시 요청 수를 확인 (GET /stats?reset이면 최대 동시 요청 수를 초기화)
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/llm_stub.py --port 8001 --latency 0.3 --tokens-per-second 80 --error-rate 0.05
+    OPENAI_API_BASE=http://127.0.0.1:8001/v1 uvicorn main:app
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from token_budget import HeuristicTokenCounter
+
+SUMMARY_HTML = (
+    "<div class='summary-container'>\n"
+    + "".join(
+        "  <section class='summary-section'>\n"
+        f"    <h3 class='section-title'>{title}</h3>\n"
+        "    <div class='content-block'>\n"
+        f"      <p class='main-point'>{title}에 대한 핵심 주제와 배경입니다. 지원 자격은 <b>만 60세 이상</b>이며 "
+        "근무 시간은 주 5일 기준입니다.</p>\n"
+        "      <p class='detail-point'>구체적인 상황 설명입니다. 채용 공고는 고용센터와 온라인 채용 사이트에서 "
+        "확인할 수 있으며 서류 준비에 약 2주가 걸립니다.</p>\n"
+        "      <p class='supporting-info'>관련된 맥락과 추가 정보입니다. 교육 과정을 수료하면 "
+        "<b>취업 지원금</b>을 받을 수 있습니다.</p>\n"
+        "    </div>\n"
+        "  </section>\n"
+        for title in ("주요 맥락과 배경", "핵심 내용", "결론")
+    )
+    + "</div>"
+)
+
+COMPARISON_HTML = (
+    "<div class='comparison-container'>\n"
+    "  <section class='common-section'>\n"
+    "    <h3 class='section-title'>공통된 정보</h3>\n"
+    "    <div class='content-block'>\n"
+    "      <p class='key-point'>모든 영상에서 자격증 준비 기간을 <b>3개월</b> 정도로 안내합니다.</p>\n"
+    "      <p class='key-point'>현장 경험과 체력 관리가 중요하다고 강조합니다.</p>\n"
+    "    </div>\n"
+    "  </section>\n"
+    "  <section class='unique-section'>\n"
+    "    <h3 class='section-title'>고유한 관점</h3>\n"
+    "    <div class='content-block'>\n"
+    "      <div class='video-perspective'>\n"
+    "        <h4 class='video-title'>현직자 인터뷰</h4>\n"
+    "        <p class='unique-point'>야간 근무의 장단점을 실제 급여 명세와 함께 설명합니다.</p>\n"
+    "      </div>\n"
+    "    </div>\n"
+    "  </section>\n"
+    "  <section class='conclusion-section'>\n"
+    "    <h3 class='section-title'>종합 분석</h3>\n"
+    "    <div class='content-block'>\n"
+    "      <p class='conclusion-point'>자격 요건과 근무 조건을 함께 비교해 보는 것이 좋습니다.</p>\n"
+    "    </div>\n"
+    "  </section>\n"
+    "</div>"
+)
+
+MAP_NOTES = (
+    "- 지원 자격과 필요한 서류를 설명함\n"
+    "- 근무 시간과 급여 수준(<b>월 200만원</b> 내외)을 언급함\n"
+    "- 교육 과정과 자격증 취득 방법을 소개함"
+)
+
+STREAM_PIECE_CHARS = 4  # 스트리밍 청크 하나에 담는 글자 수 (대략 토큰 하나)
+
+
+def canned_completion(messages):
+    """마지막 사용자 메시지가 요구하는 형식에 맞는 고정 응답"""
+    prompt = messages[-1]["content"] if messages else ""
+    if "comparison-container" in prompt:
+        return COMPARISON_HTML
+    if "summary-container" in prompt:
+        return SUMMARY_HTML
+    return MAP_NOTES
+
+
+class StubState:
+    """스텁 서버 설정과 통계 (여러 요청 스레드가 공유)"""
+
+    def __init__(self, latency=0.2, tokens_per_second=200.0, error_rate=0.0, seed=None):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.counter = HeuristicTokenCounter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def begin(self):
+        """요청 시작 기록, 오류로 응답할 차례이면 상태 코드 (오류의 대부분은 429, 일부는 500)"""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if self._random.random() >= self.error_rate:
+                return None
+            return 429 if self._random.random() < 0.8 else 500
+
+    def end(self, error):
+        with self._lock:
+            self.in_flight -= 1
+            if error:
+                self.errors += 1
+
+    def generation_delay(self, tokens):
+        return tokens / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def stats(self, reset=False):
+        """통계 반환 (reset이면 최대 동시 요청 수를 현재 값으로 되돌림)"""
+        with self._lock:
+            stats = {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+            }
+            if reset:
+                self.max_in_flight = self.in_flight
+            return stats
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state = None  # make_server에서 설정
+
+    def log_message(self, format, *args):
+        return
+
+    def do_GET(self):
+        path, _, query = self.path.partition("?")
+        if path.rstrip("/") == "/stats":
+            self._send_json(200, self.state.stats(reset="reset" in query))
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        error = self.state.begin()
+        try:
+            time.sleep(self.state.latency)
+            if error == 429:
+                self._send_json(429, {"error": {"message": "Rate limit reached (stub)", "type": "requests"}},
+                                {"Retry-After": "1"})
+                return
+            if error:
+                self._send_json(500, {"error": {"message": "Internal error (stub)", "type": "server_error"}})
+                return
+
+            messages = body.get("messages", [])
+            completion = canned_completion(messages)
+            prompt_tokens = sum(self.state.counter.count(message.get("content", "")) for message in messages)
+            completion_tokens = self.state.counter.count(completion)
+            if body.get("stream"):
+                self._send_stream(body.get("model", "gpt-3.5-turbo"), completion)
+            else:
+                time.sleep(self.state.generation_delay(completion_tokens))
+                self._send_json(200, {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "gpt-3.5-turbo"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": completion},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                })
+        finally:
+            self.state.end(error)
+
+    def _send_stream(self, model, completion):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        piece_delay = self.state.generation_delay(1)
+        for start in range(0, len(completion), STREAM_PIECE_CHARS):
+            self._write_chunk("data: " + json.dumps({
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": completion[start:start + STREAM_PIECE_CHARS]},
+                             "finish_reason": None}],
+            }, ensure_ascii=False) + "\n\n")
+            if piece_delay:
+                time.sleep(piece_delay)
+        self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status, payload, headers=None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def make_server(host="127.0.0.1", port=8001, **config):
+    """스텁 서버 생성 (port=0이면 빈 포트 사용, serve_forever로 실행)"""
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"state": StubState(**config)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 로컬 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.2, help="첫 토큰까지 지연(초)")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="생성 속도 (0이면 지연 없음)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429/500 오류로 응답할 비율")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = make_server(
+        args.host, args.port, latency=args.latency, tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate, seed=args.seed,
+    )
+    print(f"LLM 스텁 서버: http://{args.host}:{server.server_address[1]}/v1", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
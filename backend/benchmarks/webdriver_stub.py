@@ -0,0 +1,313 @@
+"""
+W3C WebDriver 프로토콜 일부를 흉내 내는 로컬 스텁 서버 (Chrome/chromedriver 없이 Selenium 크롤러 측정용)
+
+webdriver.Remote(command_executor=주소)로 접속하면 driver.get()한 페이지를 lxml로 파싱해 두고
+요소 찾기(css selector는 tag#id.class 형태만, tag name, xpath), 요소 텍스트(work24_crawler.visible_text), 창/쿠키 명령을 처리
+execute_script는 Selenium get_attribute/isDisplayed 아톰, "return 1", work24_crawler.EXTRACT_ROWS_SCRIPT,
+page_waits.PAGE_STATE_SCRIPT, 페이지 버튼(onclick="goPage(N)") 클릭만 파이썬으로 흉내 내고 나머지 스크립트는 null을 반환
+페이지 버튼을 클릭하면 --transition-latency초 동안 blockUI 오버레이를 띄운 뒤 pageIndex=N 페이지로 바꿔 AJAX 전환을 흉내 냄
+명령마다 --command-latency초를 지연시켜 드라이버-브라우저 왕복 비용을 흉내 냄 (GET /stats: 명령 종류별 횟수)
+
+사용 예 (backend 디렉터리에서):
+    python benchmarks/webdriver_stub.py --port 9515 --command-latency 0.003 --transition-latency 0.3
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+import urllib.request
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import lxml.html
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_waits import PAGE_STATE_SCRIPT
+from work24_crawler import EXTRACT_ROWS_SCRIPT, RESULT_TABLE_XPATH, page_url, visible_text
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+WINDOW_HANDLE = "stub-window"
+
+_SIMPLE_SELECTOR = re.compile(r"^([a-zA-Z][\w-]*|\*)?((?:[#.][\w-]+)*)$")
+_GO_PAGE = re.compile(r"goPage\((\d+)\)")
+_ACTIVE_CLASS = re.compile(r"(^|\s)(on|active|current)(\s|$)")
+
+
+class WebDriverError(Exception):
+    def __init__(self, status, error, message):
+        super().__init__(message)
+        self.status = status
+        self.error = error
+
+
+def css_to_xpath(selector):
+    """tag, #id, .class를 이어 붙인 단순 선택자만 지원 (그 외는 invalid selector)"""
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match:
+        raise WebDriverError(400, "invalid selector", f"지원하지 않는 선택자: {selector}")
+    conditions = []
+    for part in re.findall(r"[#.][\w-]+", match.group(2)):
+        if part[0] == "#":
+            conditions.append(f"@id='{part[1:]}'")
+        else:
+            conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {part[1:]} ')")
+    return f".//{match.group(1) or '*'}" + "".join(f"[{condition}]" for condition in conditions)
+
+
+def extract_rows(table):
+    """EXTRACT_ROWS_SCRIPT와 같은 결과를 lxml 요소로 만듦"""
+    return [
+        {
+            "id": row.get("id"),
+            "cells": [visible_text(cell) for cell in row.iter("td")],
+            "links": [a.get("href") for a in row.iter("a") if a.get("href") is not None],
+        }
+        for row in table.iter("tr")
+        if row.get("id")
+    ]
+
+
+class StubSession:
+    def __init__(self, transition_latency=0.0):
+        self.transition_latency = transition_latency
+        self.document = lxml.html.fromstring("<html><body></body></html>")
+        self.url = "about:blank"
+        self.elements = {}
+        self.marks = {}  # 결과 표 요소 -> PAGE_STATE_SCRIPT가 남긴 표시
+        self.loading = False
+        self.lock = threading.Lock()
+
+    def navigate(self, url):
+        if url == "about:blank":
+            html = b"<html><body></body></html>"
+        else:
+            with urllib.request.urlopen(url, timeout=10) as response:
+                html = response.read()
+        document = lxml.html.fromstring(html, base_url=url)
+        document.make_links_absolute(url, resolve_base_href=True)
+        with self.lock:
+            self.document = document
+            self.url = url
+            self.elements = {}
+            self.marks = {}
+
+    def reference(self, element):
+        element_id = str(uuid.uuid4())
+        with self.lock:
+            self.elements[element_id] = element
+        return {ELEMENT_KEY: element_id}
+
+    def element(self, element_id):
+        with self.lock:
+            element = self.elements.get(element_id)
+        if element is None:
+            raise WebDriverError(404, "stale element reference", f"element {element_id}")
+        return element
+
+    def find(self, root, using, value):
+        if using == "css selector":
+            return root.xpath(css_to_xpath(value))
+        if using == "tag name":
+            return root.xpath(f".//{value}")
+        if using == "xpath":
+            return root.xpath(value)
+        raise WebDriverError(400, "invalid argument", f"지원하지 않는 검색 방식: {using}")
+
+    def execute(self, script, args):
+        args = [self.element(arg[ELEMENT_KEY]) if isinstance(arg, dict) and ELEMENT_KEY in arg else arg for arg in args]
+        if script.startswith("/* getAttribute */"):
+            element, name = args
+            return element.get(name)
+        if script.startswith("/* isDisplayed */"):
+            return True
+        if script == EXTRACT_ROWS_SCRIPT:
+            return extract_rows(args[0])
+        if script == PAGE_STATE_SCRIPT:
+            return self.page_state(args[0], args[1])
+        if script.strip() == "return 1":
+            return 1
+        if script.strip() == "arguments[0].click();":
+            self.click(args[0])
+        return None
+
+    def click(self, element):
+        match = _GO_PAGE.search(element.get("onclick") or "")
+        if not match:
+            return
+        url = page_url(self.url, int(match.group(1)))
+
+        def transition():
+            time.sleep(self.transition_latency)
+            try:
+                self.navigate(url)
+            finally:
+                self.loading = False
+
+        self.loading = True
+        threading.Thread(target=transition, daemon=True).start()
+
+    def page_state(self, mark, pager_xpath):
+        with self.lock:
+            document = self.document
+            tables = document.xpath(RESULT_TABLE_XPATH)
+            table = tables[0] if tables else None
+            marker = self.marks.get(table) if table is not None else None
+            if table is not None and mark:
+                self.marks[table] = mark
+        first_rows = table.xpath(".//tr[@id]") if table is not None else []
+        pagers = document.xpath(pager_xpath)
+        active = None
+        if pagers:
+            active = next(
+                (
+                    element for element in pagers[0].iter("button", "a", "strong")
+                    if element.get("aria-current") or element.get("title") == "현재 페이지"
+                    or _ACTIVE_CLASS.search(element.get("class") or "")
+                ),
+                None,
+            )
+        return {
+            "table": self.reference(table) if table is not None else None,
+            "marker": marker,
+            "overlay": self.loading or bool(document.xpath("//div[contains(@class, 'blockOverlay')]")),
+            "first_row_id": first_rows[0].get("id") if first_rows else None,
+            "active_page": active.text_content().strip() if active is not None else None,
+        }
+
+
+class StubState:
+    def __init__(self, command_latency=0.003, transition_latency=0.3):
+        self.command_latency = command_latency
+        self.transition_latency = transition_latency
+        self.sessions = {}
+        self.lock = threading.Lock()
+        self.commands = Counter()
+
+    def record(self, command):
+        with self.lock:
+            self.commands[command] += 1
+
+    def stats(self, reset=False):
+        with self.lock:
+            stats = {"commands": sum(self.commands.values()), "by_command": dict(self.commands)}
+            if reset:
+                self.commands.clear()
+            return stats
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    state = None
+
+    def log_message(self, format, *args):
+        return
+
+    def do_GET(self):
+        if self.path.startswith("/stats"):
+            self._send_json(200, self.state.stats(reset="reset" in self.path))
+            return
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _handle(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        parts = self.path.strip("/").split("/")
+        try:
+            value = self._dispatch(method, parts, body)
+            self._send_json(200, {"value": value})
+        except WebDriverError as e:
+            self._send_json(e.status, {"value": {"error": e.error, "message": str(e), "stacktrace": ""}})
+
+    def _dispatch(self, method, parts, body):
+        if parts == ["session"] and method == "POST":
+            session_id = uuid.uuid4().hex
+            self.state.sessions[session_id] = StubSession(self.state.transition_latency)
+            return {"sessionId": session_id, "capabilities": {"browserName": "stub"}}
+        if len(parts) < 2 or parts[0] != "session" or parts[1] not in self.state.sessions:
+            raise WebDriverError(404, "invalid session id", "/".join(parts))
+
+        session = self.state.sessions[parts[1]]
+        self.state.record(self._command_name(method, parts[2:]))
+        time.sleep(self.state.command_latency)
+
+        rest = parts[2:]
+        if not rest and method == "DELETE":
+            del self.state.sessions[parts[1]]
+            return None
+        if rest == ["url"] and method == "POST":
+            session.navigate(body["url"])
+            return None
+        if rest in (["element"], ["elements"]) or (len(rest) == 3 and rest[0] == "element" and rest[2] in ("element", "elements")):
+            root = session.element(rest[1]) if len(rest) == 3 else session.document
+            found = session.find(root, body["using"], body["value"])
+            if rest[-1] == "elements":
+                return [session.reference(element) for element in found]
+            if not found:
+                raise WebDriverError(404, "no such element", f"{body['using']}={body['value']}")
+            return session.reference(found[0])
+        if len(rest) == 3 and rest[0] == "element" and rest[2] == "text":
+            return visible_text(session.element(rest[1]))
+        if len(rest) == 3 and rest[0] == "element" and rest[2] == "enabled":
+            return session.element(rest[1]).get("disabled") is None
+        if rest == ["execute", "sync"]:
+            return session.execute(body["script"], body.get("args", []))
+        if rest == ["window", "handles"]:
+            return [WINDOW_HANDLE]
+        if rest in (["window"], ["cookie"], ["timeouts"]):
+            return WINDOW_HANDLE if method == "GET" and rest == ["window"] else None
+        raise WebDriverError(404, "unknown command", f"{method} /{'/'.join(rest)}")
+
+    @staticmethod
+    def _command_name(method, rest):
+        # 요소 id를 빼고 명령 종류별로 집계 (예: GET element/text)
+        return f"{method} " + "/".join("{id}" if index == 1 and rest[0] == "element" else part
+                                        for index, part in enumerate(rest))
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_server(host="127.0.0.1", port=9515, **config):
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"state": StubState(**config)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebDriver 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9515)
+    parser.add_argument("--command-latency", type=float, default=0.003, help="명령마다 추가할 지연(초)")
+    parser.add_argument("--transition-latency", type=float, default=0.3, help="페이지 버튼 클릭 후 전환까지 걸리는 시간(초)")
+    args = parser.parse_args()
+
+    server = make_server(
+        args.host, args.port, command_latency=args.command_latency, transition_latency=args.transition_latency
+    )
+    print(f"WebDriver stub listening: http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    TTL과 바이트 크기 제한이 있는 스레드 안전 LRU 캐시
+    max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    """
+
+    def __init__(self, max_bytes, ttl, sizeof=len):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """키에 해당하는 값 반환 (없거나 만료되었으면 default)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None, size=None):
+        """값 저장 (ttl, size를 생략하면 기본 TTL과 sizeof 결과 사용)"""
+        size = self._sizeof(value) if size is None else size
+        if size > self.max_bytes:
+            return False
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+        return True
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class DiskCache:
+    """
+    SQLite 파일에 zlib으로 압축한 JSON 값을 저장하는 영구 캐시
+    재시작 후에도 유지되며, ttl이 지난 항목은 무시하고 max_bytes를 넘으면 오래 사용하지 않은 항목부터 제거
+    조회할 때마다 쓰기가 생기지 않도록 accessed_at은 마지막 기록 후 touch_interval초(기본 ttl의 1/10)가 지났을 때만 갱신
+    """
+
+    def __init__(self, path, ttl, max_bytes, table="cache", touch_interval=None):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.touch_interval = ttl / 10 if touch_interval is None else touch_interval
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed_at ON {table} (accessed_at)")
+        self._conn.commit()
+        self.current_bytes = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {table}").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """키에 해당하는 값 반환 (없거나 만료되었으면 default)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, size, created_at, accessed_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+
+            blob, size, created_at, accessed_at = row
+            if created_at + self.ttl <= now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._conn.commit()
+                self.current_bytes -= size
+                self.misses += 1
+                return default
+
+            # LRU 제거 순서에는 touch_interval 단위의 정확도면 충분
+            if now - accessed_at >= self.touch_interval:
+                self._conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            self.hits += 1
+
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def set(self, key, value):
+        """값을 JSON으로 직렬화하고 압축하여 저장"""
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"), 6)
+        size = len(blob)
+        if size > self.max_bytes:
+            return False
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(f"SELECT size FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.current_bytes -= row[0]
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, size, now, now),
+            )
+            self.current_bytes += size
+            if self.current_bytes > self.max_bytes:
+                self._evict(now)
+            self._conn.commit()
+        return True
+
+    def _evict(self, now):
+        # 만료된 항목을 먼저 지우고, 그래도 크면 오래 사용하지 않은 항목부터 제거
+        self._conn.execute(f"DELETE FROM {self.table} WHERE created_at + ? <= ?", (self.ttl, now))
+        self.current_bytes = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        while self.current_bytes > self.max_bytes:
+            row = self._conn.execute(
+                f"SELECT key, size FROM {self.table} ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (row[0],))
+            self.current_bytes -= row[1]
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            return {
+                "entries": entries,
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,68 @@
+def allocate_videos(sorted_videos, category_ids, max_per_category):
+    """
+    조회수 순으로 정렬된 비디오를 카테고리별로 최대 max_per_category개씩 배정
+    각 비디오는 한 카테고리에만 배정되며, 결과는 {카테고리 ID: [sorted_videos 인덱스, ...]} (배정 순서)
+
+    1단계: 한 카테고리에만 매칭된 비디오를 그 카테고리에 배정
+    2단계: 카테고리 순서대로, 아직 배정되지 않은 비디오 중 그 카테고리와 매칭된 비디오로 채움
+    3단계: 그래도 부족한 카테고리는 아직 배정되지 않은 아무 비디오로 채움
+
+    부족한 카테고리의 매칭 인덱스를 한 번에 만들어 두고 앞에서부터 한 번씩만 훑으므로
+    전체 비용은 카테고리 수와 상관없이 비디오 수와 매칭 수에 비례
+    """
+    assignments = {category_id: [] for category_id in category_ids}
+    used = [False] * len(sorted_videos)
+
+    # 1단계: 각 카테고리에만 고유하게 일치하는 비디오 할당 (모든 카테고리가 차면 중단)
+    open_categories = len(category_ids) if max_per_category > 0 else 0
+    for index, video in enumerate(sorted_videos):
+        if open_categories == 0:
+            break
+        matches = video["category_matches"]
+        if len(matches) == 1 and len(assignments[matches[0]]) < max_per_category:
+            assigned = assignments[matches[0]]
+            assigned.append(index)
+            used[index] = True
+            if len(assigned) == max_per_category:
+                open_categories -= 1
+
+    needy_categories = [
+        category_id for category_id in category_ids
+        if len(assignments[category_id]) < max_per_category
+    ]
+    if not needy_categories:
+        return assignments
+
+    # 부족한 카테고리별로 아직 배정되지 않은 매칭 비디오 인덱스 (조회수 순)
+    matching_indexes = {category_id: [] for category_id in needy_categories}
+    for index, video in enumerate(sorted_videos):
+        if used[index]:
+            continue
+        for category_id in set(video["category_matches"]):
+            if category_id in matching_indexes:
+                matching_indexes[category_id].append(index)
+
+    # 2단계: 카테고리 우선순위에 따라 남은 매칭 비디오 할당
+    for category_id in needy_categories:
+        needed = max_per_category - len(assignments[category_id])
+        for index in matching_indexes[category_id]:
+            if needed == 0:
+                break
+            if used[index]:
+                continue
+            assignments[category_id].append(index)
+            used[index] = True
+            needed -= 1
+
+    # 3단계: 아직 사용되지 않은 비디오 할당 (배정된 비디오는 다시 풀리지 않으므로 포인터 하나로 충분)
+    cursor = 0
+    for category_id in needy_categories:
+        needed = max_per_category - len(assignments[category_id])
+        while needed > 0 and cursor < len(sorted_videos):
+            if not used[cursor]:
+                assignments[category_id].append(cursor)
+                used[cursor] = True
+                needed -= 1
+            cursor += 1
+
+    return assignments
@@ -0,0 +1,181 @@
+"""
+여러 결과 페이지를 동시에 가져오는 크롤링 스케줄러
+
+pageIndex로 바로 접근할 수 있는 목록 페이지 1..N을 max_workers개씩 동시에 요청하고 결과를 페이지 순서대로 합침
+- 호스트별 토큰 버킷(HostRateLimiter)으로 초당 요청 수를 제한해 대상 사이트에 부담을 주지 않음
+- 빈 페이지(is_terminal)나 오류가 난 페이지가 나오면 그 뒤 페이지는 더 요청하지 않고 결과에서도 제외
+- 스레드풀은 스케줄러마다 하나를 계속 사용하므로 동시에 들어온 크롤링을 모두 합쳐도 max_workers개까지만 요청
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷 (토큰이 없으면 차례가 올 때까지 대기)"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 가져가고 기다린 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰이 부족하면 미리 빼 두어(음수) 나중에 온 요청이 앞지르지 못하도록 함
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """호스트마다 별도의 TokenBucket을 두는 요청 속도 제한 (rate가 0 이하이면 제한하지 않음)"""
+
+    def __init__(self, rate=5.0, burst=10):
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._stats = {}  # host -> {"requests": n, "delayed": n, "wait_seconds": s}
+
+    def acquire(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None and self.rate > 0:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        delay = bucket.acquire() if bucket is not None else 0.0
+        with self._lock:
+            stats = self._stats.setdefault(host, {"requests": 0, "delayed": 0, "wait_seconds": 0.0})
+            stats["requests"] += 1
+            stats["delayed"] += int(delay > 0)
+            stats["wait_seconds"] += delay
+        return delay
+
+    def stats(self):
+        with self._lock:
+            return {
+                host: {**stats, "wait_seconds": round(stats["wait_seconds"], 3)}
+                for host, stats in self._stats.items()
+            }
+
+
+class CrawlScheduler:
+    """
+    페이지 URL 목록을 동시에 가져와 페이지 순서대로 결과 목록을 반환
+    fetch(url)의 결과가 is_terminal(page_index, result)이거나 예외가 나면 그 페이지가 끝
+    (첫 페이지 예외와 raise_errors에 속한 예외는 결과 끝으로 보지 않고 그대로 전달)
+    max_workers를 주면 이 크롤링만 그 수까지 동시에 요청 (드라이버 풀처럼 fetch가 쓰는 자원이 더 적을 때)
+    더 이상 쓰지 않으면 close()로 스레드풀을 종료
+    """
+
+    def __init__(self, max_workers=5, limiter=None):
+        self.max_workers = max_workers
+        self.limiter = limiter
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="crawl")
+        self._lock = threading.Lock()
+        self._stats = {"crawls": 0, "pages_requested": 0, "pages_used": 0, "pages_skipped": 0, "seconds": 0.0}
+
+    def crawl(self, urls, fetch, is_terminal=None, max_workers=None, raise_errors=()):
+        max_workers = self.max_workers if max_workers is None else max(1, min(max_workers, self.max_workers))
+        started = time.perf_counter()
+        state = {"stop_at": len(urls), "requested": 0, "skipped": 0}
+        state_lock = threading.Lock()
+
+        def run(index):
+            # 앞 페이지에서 끝이 정해졌으면 (토큰을 기다리는 동안 정해진 경우 포함) 요청하지 않음
+            if self._skip(state, state_lock, index):
+                return None
+            if self.limiter is not None:
+                self.limiter.acquire(urls[index])
+                if self._skip(state, state_lock, index):
+                    return None
+            with state_lock:
+                state["requested"] += 1
+            return fetch(urls[index])
+
+        results = {}
+        pending = {}
+        try:
+            next_index = 0
+            while True:
+                with state_lock:
+                    stop_at = state["stop_at"]
+                while next_index < stop_at and len(pending) < max_workers:
+                    pending[self._executor.submit(run, next_index)] = next_index
+                    next_index += 1
+                if not any(index < stop_at for index in pending.values()):
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    index = pending.pop(future)
+                    with state_lock:
+                        stop_at = state["stop_at"]
+                    # 앞 페이지에서 이미 끝난 페이지는 결과/오류 모두 무시
+                    if index >= stop_at:
+                        continue
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        if index == 0 or isinstance(e, raise_errors):
+                            raise
+                        logger.error(f"페이지 {index + 1} 처리 중 오류 발생: {e}. 이후 페이지 제외.")
+                        self._stop(state, state_lock, index)
+                        continue
+                    if is_terminal is not None and is_terminal(index + 1, result):
+                        self._stop(state, state_lock, index)
+                    else:
+                        results[index] = result
+        except BaseException:
+            # 첫 페이지 오류 등으로 중간에 끝나면 토큰을 기다리던 페이지도 요청하지 않도록 함
+            self._stop(state, state_lock, -1)
+            raise
+        finally:
+            # 아직 시작하지 않은 페이지(끝 이후 페이지 포함)는 공유 스레드풀에서 빼냄
+            for future in pending:
+                future.cancel()
+
+        stop_at = state["stop_at"]
+        ordered = [results[index] for index in range(stop_at) if index in results]
+        with self._lock:
+            self._stats["crawls"] += 1
+            self._stats["pages_requested"] += state["requested"]
+            self._stats["pages_used"] += len(ordered)
+            self._stats["pages_skipped"] += state["skipped"]
+            self._stats["seconds"] += time.perf_counter() - started
+        return ordered
+
+    @staticmethod
+    def _skip(state, state_lock, index):
+        with state_lock:
+            if index <= state["stop_at"]:
+                return False
+            state["skipped"] += 1
+            return True
+
+    @staticmethod
+    def _stop(state, state_lock, index):
+        with state_lock:
+            state["stop_at"] = min(state["stop_at"], index)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats["seconds"] = round(stats["seconds"], 3)
+        stats["avg_seconds_per_crawl"] = round(stats["seconds"] / stats["crawls"], 3) if stats["crawls"] else 0.0
+        stats["rate_limit"] = self.limiter.stats() if self.limiter is not None else None
+        return stats
@@ -1,10 +1,9 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 import logging
+from driver_pool import checkout_driver, return_driver
+from page_waits import PageWaiter
+from work24_crawler import crawl_pages_with_driver, extract_rows, page_url
 import re
 from uuid import uuid4
 
@@ -74,9 +73,75 @@ def update_progress_disabled(task_id, percent, message):
 
 def truncate_text(text, max_len=30):
     return text[:max_len] + "..." if len(text) > max_len else text
-def scrape_data_disabled(progress_callback=None, target_url=None, max_pages=10):
+def scrape_data_disabled(progress_callback=None, target_url=None, max_pages=10, crawler=None, driver_pool=None,
+                         scheduler=None, waiter=None):
+    """
+    장애인 채용 목록 크롤링
+    crawler(Work24Crawler)가 있으면 pageIndex별 HTTP 요청으로 가져오고, 실패하면 Selenium 크롤링으로 대체
+    Selenium 크롤링은 driver_pool(DriverPool)이 있으면 풀의 드라이버를 빌려 쓰고,
+    scheduler(CrawlScheduler)도 있으면 페이지마다 드라이버를 빌려 pageIndex URL을 동시에 열어 가져옴
+    waiter(PageWaiter)는 결과 표 로드/페이지 전환 대기 시간을 학습하도록 여러 크롤링이 공유
+    """
+    if crawler is not None:
+        try:
+            all_data = crawler.crawl(target_url, max_pages=max_pages)
+            for job_data in all_data:
+                job_data["data"] = preprocess_job_data(job_data["data"])
+            return all_data
+        except Exception as e:
+            logger.warning(f"HTTP 크롤링 실패, Selenium으로 재시도: {e}")
+    if driver_pool is not None and scheduler is not None:
+        return _scrape_data_disabled_concurrent(progress_callback, target_url, max_pages, driver_pool, scheduler, waiter)
+    return _scrape_data_disabled_selenium(progress_callback, target_url, max_pages, driver_pool, waiter)
+
+
+def _scrape_data_disabled_concurrent(progress_callback, target_url, max_pages, driver_pool, scheduler, waiter):
+    try:
+        urls = [page_url(target_url, page_index) for page_index in range(1, max_pages + 1)]
+        all_data = crawl_pages_with_driver(scheduler, driver_pool, urls, _row_job_data, waiter)
+        for job_data in all_data:
+            job_data["data"] = preprocess_job_data(job_data["data"])
+        return all_data
+    except Exception as e:
+        logger.error(f"크롤링 중 오류 발생: {e}")
+        if progress_callback:
+            progress_callback(-1,-1, f"오류 발생: {e}")
+        return []
+
+
+def _row_job_data(row):
+    """extract_rows로 읽은 행 하나를 원시 job_data로 변환 (id가 없는 행은 None, data는 preprocess_job_data 적용 전)"""
+    row_id = row["id"]
+    if not row_id:
+        return None
+    data = list(row["cells"])
+    
+    # 위치 정보 예시 처리 (필요 시 수정)
+    location = "위치 정보 없음"
+    if len(data) > 1:
+        position_info = data[1].split('\n')
+        if len(position_info) > 3:
+            location = position_info[-1]
+            data[1] = '\n'.join(position_info[:-1])
+    
+    # 링크 추출
+    links = row["links"]
+    second_link = links[1] if len(links) > 1 else "없음"
+    
+    job_data = {
+        "id": row_id,
+        "data": data,
+        "second_link": second_link,
+        "source": "worknet",
+        "location": location
+    }
+    return job_data
+
+
+def _scrape_data_disabled_selenium(progress_callback=None, target_url=None, max_pages=10, driver_pool=None, waiter=None):
     driver = None
     data = []
+    waiter = waiter or PageWaiter()
 
     try:
         options = Options()
@@ -84,69 +149,43 @@ def scrape_data_disabled(progress_callback=None, target_url=None, max_pages=10):
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
 
-        driver = webdriver.Chrome(options=options)
+        driver = checkout_driver(driver_pool, options)
         all_data = []
         
         try:
             driver.get(target_url)
             logger.info(target_url)
-            # 블록 오버레이가 사라질 때까지 대기
-            WebDriverWait(driver, 10).until_not(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.blockUI.blockOverlay"))
-            )
+            before = None
             
             # 페이지 번호 1부터 10까지 루프
             for current_page in range(1, 10):
                 try:
-                    # 결과 테이블이 로드될 때까지 대기
-                    results_table = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "box_table.type_pd24"))
-                    )
+                    # 결과 테이블이 로드될 때까지 대기 (블록 오버레이가 사라지고, 다음 페이지는 클릭 전 표에서 바뀔 때까지)
+                    results_table = waiter.wait_for_results(driver, before)
                     
-                    rows = results_table.find_elements(By.TAG_NAME, "tr")
+                    rows = extract_rows(driver, results_table)
                     if not rows:
                         logger.info(f"페이지 {current_page}: 데이터 행이 없습니다. 루프 종료")
                         break
 
                     # 각 행의 데이터를 처리하여 all_data에 추가
                     for row in rows:
-                        row_id = row.get_attribute("id")
-                        if not row_id:
-                            continue
-                        columns = row.find_elements(By.TAG_NAME, "td")
-                        data = [col.text.strip() for col in columns]
-                        
-                        # 위치 정보 예시 처리 (필요 시 수정)
-                        location = "위치 정보 없음"
-                        if len(data) > 1:
-                            position_info = data[1].split('\n')
-                            if len(position_info) > 3:
-                                location = position_info[-1]
-                                data[1] = '\n'.join(position_info[:-1])
-                        
-                        # 링크 추출
-                        links = [a.get_attribute("href") for a in row.find_elements(By.TAG_NAME, "a") if a.get_attribute("href")]
-                        second_link = links[1] if len(links) > 1 else "없음"
-                        
-                        job_data = {
-                            "id": row_id,
-                            "data": data,
-                            "second_link": second_link,
-                            "source": "worknet",
-                            "location": location
-                        }
-                        all_data.append(job_data)
+                        job_data = _row_job_data(row)
+                        if job_data:
+                            all_data.append(job_data)
                     
                     logger.info(f"페이지 {current_page} 크롤링 완료. 데이터 수: {len(all_data)}")
                     
                     # 다음 페이지 버튼을 클릭하여 이동
                     next_page = current_page + 1
                     next_button_xpath = f"//*[@id='mForm']/div[2]/div/div[2]/div/div/div/button[{next_page}]"
-                    next_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, next_button_xpath))
-                    )
-                    driver.execute_script("arguments[0].click();", next_button)
-                    time.sleep(2)  # 페이지 전환 대기
+                    # 버튼이 없으면 마지막 페이지 (클릭 가능해질 때까지 기다리면 매번 제한 시간만큼 늦어짐)
+                    next_buttons = driver.find_elements(By.XPATH, next_button_xpath)
+                    if not next_buttons:
+                        logger.info(f"페이지 {current_page}: 마지막 페이지 도달")
+                        break
+                    before = waiter.snapshot(driver)
+                    driver.execute_script("arguments[0].click();", next_buttons[0])
 
                 except Exception as page_e:
                     logger.error(f"페이지 {current_page} 처리 중 오류 발생: {page_e}. 루프 중단.")
@@ -156,7 +195,7 @@ def scrape_data_disabled(progress_callback=None, target_url=None, max_pages=10):
             return all_data
 
         finally:
-            driver.quit()
+            return_driver(driver, driver_pool)
 
     except Exception as e:
         logger.error(f"크롤링 중 오류 발생: {e}")
@@ -164,7 +203,7 @@ def scrape_data_disabled(progress_callback=None, target_url=None, max_pages=10):
             progress_callback(-1,-1, f"오류 발생: {e}")
         if driver:
             try:
-                driver.quit()
+                return_driver(driver, driver_pool)
             except:
                 pass
         return data
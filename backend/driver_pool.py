@@ -0,0 +1,305 @@
+"""
+미리 띄워 둔 헤드리스 Chrome 드라이버 풀
+
+크롤러마다 요청 때마다 webdriver.Chrome을 새로 띄우면 1~3초, 150MB 정도가 매번 들기 때문에
+최대 size개의 드라이버를 만들어 두고 빌려 쓰고 돌려받음
+- 빌릴 때 상태 확인(execute_script)에 실패한 드라이버는 버리고 새로 만듦
+- max_uses번 쓰였거나 max_age초가 지난 드라이버, 사용 중 세션이 끊긴(InvalidSessionIdException) 드라이버는 종료 후 교체
+- 돌려받을 때 쿠키/스토리지를 지우고 about:blank로 이동해 다음 사용자에게 상태가 남지 않도록 함
+  페이지 대기 시간 초과(TimeoutException)나 요소를 못 찾는 등 페이지 단위 오류는 드라이버를 버리지 않고,
+  이 정리 단계가 실패할 때만(브라우저가 죽었거나 응답하지 않음) 교체
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import InvalidSessionIdException
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+# 드라이버 세션 자체가 망가진 오류 (정리 단계 없이 바로 교체)
+FATAL_DRIVER_ERRORS = (InvalidSessionIdException,)
+
+CHROME_ARGUMENTS = (
+    "--headless",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--window-size=1920,1080",
+)
+
+
+def default_chrome_options():
+    options = Options()
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    return options
+
+
+def create_chrome_driver():
+    return webdriver.Chrome(options=default_chrome_options())
+
+
+def checkout_driver(driver_pool=None, options=None):
+    """driver_pool이 있으면 풀에서 빌리고, 없으면 options로 새 Chrome을 띄움"""
+    if driver_pool is not None:
+        return driver_pool.acquire()
+    return webdriver.Chrome(options=options or default_chrome_options())
+
+
+def return_driver(driver, driver_pool=None, broken=False):
+    """풀에서 빌린 드라이버는 반납하고, 직접 띄운 드라이버는 종료"""
+    if driver_pool is not None:
+        driver_pool.release(driver, broken=broken)
+    else:
+        driver.quit()
+
+
+class DriverPoolTimeout(Exception):
+    """acquire_timeout 안에 빌릴 수 있는 드라이버가 없음"""
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+
+class DriverPool:
+    """
+    최대 size개의 WebDriver를 관리하는 스레드 안전 풀
+    with pool.lease() as driver: 형태로 쓰거나 acquire()/release()를 직접 호출 (release는 여러 번 불러도 안전)
+    """
+
+    def __init__(self, size=2, max_uses=50, max_age=30 * 60, acquire_timeout=60.0, factory=None):
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.acquire_timeout = acquire_timeout
+        self.factory = factory or create_chrome_driver
+        self._cond = threading.Condition()
+        self._idle = []  # 쉬고 있는 _PooledDriver (최근에 반납된 것이 뒤)
+        self._leases = {}  # id(driver) -> 빌려준 _PooledDriver
+        self._total = 0  # idle + 사용 중 + 생성 중
+        self._closed = False
+        self._warm_target = 0  # 교체로 줄어들어도 이 수까지는 다시 미리 띄움
+        self._refilling = False
+        self._started_at = time.monotonic()
+        self._busy_seconds = 0.0
+        self._last_change = self._started_at
+        self._stats = {
+            "acquisitions": 0,
+            "created": 0,
+            "create_failures": 0,
+            "recycled": 0,
+            "discarded_unhealthy": 0,
+            "timeouts": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """드라이버를 빌려 주고 블록이 끝나면 반납 (세션 오류가 나면 그 드라이버는 교체, 그 외 오류는 반납 시 정리로 판단)"""
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except FATAL_DRIVER_ERRORS:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def acquire(self, timeout=None):
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            pooled = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("드라이버 풀이 닫혔습니다.")
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        break
+                    if self._total < self.size:
+                        self._total += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise DriverPoolTimeout(f"{timeout}초 안에 사용할 수 있는 Chrome 드라이버가 없습니다.")
+                    self._cond.wait(remaining)
+
+            if pooled is None:
+                pooled = self._create()
+            elif not self._is_reusable(pooled):
+                self._discard(pooled)
+                continue
+
+            with self._cond:
+                self._mark_busy_change()
+                pooled.uses += 1
+                self._leases[id(pooled.driver)] = pooled
+                waited = time.monotonic() - started
+                self._stats["acquisitions"] += 1
+                self._stats["wait_seconds"] += waited
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+            return pooled.driver
+
+    def release(self, driver, broken=False):
+        """드라이버 반납 (빌려준 드라이버가 아니거나 이미 반납된 경우 무시)"""
+        with self._cond:
+            pooled = self._leases.get(id(driver))
+            if pooled is None or pooled.driver is not driver:
+                return
+            self._mark_busy_change()
+            del self._leases[id(driver)]
+
+        expired = pooled.uses >= self.max_uses or time.monotonic() - pooled.created_at >= self.max_age
+        if broken or expired or self._closed:
+            with self._cond:
+                if broken:
+                    self._stats["discarded_unhealthy"] += 1
+                elif expired:
+                    self._stats["recycled"] += 1
+            self._discard(pooled)
+            return
+        if not self._reset(pooled.driver):
+            with self._cond:
+                self._stats["discarded_unhealthy"] += 1
+            self._discard(pooled)
+            return
+
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    def warm(self, count=None):
+        """count개(기본 size개)까지 드라이버를 백그라운드에서 미리 띄우고, 교체로 줄어들면 다시 채움"""
+        with self._cond:
+            self._warm_target = min(self.size if count is None else count, self.size)
+        self._start_refill()
+
+    def _start_refill(self):
+        with self._cond:
+            if self._refilling or self._closed or self._total >= self._warm_target:
+                return
+            self._refilling = True
+        threading.Thread(target=self._refill, name="driver-pool-warm", daemon=True).start()
+
+    def _refill(self):
+        try:
+            while True:
+                with self._cond:
+                    if self._closed or self._total >= self._warm_target:
+                        return
+                    self._total += 1
+                try:
+                    pooled = self._create()
+                except Exception as e:
+                    logger.warning(f"Chrome 드라이버 미리 띄우기 실패: {str(e)}")
+                    return
+                with self._cond:
+                    closed = self._closed
+                    if not closed:
+                        self._idle.append(pooled)
+                        self._cond.notify()
+                if closed:
+                    self._discard(pooled)
+                    return
+        finally:
+            with self._cond:
+                self._refilling = False
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def _create(self):
+        """생성 자리(_total)를 이미 확보한 상태에서 호출, 실패하면 자리를 돌려주고 예외 전달"""
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._stats["create_failures"] += 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["created"] += 1
+        return _PooledDriver(driver)
+
+    def _is_reusable(self, pooled):
+        if time.monotonic() - pooled.created_at >= self.max_age:
+            with self._cond:
+                self._stats["recycled"] += 1
+            return False
+        try:
+            pooled.driver.execute_script("return 1")
+            return True
+        except Exception as e:
+            logger.warning(f"응답하지 않는 Chrome 드라이버 교체: {str(e)}")
+            with self._cond:
+                self._stats["discarded_unhealthy"] += 1
+            return False
+
+    def _reset(self, driver):
+        """다음 사용을 위해 쿠키/스토리지/추가 창을 정리 (실패하면 False)"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"Chrome 드라이버 상태 정리 실패, 교체합니다: {str(e)}")
+            return False
+
+    def _discard(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+        self._start_refill()
+
+    def _mark_busy_change(self):
+        # 사용 중인 드라이버 수가 바뀌기 직전까지의 (사용 중 수 × 시간)을 누적 (self._cond를 잡은 상태에서 호출)
+        now = time.monotonic()
+        self._busy_seconds += len(self._leases) * (now - self._last_change)
+        self._last_change = now
+
+    def stats(self):
+        with self._cond:
+            self._mark_busy_change()
+            elapsed = max(time.monotonic() - self._started_at, 1e-9)
+            stats = dict(self._stats)
+            acquisitions = stats["acquisitions"]
+            stats.update({
+                "size": self.size,
+                "drivers": self._total,
+                "idle": len(self._idle),
+                "in_use": len(self._leases),
+                "wait_seconds": round(stats["wait_seconds"], 3),
+                "max_wait_seconds": round(stats["max_wait_seconds"], 3),
+                "avg_wait_seconds": round(stats["wait_seconds"] / acquisitions, 3) if acquisitions else 0.0,
+                "utilization": round(self._busy_seconds / (elapsed * self.size), 3) if self.size else 0.0,
+            })
+            return stats
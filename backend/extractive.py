@@ -0,0 +1,299 @@
+import logging
+import math
+import threading
+
+import numpy as np
+
+from token_budget import allocate_budget, pack_texts, split_sentences
+
+logger = logging.getLogger(__name__)
+
+# 추출 단계 동작 방식: off(기존 경로), on(추출한 문장으로 요약), compare(기존 경로로 요약하면서 추출 결과와 토큰/비용만 비교 기록)
+EXTRACTIVE_OFF = "off"
+EXTRACTIVE_ON = "on"
+EXTRACTIVE_COMPARE = "compare"
+EXTRACTIVE_MODES = (EXTRACTIVE_OFF, EXTRACTIVE_ON, EXTRACTIVE_COMPARE)
+
+# 비교 요약에서 다른 영상과 겹치는/이 영상에만 있는 문장 표시
+FLAG_SHARED = "shared"
+FLAG_UNIQUE = "unique"
+FLAG_LABELS = {FLAG_SHARED: "[공통]", FLAG_UNIQUE: "[고유]"}
+SHARED_RATIO = 0.6  # 문장 가중치 중 다른 영상에도 나오는 용어의 비율이 이 이상이면 공통
+UNIQUE_RATIO = 0.2  # 이 이하이면 고유
+
+# 자동 자막은 문장부호가 거의 없으므로 너무 긴 문장은 단어 묶음으로 나누어 고름
+MAX_UNIT_WORDS = 40
+UNIT_WORDS = 20
+MIN_UNIT_TERMS = 4  # 이보다 용어가 적은 조각("네 맞습니다" 등)은 점수를 깎음
+REDUNDANCY_THRESHOLD = 0.7  # 이미 고른 문장과 이 이상 비슷하면 건너뜀
+SKETCH_DIM = 256  # 중복 판단용 해시 벡터 차원
+MAX_MISSES = 32  # 예산에 안 들어가는 후보가 연속으로 이만큼 나오면 선택을 멈춤
+
+# 용어는 한글/영문/숫자 글자의 2-gram (조사가 붙어도 어간이 같은 2-gram으로 잡힘)
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172
+ALPHABET_SIZE = HANGUL_COUNT + 128
+UNIT_SEPARATOR = "\n"
+
+
+def split_units(text):
+    """텍스트를 문장 단위로 나누고, 문장부호 없이 긴 문장은 UNIT_WORDS 단어씩 나눔"""
+    units = []
+    for sentence in split_sentences(text):
+        words = sentence.split()
+        if len(words) <= MAX_UNIT_WORDS:
+            units.append(" ".join(words))
+            continue
+        units.extend(" ".join(words[start:start + UNIT_WORDS]) for start in range(0, len(words), UNIT_WORDS))
+    return units
+
+
+def _char_ids(codes):
+    """유니코드 코드 포인트 배열에서 글자마다 용어 알파벳 번호 (한글 음절, 소문자 ASCII 영숫자) 또는 -1"""
+    codes = codes.astype(np.int64)
+    ids = np.full(codes.shape, -1, dtype=np.int64)
+
+    hangul = (codes >= HANGUL_BASE) & (codes < HANGUL_BASE + HANGUL_COUNT)
+    ids[hangul] = codes[hangul] - HANGUL_BASE
+
+    upper = (codes >= 65) & (codes <= 90)
+    codes[upper] += 32
+    alnum = ((codes >= 97) & (codes <= 122)) | ((codes >= 48) & (codes <= 57))
+    ids[alnum] = HANGUL_COUNT + codes[alnum]
+    return ids
+
+
+def _term_matrix(units):
+    """
+    조각별 용어(2-gram) 등장 목록을 만듦 (조각을 구분자로 이어 붙인 뒤 한 번에 벡터 연산)
+    반환: (조각 번호 배열, 용어 번호 배열, 용어 수) - 같은 (조각, 용어) 쌍은 등장 횟수만큼 반복
+    """
+    codes = np.frombuffer(UNIT_SEPARATOR.join(units).encode("utf-32-le"), dtype=np.uint32)
+    ids = _char_ids(codes)
+    unit_of_char = np.cumsum(codes == ord(UNIT_SEPARATOR))
+
+    valid = (ids[:-1] >= 0) & (ids[1:] >= 0)
+    codes = ids[:-1][valid] * ALPHABET_SIZE + ids[1:][valid]
+    unit_index = unit_of_char[:-1][valid]
+    vocabulary, term_index = np.unique(codes, return_inverse=True)
+    return unit_index, term_index.reshape(-1), len(vocabulary)
+
+
+def _tfidf(unit_index, term_index, unit_count, term_count, group_of_unit):
+    """
+    조각별 TF-IDF 가중치와 그룹(영상) 중심 벡터에 대한 코사인 점수를 계산
+    반환: (점수, (조각, 용어) 쌍별 조각 번호, 용어 번호, 가중치)
+    """
+    keys = unit_index * term_count + term_index
+    pairs, counts = np.unique(keys, return_counts=True)
+    pair_unit = pairs // term_count
+    pair_term = pairs % term_count
+
+    document_frequency = np.bincount(pair_term, minlength=term_count)
+    idf = np.log((1 + unit_count) / (1 + document_frequency)) + 1
+    weights = (1 + np.log(counts)) * idf[pair_term]
+
+    # 그룹마다 중심 벡터(조각 가중치 평균)를 만들고 각 조각과의 코사인 유사도를 점수로 사용
+    group_count = int(group_of_unit.max()) + 1 if unit_count else 0
+    pair_group = group_of_unit[pair_unit]
+    group_keys = pair_group * term_count + pair_term
+    centroid = np.bincount(group_keys, weights=weights, minlength=group_count * term_count)
+    centroid /= np.maximum(np.bincount(group_of_unit, minlength=group_count), 1).repeat(term_count)
+    centroid_norm = np.sqrt(np.bincount(
+        np.arange(group_count * term_count) // term_count, weights=centroid ** 2, minlength=group_count
+    ))
+
+    dot = np.bincount(pair_unit, weights=weights * centroid[group_keys], minlength=unit_count)
+    norm = np.sqrt(np.bincount(pair_unit, weights=weights ** 2, minlength=unit_count))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.nan_to_num(dot / (norm * centroid_norm[group_of_unit]))
+
+    # 용어가 너무 적은 짧은 조각은 감점
+    term_counts = np.bincount(unit_index, minlength=unit_count)
+    scores *= np.minimum(term_counts / MIN_UNIT_TERMS, 1.0)
+    return scores, pair_unit, pair_term, weights
+
+
+def _sketches(pair_unit, pair_term, weights, unit_count):
+    """중복 판단용으로 조각 벡터를 SKETCH_DIM 차원에 해시해 정규화"""
+    sketches = np.bincount(
+        pair_unit * SKETCH_DIM + pair_term % SKETCH_DIM, weights=weights, minlength=unit_count * SKETCH_DIM
+    ).reshape(unit_count, SKETCH_DIM)
+    norms = np.linalg.norm(sketches, axis=1, keepdims=True)
+    return sketches / np.maximum(norms, 1e-12)
+
+
+def _select(units, scores, sketches, budget, counter, tokens_per_char, labels=None):
+    """
+    점수 순으로 예산 안에 들어가고 이미 고른 것과 겹치지 않는 조각을 고른 뒤 원래 순서로 정렬한 번호 목록
+    후보마다 토크나이저를 부르지 않도록 글자 수 x 전체 텍스트의 글자당 토큰 수로 어림하고,
+    마지막에 고른 결과만 실제로 세어 예산을 넘으면 점수가 낮은 조각부터 뺌
+    """
+    labels = labels or [""] * len(units)
+    chosen = np.empty((len(units), SKETCH_DIM))
+    selected = []
+    used = 0
+    misses = 0
+    for index in np.argsort(-scores, kind="stable"):
+        if scores[index] <= 0:
+            break
+        length = len(units[index]) + (len(labels[index]) + 1 if labels[index] else 0)
+        tokens = math.ceil(length * tokens_per_char) + (1 if selected else 0)
+        if used + tokens > budget:
+            misses += 1
+            if misses >= MAX_MISSES:
+                break
+            continue
+        if selected and float(np.max(chosen[:len(selected)] @ sketches[index])) >= REDUNDANCY_THRESHOLD:
+            continue
+        chosen[len(selected)] = sketches[index]
+        selected.append(int(index))
+        used += tokens
+        misses = 0
+
+    # selected는 점수 순이므로 넘치면 뒤에서부터 뺌
+    while selected and counter.count(_join(units, labels, sorted(selected))) > budget:
+        selected.pop()
+    return sorted(selected)
+
+
+def _join(units, labels, indexes):
+    return " ".join(f"{labels[index]} {units[index]}" if labels[index] else units[index] for index in indexes)
+
+
+def extract_sentences(text, budget, counter, text_tokens=None):
+    """
+    TF-IDF 중심 벡터 점수로 정보량이 많은 문장을 골라 budget 토큰 안에서 원래 순서대로 이어 붙임
+    (예산 안에 다 들어가는 텍스트는 그대로 반환, text_tokens: 이미 센 text의 토큰 수)
+    """
+    if text_tokens is None:
+        text_tokens = counter.count(text) if text else 0
+    if not text or text_tokens <= budget:
+        return text
+    units = split_units(text)
+    unit_index, term_index, term_count = _term_matrix(units)
+    if term_count == 0:
+        return ""
+
+    group_of_unit = np.zeros(len(units), dtype=np.int64)
+    scores, pair_unit, pair_term, weights = _tfidf(unit_index, term_index, len(units), term_count, group_of_unit)
+    sketches = _sketches(pair_unit, pair_term, weights, len(units))
+    selected = _select(units, scores, sketches, budget, counter, text_tokens / len(text))
+    return " ".join(units[index] for index in selected)
+
+
+def extract_comparison(texts, total_budget, counter):
+    """
+    여러 영상의 자막에서 영상별 예산(길이 비례) 안에 정보량이 많은 문장을 고르고,
+    문장마다 다른 영상과 공통인지(FLAG_SHARED) 이 영상에만 있는지(FLAG_UNIQUE) 표시
+    반환: 영상별 [(문장, 표시 또는 None), ...]
+    예산은 표시 라벨까지 포함한 토큰 수 기준이며, 라벨을 붙여도 자기 몫 안에 들어가는 영상은 문장을 모두 남김
+    """
+    units_by_video = [split_units(text) if text else [] for text in texts]
+    units = [unit for video_units in units_by_video for unit in video_units]
+    if not units:
+        return [[] for _ in texts]
+
+    unit_index, term_index, term_count = _term_matrix(units)
+    if term_count == 0:
+        # 점수를 매길 용어가 없으면 앞에서부터 예산만큼만 담음
+        return [[(unit, None) for unit in split_units(text)] if text else []
+                for text in pack_texts(texts, total_budget, counter)]
+
+    group_of_unit = np.repeat(np.arange(len(texts)), [len(video_units) for video_units in units_by_video])
+    scores, pair_unit, pair_term, weights = _tfidf(unit_index, term_index, len(units), term_count, group_of_unit)
+    sketches = _sketches(pair_unit, pair_term, weights, len(units))
+
+    # 용어가 등장하는 영상 수로 문장별 공통 비율 계산
+    pair_group = group_of_unit[pair_unit]
+    video_terms = np.unique(pair_group * term_count + pair_term) % term_count
+    videos_per_term = np.bincount(video_terms, minlength=term_count)
+    shared_weight = np.bincount(pair_unit, weights=weights * (videos_per_term[pair_term] > 1), minlength=len(units))
+    total_weight = np.bincount(pair_unit, weights=weights, minlength=len(units))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shared_ratio = np.nan_to_num(shared_weight / total_weight)
+
+    flags = [None] * len(units)
+    if len(texts) > 1:
+        for index, ratio in enumerate(shared_ratio):
+            if total_weight[index] == 0:
+                continue
+            if ratio >= SHARED_RATIO:
+                flags[index] = FLAG_SHARED
+            elif ratio <= UNIQUE_RATIO:
+                flags[index] = FLAG_UNIQUE
+    labels = [FLAG_LABELS.get(flag, "") for flag in flags]
+
+    flagged_by_video = []
+    start = 0
+    for video_units in units_by_video:
+        end = start + len(video_units)
+        flagged_by_video.append(list(zip(video_units, flags[start:end])))
+        start = end
+
+    # 라벨을 붙인 전체 길이로 예산을 나누고, 다 들어가면 고르지 않고 그대로 반환
+    flagged_counts = [counter.count(render_flagged(flagged)) for flagged in flagged_by_video]
+    if sum(flagged_counts) <= total_budget:
+        return flagged_by_video
+
+    budgets = allocate_budget(flagged_counts, total_budget)
+    results = []
+    start = 0
+    for text, flagged, budget, flagged_tokens in zip(texts, flagged_by_video, budgets, flagged_counts):
+        end = start + len(flagged)
+        if flagged_tokens <= budget:
+            results.append(flagged)
+        else:
+            # _select는 고르는 문장마다 붙을 라벨 길이를 빼 가며 예산을 씀
+            selected = _select(
+                units[start:end], scores[start:end], sketches[start:end], budget, counter,
+                counter.count(text) / len(text), labels[start:end],
+            )
+            results.append([flagged[index] for index in selected])
+        start = end
+    return results
+
+
+def render_flagged(sentences):
+    """extract_comparison 결과 한 영상분을 표시 라벨을 붙인 텍스트로 변환"""
+    return " ".join(
+        f"{FLAG_LABELS[flag]} {sentence}" if flag else sentence
+        for sentence, flag in sentences
+    )
+
+
+class ExtractiveStats:
+    """추출 단계의 입력 토큰 절감량과 처리 시간 기록 (기존 경로 대비)"""
+
+    def __init__(self, mode, input_price_per_1k=0.0):
+        self.mode = mode
+        self.input_price_per_1k = input_price_per_1k
+        self._lock = threading.Lock()
+        self._by_kind = {}
+
+    def record(self, kind, baseline_tokens, baseline_calls, extractive_tokens, elapsed):
+        with self._lock:
+            stats = self._by_kind.setdefault(kind, {
+                "requests": 0, "baseline_input_tokens": 0, "baseline_llm_calls": 0,
+                "extractive_input_tokens": 0, "extractive_llm_calls": 0, "extract_seconds": 0.0,
+            })
+            stats["requests"] += 1
+            stats["baseline_input_tokens"] += baseline_tokens
+            stats["baseline_llm_calls"] += baseline_calls
+            stats["extractive_input_tokens"] += extractive_tokens
+            stats["extractive_llm_calls"] += 1
+            stats["extract_seconds"] += elapsed
+
+    def snapshot(self):
+        with self._lock:
+            by_kind = {}
+            for kind, stats in self._by_kind.items():
+                saved = stats["baseline_input_tokens"] - stats["extractive_input_tokens"]
+                by_kind[kind] = {
+                    **stats,
+                    "extract_seconds": round(stats["extract_seconds"], 4),
+                    "saved_input_ratio": round(saved / stats["baseline_input_tokens"], 3)
+                    if stats["baseline_input_tokens"] else 0.0,
+                    "saved_input_cost_usd": round(saved / 1000 * self.input_price_per_1k, 6),
+                }
+            return {"mode": self.mode, "by_kind": by_kind}
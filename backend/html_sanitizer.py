@@ -0,0 +1,161 @@
+import re
+from html import escape
+from html.parser import HTMLParser
+
+# 요약 HTML에 허용하는 태그와 태그별 허용 클래스 (그 외 태그는 벗겨내고 내용만 남김)
+ALLOWED_TAGS = {
+    'div': ['summary-container', 'content-block', 'comparison-container', 'video-perspective'],
+    'section': ['summary-section', 'common-section', 'unique-section', 'conclusion-section'],
+    'h3': ['section-title'],
+    'h4': ['video-title'],
+    'p': ['main-point', 'detail-point', 'supporting-info', 'key-point', 'unique-point', 'conclusion-point'],
+    'b': []
+}
+# 텍스트 흐름 안에 들어가는 태그 (이 태그들과 텍스트 사이의 공백은 한 칸으로 유지)
+INLINE_TAGS = {'b', 'br'}
+# 내용까지 통째로 버리는 태그
+DROPPED_CONTENT_TAGS = {'script', 'style'}
+
+# 모델이 HTML 앞뒤에 붙이는 코드 펜스와 메타설명
+META_TEXT_PATTERN = re.compile(r"```html|```|(?:위의 HTML|이 HTML|요약된 내용).*$", re.MULTILINE)
+# '비디오 1 제목'처럼 실제 제목 대신 프롬프트 예시를 그대로 쓴 비디오 제목
+PLACEHOLDER_VIDEO_TITLE_PATTERN = re.compile(r'비디오\s*\d+\s*제목')
+PLACEHOLDER_VIDEO_TITLE_REPLACEMENT = "영상 제목 형식 오류"
+
+
+class SummaryHTMLSanitizer(HTMLParser):
+    """
+    모델이 생성한 요약 HTML을 한 번 훑으면서 정리하는 허용 목록 기반 정제기
+    - ALLOWED_TAGS에 없는 태그는 벗겨내고, 허용 태그에는 허용된 class만 남김 (다른 속성은 모두 제거)
+    - 같은 제목(h3)의 <section>은 처음 것만 남김
+    - 예시 형식 그대로인 비디오 제목(h4.video-title)은 경고 문구로 바꿈
+    - <br>은 그대로 두고, 공백만 있는 텍스트는 블록 태그 사이에서는 버리고 텍스트/인라인 태그 사이에서는 한 칸으로 줄임
+    결과는 들여쓰기 없는 HTML(html)과 섹션별 목록(sections)
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._out = []
+        self._open_tags = []  # 출력한 허용 태그 스택
+        self._dropped_depth = 0  # script/style 안에 있는 동안 0보다 큼
+        self._seen_titles = set()
+        self._section = None  # 현재 모으고 있는 최상위 section 정보
+        self._title_parts = None  # 현재 h3 텍스트
+        self._video_title = None  # 현재 h4.video-title의 (출력 위치, 텍스트 조각)
+        self._last_inline = False  # 마지막 출력이 텍스트나 인라인 태그인지
+        self._pending_space = False  # 다음 텍스트/인라인 태그 앞에 넣을 공백
+        self.sections = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROPPED_CONTENT_TAGS:
+            self._dropped_depth += 1
+            return
+        if tag == 'br':
+            self.handle_startendtag(tag, attrs)
+            return
+        if self._dropped_depth or tag not in ALLOWED_TAGS:
+            return
+
+        classes = []
+        for name, value in attrs:
+            if name == 'class' and value:
+                classes.extend(c for c in value.split() if c in ALLOWED_TAGS[tag])
+
+        if tag == 'section' and self._section is None:
+            self._section = {"start": len(self._out), "class": classes[0] if classes else "", "title": ""}
+        elif tag == 'h3' and self._section is not None and self._title_parts is None:
+            self._title_parts = []
+        elif tag == 'h4' and 'video-title' in classes:
+            self._video_title = (len(self._out) + 1, [])
+
+        self._emit(f'<{tag} class="{" ".join(classes)}">' if classes else f'<{tag}>', tag in INLINE_TAGS)
+        self._open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # 빈 태그 중 줄바꿈(<br>, <br/>)만 남기고 나머지는 버림
+        if tag != 'br' or self._dropped_depth:
+            return
+        self._add_text(" ")
+        self._emit('<br>', True)
+
+    def handle_endtag(self, tag):
+        if tag in DROPPED_CONTENT_TAGS:
+            self._dropped_depth = max(self._dropped_depth - 1, 0)
+            return
+        if self._dropped_depth or tag not in self._open_tags:
+            return
+
+        # 닫히지 않은 안쪽 태그는 함께 닫음
+        while self._open_tags:
+            open_tag = self._open_tags.pop()
+            self._close(open_tag)
+            if open_tag == tag:
+                break
+
+    def _close(self, tag):
+        self._emit(f'</{tag}>', tag in INLINE_TAGS)
+
+        if tag == 'h3' and self._title_parts is not None:
+            self._section["title"] = "".join(self._title_parts).strip()
+            self._title_parts = None
+        elif tag == 'h4' and self._video_title is not None:
+            position, parts = self._video_title
+            if PLACEHOLDER_VIDEO_TITLE_PATTERN.match("".join(parts).strip()):
+                # 이 경우 원래 제목을 복구할 수 없으므로 경고 메시지로 대체
+                self._out[position:-1] = [PLACEHOLDER_VIDEO_TITLE_REPLACEMENT]
+            self._video_title = None
+        elif tag == 'section' and self._section is not None and 'section' not in self._open_tags:
+            section = self._section
+            self._section = None
+            if section["title"] and section["title"] in self._seen_titles:
+                # 중복 섹션 제거
+                del self._out[section["start"]:]
+                return
+            if section["title"]:
+                self._seen_titles.add(section["title"])
+            self.sections.append({
+                "class": section["class"],
+                "title": section["title"],
+                "html": "".join(self._out[section["start"]:]),
+            })
+
+    def handle_data(self, data):
+        if self._dropped_depth:
+            return
+        if not data.strip():
+            # 블록 태그 사이의 줄바꿈/들여쓰기는 버리고, 텍스트/인라인 태그 뒤의 공백은 다음 텍스트 앞에 한 칸으로 넣음
+            self._pending_space = self._pending_space or self._last_inline
+            return
+        self._emit(escape(data, quote=False), True)
+        self._add_text(data)
+
+    def _add_text(self, text):
+        if self._title_parts is not None:
+            self._title_parts.append(text)
+        if self._video_title is not None:
+            self._video_title[1].append(text)
+
+    def _emit(self, piece, inline):
+        if inline and self._pending_space:
+            self._out.append(" ")
+            self._add_text(" ")
+        self._pending_space = False
+        self._last_inline = inline
+        self._out.append(piece)
+
+    def close(self):
+        super().close()
+        while self._open_tags:
+            self._close(self._open_tags.pop())
+
+    @property
+    def html(self):
+        return "".join(self._out).strip()
+
+
+def sanitize(summary):
+    """요약 원문에서 메타설명을 지우고 허용 목록으로 정제한 (HTML, 섹션 목록)"""
+    sanitizer = SummaryHTMLSanitizer()
+    sanitizer.feed(META_TEXT_PATTERN.sub("", summary))
+    sanitizer.close()
+    return sanitizer.html, sanitizer.sections
@@ -0,0 +1,147 @@
+import logging
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 HTTP 상태 코드 (요청 한도 초과 및 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class ConnectionStats:
+    """보낸 요청 수와 새로 연 연결 수를 기록하여 연결 재사용률을 계산"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.new_connections = 0
+        self.new_connections_by_host = {}
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_new_connection(self, host):
+        with self._lock:
+            self.new_connections += 1
+            self.new_connections_by_host[host] = self.new_connections_by_host.get(host, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            reused = max(self.requests - self.new_connections, 0)
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "new_connections": self.new_connections,
+                "reused_connections": reused,
+                "reuse_ratio": round(reused / self.requests, 3) if self.requests else 0.0,
+                "new_connections_by_host": dict(self.new_connections_by_host),
+            }
+
+
+def _counting_pool_class(base, stats):
+    """새 연결을 만들 때마다 stats에 기록하는 urllib3 연결 풀 클래스 생성"""
+    class CountingConnectionPool(base):
+        def _new_conn(self):
+            stats.record_new_connection(self.host)
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    def __init__(self, stats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self._stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self._stats),
+        }
+
+
+class HttpClient:
+    """
+    외부 API 호출에 공통으로 사용하는 keep-alive 연결 풀 HTTP 클라이언트
+    호스트별 최대 연결 수(pool_maxsize)를 넘는 요청은 연결이 반납될 때까지 대기하고,
+    429/5xx 응답과 연결 오류는 지터를 준 지수 백오프로 재시도
+    호출마다 비용이 드는 API는 before_retry 콜백으로 재시도마다 비용을 차감하고, False를 반환하면 재시도하지 않음
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=20, timeout=(3.05, 15),
+                 max_retries=3, backoff_base=0.5, backoff_max=8.0):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = ConnectionStats()
+
+        adapter = _CountingHTTPAdapter(
+            self.stats,
+            pool_connections=pool_connections,  # 연결 풀을 유지할 호스트 수
+            pool_maxsize=pool_maxsize,  # 호스트별 최대 동시 연결 수
+            pool_block=True,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method, url, before_retry=None, **kwargs):
+        """
+        재시도 정책을 적용하여 요청 (마지막 시도의 응답을 그대로 반환하거나 예외 발생)
+        before_retry: 재시도 직전마다 호출하는 함수 (False를 반환하면 재시도 없이 이번 응답/예외로 끝냄)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(self.max_retries + 1):
+            is_last_attempt = attempt == self.max_retries
+            self.stats.record_request()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if is_last_attempt or not self._allow_retry(before_retry):
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"{method} {url} 연결 오류, {delay:.2f}초 후 재시도: {str(e)}")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or is_last_attempt:
+                    return response
+                if not self._allow_retry(before_retry):
+                    return response
+                delay = self._retry_after(response) or self._backoff_delay(attempt)
+                logger.warning(f"{method} {url} 응답 {response.status_code}, {delay:.2f}초 후 재시도")
+                response.close()
+
+            self.stats.record_retry()
+            time.sleep(delay)
+
+    @staticmethod
+    def _allow_retry(before_retry):
+        return before_retry is None or before_retry() is not False
+
+    def _backoff_delay(self, attempt):
+        # full jitter: 0 ~ min(최대 대기, 기본 대기 * 2^attempt) 사이에서 무작위 선택
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after(self, response):
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return None
@@ -1,18 +1,61 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from driver_pool import checkout_driver, return_driver
+from page_waits import PageWaiter
+from work24_crawler import crawl_pages_with_driver, extract_rows, page_url, search_url
 
 class JobService:
+    max_pages = 10
+
+    def __init__(self, driver_pool=None, scheduler=None, page_waiter=None):
+        self.driver_pool = driver_pool
+        self.scheduler = scheduler  # driver_pool과 함께 있으면 결과 페이지를 동시에 가져옴
+        self.page_waiter = page_waiter or PageWaiter()
+
+    def _process_job_row(self, row):
+        row_id = row["id"]
+        if not row_id:
+            return None
+
+        data = list(row["cells"])
+        
+        location = "위치 정보 없음"
+        if len(data) > 1:
+            position_info = data[1].split('\n')
+            if len(position_info) > 3:
+                location = position_info[-1]
+                data[1] = '\n'.join(position_info[:-1])
+        
+        links = row["links"]
+        second_link = links[1] if len(links) > 1 else "없음"
+
+        job_data = {
+            "id": row_id, 
+            "data": data, 
+            "second_link": second_link,
+            "source": "worknet",
+            "location": location
+        }
+        return job_data
+
     def get_job_listings(self, keyword: str):
+        if self.driver_pool is not None and self.scheduler is not None:
+            target_url = search_url(keyword)
+            urls = [page_url(target_url, page_index) for page_index in range(1, self.max_pages + 1)]
+            all_data = crawl_pages_with_driver(
+                self.scheduler, self.driver_pool, urls, self._process_job_row, self.page_waiter
+            )
+            print(f"[INFO] 총 {len(all_data)}개의 채용 공고 수집 완료!")
+            return all_data
+
         options = Options()
         options.add_argument("--headless")
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
 
-        driver = webdriver.Chrome(options=options)
+        driver = checkout_driver(self.driver_pool, options)
         try:
             url = "https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do"
             print(f"[INFO] 접속 중: {url}")
@@ -31,6 +74,7 @@ class JobService:
                 search_button = WebDriverWait(driver, 10).until(
                     EC.element_to_be_clickable((By.CLASS_NAME, "btn.large.type01.fill.wd180px"))
                 )
+                before = self.page_waiter.snapshot(driver)
                 driver.execute_script("arguments[0].click();", search_button)
             except Exception as e:
                 print(f"[ERROR] 검색 버튼 클릭 실패: {e}")
@@ -38,53 +82,27 @@ class JobService:
 
             all_data = []
             page_index = 2
+            wait_kind = "search"
 
             while True:
                 try:
-                    WebDriverWait(driver, 10).until_not(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.blockUI.blockOverlay"))
-                    )
-                    
-                    results_table = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "box_table.type_pd24"))
-                    )
+                    results_table = self.page_waiter.wait_for_results(driver, before, wait_kind)
                     
-                    rows = results_table.find_elements(By.TAG_NAME, "tr")
+                    rows = extract_rows(driver, results_table)
                     for row in rows:
-                        row_id = row.get_attribute("id")
-                        if not row_id:
-                            continue
-
-                        columns = row.find_elements(By.TAG_NAME, "td")
-                        data = [col.text.strip() for col in columns]
-                        
-                        location = "위치 정보 없음"
-                        if len(data) > 1:
-                            position_info = data[1].split('\n')
-                            if len(position_info) > 3:
-                                location = position_info[-1]
-                                data[1] = '\n'.join(position_info[:-1])
-                        
-                        links = [a.get_attribute("href") for a in row.find_elements(By.TAG_NAME, "a") if a.get_attribute("href")]
-                        second_link = links[1] if len(links) > 1 else "없음"
-
-                        job_data = {
-                            "id": row_id, 
-                            "data": data, 
-                            "second_link": second_link,
-                            "source": "worknet",
-                            "location": location
-                        }
-                        all_data.append(job_data)
+                        job_data = self._process_job_row(row)
+                        if job_data:
+                            all_data.append(job_data)
 
                     next_buttons = driver.find_elements(By.XPATH, f"//*[@id='mForm']/div[2]/div/div[2]/div/div/div/button[{page_index}]")
                     if not next_buttons:
                         print("[INFO] 마지막 페이지 도달")
                         break
 
+                    before = self.page_waiter.snapshot(driver)
                     driver.execute_script("arguments[0].click();", next_buttons[0])
                     page_index += 1
-                    time.sleep(2)
+                    wait_kind = "page"
                 except Exception as e:
                     print(f"[ERROR] 크롤링 중 오류 발생: {e}")
                     break
@@ -92,4 +110,4 @@ class JobService:
             print(f"[INFO] 총 {len(all_data)}개의 채용 공고 수집 완료!")
             return all_data
         finally:
-            driver.quit()
\ No newline at end of file
+            return_driver(driver, self.driver_pool)
\ No newline at end of file
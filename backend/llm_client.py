@@ -0,0 +1,330 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+import openai
+from openai import error as openai_error
+
+logger = logging.getLogger(__name__)
+
+# 1K 토큰당 예상 비용 (USD, 입력/출력) - 모델 가격이 바뀌면 함께 수정
+MODEL_PRICES_PER_1K = {
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+}
+
+# 재시도할 OpenAI 오류 (요청 한도 초과는 동시 요청 수도 줄임)
+RETRYABLE_ERRORS = (
+    openai_error.RateLimitError,
+    openai_error.Timeout,
+    openai_error.APIConnectionError,
+    openai_error.ServiceUnavailableError,
+    openai_error.TryAgain,
+    asyncio.TimeoutError,
+)
+
+
+class StreamTimeoutError(asyncio.TimeoutError):
+    """스트리밍 응답의 다음 조각이 idle 제한 시간 안에 오지 않았거나 전체 제한 시간을 넘김"""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 방식으로 동시 요청 수를 조절하는 제한기 (LLMClient의 이벤트 루프 안에서만 사용)
+    성공하면 현재 한도만큼 성공할 때마다 한도를 1씩 늘리고(additive increase),
+    429 응답을 받으면 한도를 backoff_ratio배로 줄임(multiplicative decrease, cooldown 동안은 한 번만)
+    """
+
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=16, backoff_ratio=0.5, cooldown=1.0):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.rate_limited = 0
+        self._last_decrease = 0.0
+        self._condition = None
+
+    async def __aenter__(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self):
+        self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def on_rate_limited(self):
+        self.rate_limited += 1
+        now = time.monotonic()
+        if now - self._last_decrease >= self.cooldown:
+            self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+            self._last_decrease = now
+            logger.warning(f"OpenAI 요청 한도 초과, 동시 요청 수를 {int(self.limit)}개로 줄입니다.")
+
+    def stats(self):
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "rate_limited": self.rate_limited,
+        }
+
+
+class UsageStats:
+    """엔드포인트별 요청 수, 프롬프트/완성 토큰 수, 오류 수와 예상 비용 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_endpoint = {}
+
+    def record(self, endpoint, model, prompt_tokens=0, completion_tokens=0, latency=0.0,
+               retries=0, error=False, estimated=False):
+        with self._lock:
+            stats = self._by_endpoint.setdefault(endpoint, {
+                "requests": 0, "errors": 0, "retries": 0,
+                "prompt_tokens": 0, "completion_tokens": 0, "estimated_tokens": 0,
+                "latency_seconds": 0.0, "cost_usd": 0.0,
+            })
+            stats["requests"] += 1
+            stats["retries"] += retries
+            stats["latency_seconds"] += latency
+            if error:
+                stats["errors"] += 1
+                return
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+            if estimated:
+                stats["estimated_tokens"] += prompt_tokens + completion_tokens
+            input_price, output_price = MODEL_PRICES_PER_1K.get(model, (0.0, 0.0))
+            stats["cost_usd"] += prompt_tokens / 1000 * input_price + completion_tokens / 1000 * output_price
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                endpoint: {
+                    **stats,
+                    "latency_seconds": round(stats["latency_seconds"], 3),
+                    "cost_usd": round(stats["cost_usd"], 6),
+                }
+                for endpoint, stats in self._by_endpoint.items()
+            }
+
+
+class LLMClient:
+    """
+    OpenAI ChatCompletion 비동기 클라이언트
+    전용 스레드의 이벤트 루프에서 openai.ChatCompletion.acreate를 실행하고 aiohttp 세션(keep-alive)을 공유
+    - 동시 요청 수는 AdaptiveConcurrencyLimiter가 429 응답에 맞춰 조절
+    - 요청마다 timeout을 걸고, 일시적인 오류는 지터를 준 지수 백오프로 재시도
+    - 스트리밍 응답은 조각 사이 대기(stream_idle_timeout)와 전체 시간(stream_timeout)을 제한하고 넘기면 StreamTimeoutError
+    - 엔드포인트별 토큰 사용량 기록 (스트리밍 응답은 usage가 없으므로 token_counter로 추정)
+    api_base를 바꾸면 로컬 OpenAI 호환 스텁 서버로 부하 테스트 가능
+    동기 코드(스레드풀)에서는 complete/stream/complete_many를 사용
+    """
+
+    def __init__(self, api_key=None, api_base=None, model="gpt-3.5-turbo", token_counter=None,
+                 initial_concurrency=4, max_concurrency=16, timeout=60.0,
+                 stream_idle_timeout=30.0, stream_timeout=300.0,
+                 max_retries=3, backoff_base=1.0, backoff_max=20.0):
+        self.api_key = api_key
+        self.api_base = api_base
+        self.model = model
+        self.token_counter = token_counter
+        self.timeout = timeout
+        self.stream_idle_timeout = stream_idle_timeout
+        self.stream_timeout = stream_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limiter = AdaptiveConcurrencyLimiter(initial_limit=initial_concurrency, max_limit=max_concurrency)
+        self.usage = UsageStats()
+
+        self._session = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-client", daemon=True)
+        self._thread.start()
+
+    # ---- 동기 코드에서 사용하는 메서드 ----
+
+    def complete(self, messages, endpoint, **params):
+        """완성 텍스트를 반환 (호출한 스레드는 결과가 나올 때까지 대기)"""
+        return self._run(self.acomplete(messages, endpoint, **params))
+
+    def complete_many(self, requests, endpoint, concurrency=None, **params):
+        """여러 메시지 목록을 동시에 요청하고 결과를 요청 순서대로 반환 (concurrency: 이 호출의 동시 요청 수 상한)"""
+        return self._run(self.acomplete_many(requests, endpoint, concurrency, **params))
+
+    def stream(self, messages, endpoint, **params):
+        """생성되는 텍스트 조각을 차례로 내보내는 동기 제너레이터"""
+        chunks = self.astream(messages, endpoint, **params)
+        try:
+            while True:
+                try:
+                    yield self._run(chunks.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(chunks.aclose())
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    # ---- 이벤트 루프 안에서 실행되는 메서드 ----
+
+    async def acomplete(self, messages, endpoint, **params):
+        response = await self._request(messages, endpoint, stream=False, **params)
+        return response.choices[0].message.content.strip()
+
+    async def acomplete_many(self, requests, endpoint, concurrency=None, **params):
+        semaphore = asyncio.Semaphore(concurrency or len(requests) or 1)
+
+        async def run(messages):
+            async with semaphore:
+                return await self.acomplete(messages, endpoint, **params)
+
+        return await asyncio.gather(*(run(messages) for messages in requests))
+
+    async def astream(self, messages, endpoint, **params):
+        response = await self._request(messages, endpoint, stream=True, **params)
+        started = time.monotonic()
+        parts = []
+        error = False
+        deadline = started + self.stream_timeout
+        try:
+            async with self.limiter:
+                while True:
+                    try:
+                        chunk = await self._next_chunk(response, deadline)
+                    except StopAsyncIteration:
+                        break
+                    delta = chunk["choices"][0]["delta"].get("content")
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+        except BaseException:
+            error = True
+            raise
+        finally:
+            if hasattr(response, "aclose"):
+                await response.aclose()
+            self._record_stream_usage(endpoint, messages, "".join(parts), time.monotonic() - started, error)
+
+    async def _next_chunk(self, response, deadline):
+        """다음 응답 조각을 기다림 (idle 제한과 남은 전체 시간 중 짧은 쪽까지만)"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise StreamTimeoutError(f"스트리밍 응답이 {self.stream_timeout:g}초 안에 끝나지 않았습니다.")
+        try:
+            return await asyncio.wait_for(response.__anext__(), timeout=min(self.stream_idle_timeout, remaining))
+        except asyncio.TimeoutError:
+            if self.stream_idle_timeout < remaining:
+                raise StreamTimeoutError(f"스트리밍 응답이 {self.stream_idle_timeout:g}초 동안 멈췄습니다.") from None
+            raise StreamTimeoutError(f"스트리밍 응답이 {self.stream_timeout:g}초 안에 끝나지 않았습니다.") from None
+
+    async def _request(self, messages, endpoint, stream, **params):
+        """재시도 정책과 동시 요청 제한을 적용하여 ChatCompletion 요청 (스트리밍이면 응답 제너레이터 반환)"""
+        self._use_session()
+        started = time.monotonic()
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.limiter:
+                    response = await asyncio.wait_for(
+                        openai.ChatCompletion.acreate(
+                            model=self.model,
+                            messages=messages,
+                            stream=stream,
+                            api_key=self.api_key,
+                            api_base=self.api_base,
+                            request_timeout=self.timeout,
+                            **params
+                        ),
+                        timeout=self.timeout,
+                    )
+                self.limiter.on_success()
+                if not stream:
+                    usage = response.get("usage") or {}
+                    self.usage.record(
+                        endpoint, self.model,
+                        prompt_tokens=usage.get("prompt_tokens", 0),
+                        completion_tokens=usage.get("completion_tokens", 0),
+                        latency=time.monotonic() - started,
+                        retries=attempt,
+                    )
+                return response
+            except Exception as e:
+                if not self._is_retryable(e):
+                    self.usage.record(endpoint, self.model, latency=time.monotonic() - started,
+                                      retries=attempt, error=True)
+                    raise
+                if isinstance(e, openai_error.RateLimitError):
+                    self.limiter.on_rate_limited()
+                if attempt == self.max_retries:
+                    self.usage.record(endpoint, self.model, latency=time.monotonic() - started,
+                                      retries=attempt, error=True)
+                    raise
+                delay = self._retry_after(e) or self._backoff_delay(attempt)
+                logger.warning(f"OpenAI {endpoint} 요청 실패({type(e).__name__}), {delay:.2f}초 후 재시도")
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _is_retryable(error):
+        # 일시적인 오류와 5xx 서버 오류(APIError)는 재시도, 요청 자체가 잘못된 4xx 오류는 바로 실패
+        if isinstance(error, RETRYABLE_ERRORS):
+            return True
+        status = getattr(error, "http_status", None)
+        return isinstance(error, openai_error.APIError) and status is not None and status >= 500
+
+    def _use_session(self):
+        # openai 0.28은 aiosession ContextVar에 세션이 있으면 요청마다 새 세션을 만들지 않고 재사용
+        if self._session is None:
+            import aiohttp
+            self._session = aiohttp.ClientSession()
+        openai.aiosession.set(self._session)
+
+    def close(self):
+        """공유 aiohttp 세션을 닫고 이벤트 루프 스레드를 종료"""
+        if self._session is not None:
+            self._run(self._session.close())
+            self._session = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def _record_stream_usage(self, endpoint, messages, completion, latency, error):
+        if error or self.token_counter is None:
+            self.usage.record(endpoint, self.model, latency=latency, error=error)
+            return
+        prompt_tokens = sum(self.token_counter.count(message["content"]) for message in messages)
+        self.usage.record(
+            endpoint, self.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=self.token_counter.count(completion),
+            latency=latency,
+            estimated=True,
+        )
+
+    def _backoff_delay(self, attempt):
+        # full jitter: 0 ~ min(최대 대기, 기본 대기 * 2^attempt) 사이에서 무작위 선택
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after(self, error):
+        headers = getattr(error, "headers", None) or {}
+        retry_after = headers.get("retry-after") or headers.get("Retry-After")
+        if retry_after and str(retry_after).isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return None
+
+    def stats(self):
+        return {
+            "model": self.model,
+            "api_base": self.api_base or openai.api_base,
+            "concurrency": self.limiter.stats(),
+            "usage_by_endpoint": self.usage.snapshot(),
+        }
@@ -1,18 +1,34 @@
 from fastapi import FastAPI, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from youtube_service import YouTubeService
-from summary_service import SummaryService
+from transcript_store import TranscriptStore
+from cache import DiskCache
+from search_cache import SearchResultCache
+from http_client import HttpClient
+from quota import QuotaTracker
+from singleflight import SingleFlight
+from summary_cache import SummaryCache
+from llm_client import LLMClient
+from token_budget import load_token_counter
+from summary_service import SummaryService, sse_event, SUMMARY_FORMAT_INLINE
+from precompute import CategoryPrecomputer, PrecomputeScheduler, precomputed_key, preset_targets, PRESET_KEYWORDS
+from work24_crawler import Work24Crawler
+from crawl_scheduler import CrawlScheduler, HostRateLimiter
+from page_waits import PageWaiter
+from driver_pool import DriverPool
 from job_service import JobService
 from d_job_service import DisabilityJobService
 from fastapi import HTTPException  
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 from d_sup import *
 from o_job_service import SeniorJobService
 import logging
 from o_sup import *
 from uuid import uuid4
+import os
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -36,20 +52,272 @@ app.add_middleware(
 # 서비스 초기화
 YOUTUBE_API_KEY = "secret"
 OPENAI_API_KEY = "secret"
+# 카테고리 검색 시 YouTube 요청 동시 실행 수 제한
+YOUTUBE_MAX_WORKERS = int(os.getenv("YOUTUBE_MAX_WORKERS", "8"))
+# 외부 API 호출용 HTTP 연결 풀 설정 (호스트별 최대 연결 수, 타임아웃은 초 단위)
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "15"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+# YouTube Data API 일일 할당량 (단위) 및 단계별 기준 비율
+YOUTUBE_DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+YOUTUBE_QUOTA_REDUCED_RATIO = float(os.getenv("YOUTUBE_QUOTA_REDUCED_RATIO", "0.3"))
+YOUTUBE_QUOTA_RESERVE_RATIO = float(os.getenv("YOUTUBE_QUOTA_RESERVE_RATIO", "0.1"))
+# 자막 저장소 설정 (최대 크기는 바이트, TTL은 초 단위)
+TRANSCRIPT_STORE_MAX_BYTES = int(os.getenv("TRANSCRIPT_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+TRANSCRIPT_STORE_TTL = int(os.getenv("TRANSCRIPT_STORE_TTL", str(6 * 60 * 60)))
+TRANSCRIPT_STORE_NEGATIVE_TTL = int(os.getenv("TRANSCRIPT_STORE_NEGATIVE_TTL", str(30 * 60)))
+# 재시작 후에도 유지되는 자막 디스크 캐시 설정 (경로를 비우면 사용하지 않음)
+TRANSCRIPT_CACHE_PATH = os.getenv("TRANSCRIPT_CACHE_PATH", "transcript_cache.sqlite3")
+TRANSCRIPT_CACHE_TTL = int(os.getenv("TRANSCRIPT_CACHE_TTL", str(7 * 24 * 60 * 60)))
+TRANSCRIPT_CACHE_MAX_BYTES = int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# 요약 캐시 설정 (메모리 계층 + 디스크 계층, 경로를 비우면 디스크 계층은 사용하지 않음)
+SUMMARY_CACHE_MAX_BYTES = int(os.getenv("SUMMARY_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+SUMMARY_CACHE_PATH = os.getenv("SUMMARY_CACHE_PATH", "summary_cache.sqlite3")
+SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", str(30 * 24 * 60 * 60)))
+SUMMARY_CACHE_DISK_MAX_BYTES = int(os.getenv("SUMMARY_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+# 긴 자막 map-reduce 요약 설정
+SUMMARY_MAP_REDUCE = os.getenv("SUMMARY_MAP_REDUCE", "true").lower() in ("1", "true", "yes")
+SUMMARY_MAP_CONCURRENCY = int(os.getenv("SUMMARY_MAP_CONCURRENCY", "4"))
+# 요약 요청별 자막 토큰 예산
+SUMMARY_INPUT_TOKENS = int(os.getenv("SUMMARY_INPUT_TOKENS", "2000"))
+SUMMARY_COMPARISON_INPUT_TOKENS = int(os.getenv("SUMMARY_COMPARISON_INPUT_TOKENS", "3000"))
+SUMMARY_MAP_CHUNK_TOKENS = int(os.getenv("SUMMARY_MAP_CHUNK_TOKENS", "2500"))
+SUMMARY_REDUCE_INPUT_TOKENS = int(os.getenv("SUMMARY_REDUCE_INPUT_TOKENS", "3000"))
+SUMMARY_MAP_MAX_CHUNKS = int(os.getenv("SUMMARY_MAP_MAX_CHUNKS", "24"))
+# 요약 전 로컬 추출 단계 (off: 기존 경로, on: 추출한 문장으로 요약, compare: 기존 경로로 요약하고 절감량만 기록)
+SUMMARY_EXTRACTIVE = os.getenv("SUMMARY_EXTRACTIVE", "off").lower()
+# OpenAI 클라이언트 설정 (API_BASE를 바꾸면 로컬 OpenAI 호환 스텁 서버로 테스트 가능, 타임아웃은 초 단위)
+OPENAI_API_BASE = os.getenv("OPENAI_API_BASE") or None
+LLM_INITIAL_CONCURRENCY = int(os.getenv("LLM_INITIAL_CONCURRENCY", "4"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "60"))
+# 스트리밍 응답 제한 시간 (조각 사이 최대 대기, 응답 전체, 초 단위)
+LLM_STREAM_IDLE_TIMEOUT = float(os.getenv("LLM_STREAM_IDLE_TIMEOUT", "30"))
+LLM_STREAM_TIMEOUT = float(os.getenv("LLM_STREAM_TIMEOUT", "300"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+# 카테고리 검색 결과 캐시 설정 (FRESH_TTL 이후에는 오래된 결과를 반환하면서 백그라운드 갱신)
+SEARCH_CACHE_FRESH_TTL = int(os.getenv("SEARCH_CACHE_FRESH_TTL", str(60 * 60)))
+SEARCH_CACHE_STALE_TTL = int(os.getenv("SEARCH_CACHE_STALE_TTL", str(24 * 60 * 60)))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512"))
+# 검색 결과 디스크 계층 (재시작 후/precompute 배치와 공유, 경로를 비우면 사용하지 않음)
+SEARCH_CACHE_PATH = os.getenv("SEARCH_CACHE_PATH", "search_cache.sqlite3")
+SEARCH_CACHE_DISK_MAX_BYTES = int(os.getenv("SEARCH_CACHE_DISK_MAX_BYTES", str(64 * 1024 * 1024)))
+# 프리셋 카테고리 미리 계산 설정 (INTERVAL은 초 단위, 0이면 서버에서 주기 실행하지 않음)
+PRECOMPUTE_CACHE_PATH = os.getenv("PRECOMPUTE_CACHE_PATH", "precomputed.sqlite3")
+PRECOMPUTE_TTL = int(os.getenv("PRECOMPUTE_TTL", str(2 * 24 * 60 * 60)))
+PRECOMPUTE_MAX_BYTES = int(os.getenv("PRECOMPUTE_MAX_BYTES", str(64 * 1024 * 1024)))
+PRECOMPUTE_INTERVAL = int(os.getenv("PRECOMPUTE_INTERVAL", "0"))
+PRECOMPUTE_WORKERS = int(os.getenv("PRECOMPUTE_WORKERS", "2"))
+# 고용24 채용 목록 크롤링 방식: http(pageIndex별 HTTP 요청 + lxml, 실패 시 Selenium) 또는 selenium
+WORK24_CRAWL_BACKEND = os.getenv("WORK24_CRAWL_BACKEND", "http").lower()
+# 결과 페이지 동시 요청 수와 호스트별 요청 속도 제한 (토큰 버킷: 초당 요청 수, 최대 버스트)
+WORK24_CRAWL_CONCURRENCY = int(os.getenv("WORK24_CRAWL_CONCURRENCY", "5"))
+WORK24_RATE_PER_SECOND = float(os.getenv("WORK24_RATE_PER_SECOND", "5"))
+WORK24_RATE_BURST = int(os.getenv("WORK24_RATE_BURST", "10"))
+# Selenium 크롤러가 공유하는 헤드리스 Chrome 풀
+CHROME_POOL_SIZE = int(os.getenv("CHROME_POOL_SIZE", "2"))
+CHROME_POOL_WARM = int(os.getenv("CHROME_POOL_WARM", "1"))  # 서버 시작 시 미리 띄울 드라이버 수
+CHROME_POOL_MAX_USES = int(os.getenv("CHROME_POOL_MAX_USES", "50"))
+CHROME_POOL_MAX_AGE = int(os.getenv("CHROME_POOL_MAX_AGE", str(30 * 60)))
+CHROME_POOL_ACQUIRE_TIMEOUT = float(os.getenv("CHROME_POOL_ACQUIRE_TIMEOUT", "60"))
+# Selenium 결과 표 로드/페이지 전환 대기 제한 시간 (기록이 쌓이기 전 초기값, 최근 대기 시간으로 조정되는 최소/최대값)
+PAGE_WAIT_INITIAL_TIMEOUT = float(os.getenv("PAGE_WAIT_INITIAL_TIMEOUT", "10"))
+PAGE_WAIT_MIN_TIMEOUT = float(os.getenv("PAGE_WAIT_MIN_TIMEOUT", "2"))
+PAGE_WAIT_MAX_TIMEOUT = float(os.getenv("PAGE_WAIT_MAX_TIMEOUT", "30"))
 
 # 서비스 초기화
 try:
-    youtube_service = YouTubeService(YOUTUBE_API_KEY)
-    summary_service = SummaryService(OPENAI_API_KEY)
-    job_service = JobService()
-    seniorjob_service = SeniorJobService()
-    disability_job_service = DisabilityJobService()
+    http_client = HttpClient(
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+        max_retries=HTTP_MAX_RETRIES,
+    )
+    single_flight = SingleFlight()
+    quota_tracker = QuotaTracker(
+        daily_budget=YOUTUBE_DAILY_QUOTA,
+        reduced_ratio=YOUTUBE_QUOTA_REDUCED_RATIO,
+        reserve_ratio=YOUTUBE_QUOTA_RESERVE_RATIO,
+    )
+    transcript_disk_cache = None
+    if TRANSCRIPT_CACHE_PATH:
+        transcript_disk_cache = DiskCache(
+            TRANSCRIPT_CACHE_PATH,
+            ttl=TRANSCRIPT_CACHE_TTL,
+            max_bytes=TRANSCRIPT_CACHE_MAX_BYTES,
+            table="transcripts",
+        )
+    transcript_store = TranscriptStore(
+        max_bytes=TRANSCRIPT_STORE_MAX_BYTES,
+        ttl=TRANSCRIPT_STORE_TTL,
+        negative_ttl=TRANSCRIPT_STORE_NEGATIVE_TTL,
+        disk_cache=transcript_disk_cache,
+    )
+    search_disk_cache = None
+    if SEARCH_CACHE_PATH:
+        search_disk_cache = DiskCache(
+            SEARCH_CACHE_PATH,
+            ttl=SEARCH_CACHE_STALE_TTL,
+            max_bytes=SEARCH_CACHE_DISK_MAX_BYTES,
+            table="searches",
+        )
+    search_cache = SearchResultCache(
+        fresh_ttl=SEARCH_CACHE_FRESH_TTL,
+        stale_ttl=SEARCH_CACHE_STALE_TTL,
+        max_entries=SEARCH_CACHE_MAX_ENTRIES,
+        disk_cache=search_disk_cache,
+    )
+    youtube_service = YouTubeService(
+        YOUTUBE_API_KEY,
+        max_workers=YOUTUBE_MAX_WORKERS,
+        transcript_store=transcript_store,
+        search_cache=search_cache,
+        http_client=http_client,
+        quota_tracker=quota_tracker,
+        single_flight=single_flight,
+    )
+    summary_disk_cache = None
+    if SUMMARY_CACHE_PATH:
+        summary_disk_cache = DiskCache(
+            SUMMARY_CACHE_PATH,
+            ttl=SUMMARY_CACHE_TTL,
+            max_bytes=SUMMARY_CACHE_DISK_MAX_BYTES,
+            table="summaries",
+        )
+    summary_cache = SummaryCache(
+        max_bytes=SUMMARY_CACHE_MAX_BYTES,
+        ttl=SUMMARY_CACHE_TTL,
+        disk_cache=summary_disk_cache,
+    )
+    token_counter = load_token_counter()
+    llm_client = LLMClient(
+        api_key=OPENAI_API_KEY,
+        api_base=OPENAI_API_BASE,
+        model=SummaryService.MODEL,
+        token_counter=token_counter,
+        initial_concurrency=LLM_INITIAL_CONCURRENCY,
+        max_concurrency=LLM_MAX_CONCURRENCY,
+        timeout=LLM_REQUEST_TIMEOUT,
+        stream_idle_timeout=LLM_STREAM_IDLE_TIMEOUT,
+        stream_timeout=LLM_STREAM_TIMEOUT,
+        max_retries=LLM_MAX_RETRIES,
+    )
+    summary_service = SummaryService(
+        OPENAI_API_KEY,
+        single_flight=single_flight,
+        summary_cache=summary_cache,
+        map_reduce=SUMMARY_MAP_REDUCE,
+        map_concurrency=SUMMARY_MAP_CONCURRENCY,
+        summary_input_tokens=SUMMARY_INPUT_TOKENS,
+        comparison_input_tokens=SUMMARY_COMPARISON_INPUT_TOKENS,
+        map_chunk_tokens=SUMMARY_MAP_CHUNK_TOKENS,
+        reduce_input_tokens=SUMMARY_REDUCE_INPUT_TOKENS,
+        max_map_chunks=SUMMARY_MAP_MAX_CHUNKS,
+        token_counter=token_counter,
+        llm_client=llm_client,
+        extractive_mode=SUMMARY_EXTRACTIVE,
+    )
+    precomputed_store = DiskCache(
+        PRECOMPUTE_CACHE_PATH,
+        ttl=PRECOMPUTE_TTL,
+        max_bytes=PRECOMPUTE_MAX_BYTES,
+        table="precomputed",
+    )
+    # 비교 요약 입력은 /compare-category와 같은 함수로 채움 (prepare_comparison_videos는 아래에 정의, 호출 시점에 조회)
+    precomputer = CategoryPrecomputer(
+        youtube_service,
+        summary_service,
+        lambda video_data_list: prepare_comparison_videos(video_data_list),
+        precomputed_store,
+        workers=PRECOMPUTE_WORKERS,
+        quota_tracker=quota_tracker,
+    )
+    # HTTP/Selenium 크롤러가 같은 스케줄러와 속도 제한을 공유
+    crawl_scheduler = CrawlScheduler(
+        max_workers=WORK24_CRAWL_CONCURRENCY,
+        limiter=HostRateLimiter(rate=WORK24_RATE_PER_SECOND, burst=WORK24_RATE_BURST),
+    )
+    # 고용24 목록 페이지도 같은 keep-alive 연결 풀을 사용 (None이면 Selenium으로만 크롤링)
+    work24_crawler = (
+        Work24Crawler(http_client, scheduler=crawl_scheduler) if WORK24_CRAWL_BACKEND == "http" else None
+    )
+    driver_pool = DriverPool(
+        size=CHROME_POOL_SIZE,
+        max_uses=CHROME_POOL_MAX_USES,
+        max_age=CHROME_POOL_MAX_AGE,
+        acquire_timeout=CHROME_POOL_ACQUIRE_TIMEOUT,
+    )
+    page_waiter = PageWaiter(
+        initial_timeout=PAGE_WAIT_INITIAL_TIMEOUT,
+        min_timeout=PAGE_WAIT_MIN_TIMEOUT,
+        max_timeout=PAGE_WAIT_MAX_TIMEOUT,
+    )
+    job_service = JobService(driver_pool, crawl_scheduler, page_waiter)
+    seniorjob_service = SeniorJobService(driver_pool, crawl_scheduler, page_waiter)
+    disability_job_service = DisabilityJobService(driver_pool, crawl_scheduler, page_waiter)
     
     logger.info("서비스 초기화 완료")
 except Exception as e:
     logger.error(f"서비스 초기화 중 오류 발생: {str(e)}")
     raise
 
+@app.get("/metrics")
+async def get_metrics():
+    """캐시 적중률 등 내부 상태 지표를 반환합니다."""
+    return {
+        "transcript_store": transcript_store.stats(),
+        "search_cache": search_cache.stats(),
+        "summary_cache": summary_cache.stats(),
+        "http_client": http_client.stats.snapshot(),
+        "youtube_quota": quota_tracker.stats(),
+        "single_flight": single_flight.stats(),
+        "llm": llm_client.stats(),
+        "extractive": summary_service.extractive_stats.snapshot(),
+        "precompute": precomputer.stats(),
+        "work24_crawler": work24_crawler.stats() if work24_crawler is not None else None,
+        "crawl_scheduler": crawl_scheduler.stats(),
+        "driver_pool": driver_pool.stats(),
+        "page_waits": page_waiter.stats(),
+    }
+
+@app.on_event("startup")
+def start_precompute_scheduler():
+    """PRECOMPUTE_INTERVAL이 설정되어 있으면 프리셋 카테고리 미리 계산을 주기적으로 실행"""
+    if PRECOMPUTE_INTERVAL > 0:
+        PrecomputeScheduler(precomputer, preset_targets(), PRECOMPUTE_INTERVAL).start()
+        logger.info(f"카테고리 미리 계산 스케줄러 시작 ({PRECOMPUTE_INTERVAL}초 간격)")
+
+@app.on_event("startup")
+def warm_driver_pool():
+    """CHROME_POOL_WARM개의 Chrome 드라이버를 백그라운드에서 미리 띄움"""
+    if CHROME_POOL_WARM > 0:
+        driver_pool.warm(CHROME_POOL_WARM)
+
+@app.on_event("shutdown")
+def close_llm_client():
+    llm_client.close()
+
+@app.on_event("shutdown")
+def close_driver_pool():
+    driver_pool.close()
+
+@app.on_event("shutdown")
+def close_crawl_scheduler():
+    crawl_scheduler.close()
+
+@app.get("/precomputed/{mode}/{category_id}")
+async def get_precomputed_category(mode: str, category_id: int):
+    """
+    프리셋 직무 카테고리(모드 id)에 대해 미리 계산해 둔 카테고리별 영상, 영상별 요약, 비교 요약을 반환합니다.
+    mode는 senior 또는 disability이며, 아직 계산되지 않았으면 404를 반환합니다.
+    """
+    if mode not in PRESET_KEYWORDS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 모드입니다: {mode}")
+    result = await run_in_threadpool(precomputed_store.get, precomputed_key(mode, category_id))
+    if result is None:
+        raise HTTPException(status_code=404, detail="미리 계산된 결과가 없습니다.")
+    return result
+
 @app.get("/search")
 async def search_videos(keyword: str):
     try:
@@ -69,9 +337,14 @@ async def search_videos_by_category(keyword: str, max_results_per_category: int
     """
     try:
         logger.info(f"카테고리별 영상 검색 시작: {keyword}")
-        results = youtube_service.search_youtube_videos_by_category(keyword, max_results_per_category)
+        results = await run_in_threadpool(
+            youtube_service.search_youtube_videos_by_category, keyword, max_results_per_category
+        )
         logger.info(f"카테고리별 검색 완료")
         return results
+    except HTTPException as he:
+        logger.error(f"HTTP 오류: {str(he)}")
+        raise
     except Exception as e:
         logger.error(f"카테고리별 검색 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -80,18 +353,22 @@ async def search_videos_by_category(keyword: str, max_results_per_category: int
 async def get_video_transcript(
     video_id: str,
     keyword: str = Query(None, description="원본 검색 키워드"),
-    category: str = Query(None, description="비디오 카테고리")
+    category: str = Query(None, description="비디오 카테고리"),
+    summary_format: str = Query(
+        SUMMARY_FORMAT_INLINE, alias="format",
+        description="요약 형식: inline(인라인 CSS + HTML), html(CSS 없는 HTML), sections(섹션 목록 JSON)"
+    )
 ):
     try:
         logger.info(f"트랜스크립트 요청 - Video ID: {video_id}, Keyword: {keyword}, Category: {category}")
         
         # 비디오 정보 가져오기
-        video_info = youtube_service.get_video_info(video_id, keyword, category)
+        video_info = await run_in_threadpool(youtube_service.get_video_info, video_id, keyword, category)
         logger.info(f"비디오 정보 retrieved: {video_info['title']}")
         
-        # 트랜스크립트 가져오기
-        transcript = youtube_service.get_transcript(video_id)
-        logger.info(f"트랜스크립트 길이: {len(transcript) if transcript else 0}")
+        # 트랜스크립트 가져오기 (요약에 필요한 만큼만 읽도록 세그먼트 목록으로 전달)
+        transcript = await run_in_threadpool(youtube_service.get_transcript_segments, video_id)
+        logger.info(f"트랜스크립트 세그먼트 수: {len(transcript) if transcript else 0}")
         
         if not transcript:
             raise HTTPException(status_code=404, detail="자막을 찾을 수 없습니다.")
@@ -103,7 +380,7 @@ async def get_video_transcript(
         }
         
         # 요약 생성
-        summary = summary_service.summarize(transcript, summary_context)
+        summary = await run_in_threadpool(summary_service.summarize, transcript, summary_context, summary_format)
         if not summary:
             raise HTTPException(status_code=500, detail="요약 생성 실패")
             
@@ -120,6 +397,85 @@ async def get_video_transcript(
         logger.error(f"트랜스크립트 처리 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# SSE 응답 헤더 (프록시 버퍼링과 캐싱을 막아 토큰이 바로 전달되도록 함)
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+@app.get("/transcript/{video_id}/stream")
+async def stream_video_transcript(
+    video_id: str,
+    keyword: str = Query(None, description="원본 검색 키워드"),
+    category: str = Query(None, description="비디오 카테고리"),
+    summary_format: str = Query(
+        SUMMARY_FORMAT_INLINE, alias="format",
+        description="요약 형식: inline(인라인 CSS + HTML), html(CSS 없는 HTML), sections(섹션 목록 JSON)"
+    )
+):
+    """
+    /transcript/{video_id}와 같은 요약을 Server-Sent Events로 생성되는 대로 전송합니다.
+    이벤트: video_info → token(생성 중인 텍스트) / section(정제된 섹션 HTML) → done(전체 HTML) 또는 error
+    """
+    try:
+        logger.info(f"트랜스크립트 스트리밍 요청 - Video ID: {video_id}, Keyword: {keyword}, Category: {category}")
+
+        video_info = await run_in_threadpool(youtube_service.get_video_info, video_id, keyword, category)
+        transcript = await run_in_threadpool(youtube_service.get_transcript_segments, video_id)
+        if not transcript:
+            raise HTTPException(status_code=404, detail="자막을 찾을 수 없습니다.")
+
+        summary_context = {
+            "title": video_info["title"],
+            "keyword": keyword or video_info.get("search_keyword", "")
+        }
+        events = summary_service.summarize_stream(transcript, summary_context, summary_format)
+    except HTTPException as he:
+        logger.error(f"HTTP 오류: {str(he)}")
+        raise
+    except Exception as e:
+        logger.error(f"트랜스크립트 스트리밍 준비 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    def event_stream():
+        yield sse_event("video_info", video_info)
+        yield from events
+
+    # 동기 제너레이터는 StreamingResponse가 스레드풀에서 순회하므로 이벤트 루프를 막지 않음
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+def prepare_comparison_videos(video_data_list):
+    """비교할 비디오 목록에 트랜스크립트와 (없으면) 비디오 정보를 채움"""
+    # 비디오 정보가 없는 항목은 배치 호출 한 번으로 미리 가져오기
+    missing_info_ids = [
+        video_data.get("video_id") for video_data in video_data_list
+        if video_data.get("video_id") and not video_data.get("video_info")
+    ]
+    fetched_infos = {}
+    if missing_info_ids:
+        try:
+            fetched_infos = youtube_service.get_video_infos(missing_info_ids)
+        except Exception as e:
+            logger.warning(f"비디오 정보 배치 조회 중 오류: {str(e)}")
+
+    # 각 비디오에 대해 트랜스크립트 가져오기
+    for video_data in video_data_list:
+        video_id = video_data.get("video_id")
+        if not video_id:
+            continue
+            
+        try:
+            # 트랜스크립트 가져오기 (요약 단계에서 예산만큼만 읽도록 세그먼트 목록으로 저장)
+            transcript = youtube_service.get_transcript_segments(video_id)
+            if transcript:
+                video_data["transcript"] = transcript
+            
+            # 비디오 정보 설정 (이미 있으면 생략)
+            if not video_data.get("video_info") and video_id in fetched_infos:
+                video_info = dict(fetched_infos[video_id])
+                video_info["search_keyword"] = video_data.get("keyword") or video_info["search_keyword"]
+                video_info["category"] = video_data.get("category")
+                video_data["video_info"] = video_info
+        except Exception as e:
+            logger.warning(f"비디오 {video_id} 처리 중 오류: {str(e)}")
+
 @app.post("/compare-category")
 async def compare_videos(request_data: dict):
     """
@@ -130,36 +486,18 @@ async def compare_videos(request_data: dict):
         
         video_data_list = request_data.get("video_data_list", [])
         category_name = request_data.get("category_name", "비디오 비교")
+        summary_format = request_data.get("format", SUMMARY_FORMAT_INLINE)
         
         if not video_data_list or len(video_data_list) == 0:
             raise HTTPException(status_code=400, detail="비교할 비디오가 없습니다.")
         
-        # 각 비디오에 대해 트랜스크립트 가져오기
-        for video_data in video_data_list:
-            video_id = video_data.get("video_id")
-            if not video_id:
-                continue
-                
-            try:
-                # 트랜스크립트 가져오기
-                transcript = youtube_service.get_transcript(video_id)
-                if transcript:
-                    video_data["transcript"] = transcript
-                    print(transcript)
-                
-                # 비디오 정보 가져오기 (이미 있으면 생략)
-                if not video_data.get("video_info"):
-                    video_info = youtube_service.get_video_info(
-                        video_id, 
-                        video_data.get("keyword"), 
-                        video_data.get("category")
-                    )
-                    video_data["video_info"] = video_info
-            except Exception as e:
-                logger.warning(f"비디오 {video_id} 처리 중 오류: {str(e)}")
-        
+        # 각 비디오의 트랜스크립트와 비디오 정보 채우기
+        await run_in_threadpool(prepare_comparison_videos, video_data_list)
+
         # 비교 요약 생성
-        comparison_result = summary_service.summarize_multiple_videos(video_data_list, category_name)
+        comparison_result = await run_in_threadpool(
+            summary_service.summarize_multiple_videos, video_data_list, category_name, summary_format
+        )
         print('비교요약결과')
         print(comparison_result)
         
@@ -176,11 +514,38 @@ async def compare_videos(request_data: dict):
         logger.error(f"비디오 비교 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/compare-category/stream")
+async def stream_compare_videos(request_data: dict):
+    """
+    /compare-category와 같은 비교 분석을 Server-Sent Events로 생성되는 대로 전송합니다.
+    이벤트: token(생성 중인 텍스트) / section(정제된 섹션 HTML) → done(전체 HTML) 또는 error
+    """
+    try:
+        logger.info("비디오 비교 분석 스트리밍 시작")
+
+        video_data_list = request_data.get("video_data_list", [])
+        category_name = request_data.get("category_name", "비디오 비교")
+        summary_format = request_data.get("format", SUMMARY_FORMAT_INLINE)
+
+        if not video_data_list or len(video_data_list) == 0:
+            raise HTTPException(status_code=400, detail="비교할 비디오가 없습니다.")
+
+        await run_in_threadpool(prepare_comparison_videos, video_data_list)
+        events = summary_service.summarize_multiple_videos_stream(video_data_list, category_name, summary_format)
+    except HTTPException as he:
+        logger.error(f"HTTP 오류: {str(he)}")
+        raise
+    except Exception as e:
+        logger.error(f"비디오 비교 스트리밍 준비 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
+
 @app.get("/jobs")
 async def get_jobs(keyword: str):
     try:
         logger.info(f"채용 정보 검색 시작: {keyword}")
-        job_listings = job_service.get_job_listings(keyword)
+        job_listings = await run_in_threadpool(job_service.get_job_listings, keyword)
         return JSONResponse(content={"jobs": job_listings})
     except Exception as e:
         logger.error(f"채용 정보 검색 중 오류: {e.with_traceback()}")
@@ -190,8 +555,7 @@ async def get_jobs(keyword: str):
 async def get_jobs(keyword: str):
     try:
         logger.info(f"채용 정보 검색 시작: {keyword}")
-        seniorjob_service=SeniorJobService()
-        job_listings = seniorjob_service.get_senior_jobs(keyword)
+        job_listings = await run_in_threadpool(seniorjob_service.get_senior_jobs, keyword)
         return JSONResponse(content={"jobs": job_listings})
     except Exception as e:
         logger.error(f"채용 정보 검색 중 오류: {e.with_traceback()}")
@@ -203,7 +567,7 @@ async def get_jobs_senior(id:int,keyword: str):
         if id!=8:
             keyword=o_mode_url_mapping[id]
         logger.info(f"채용 정보 검색 시작: {keyword}")
-        job_listings = seniorjob_service.get_senior_jobs(keyword)
+        job_listings = await run_in_threadpool(seniorjob_service.get_senior_jobs, keyword)
         return JSONResponse(content={"jobs": job_listings})
     except Exception as e:
         logger.error(f"채용 정보 검색 중 오류: {e}")
@@ -215,8 +579,7 @@ async def get_jobs_disabled(id:int,keyword: str):
         if id!=8:
             keyword=d_mode_url_mapping[id]
         logger.info(f"장애인 채용 정보 검색 시작: {keyword}")
-        disability_job_service=DisabilityJobService()
-        job_listings = disability_job_service.get_disability_jobs(keyword)
+        job_listings = await run_in_threadpool(disability_job_service.get_disability_jobs, keyword)
         return JSONResponse(content={"jobs": job_listings})
     except Exception as e:
         logger.error(f"채용 정보 검색 중 오류: {e}")
@@ -226,7 +589,7 @@ async def get_jobs_disabled(id:int,keyword: str):
 async def get_disability_jobs(keyword: str):
     try:
         logger.info(f"장애인 채용 정보 검색 시작: {keyword}")
-        jobs = disability_job_service.get_disability_jobs(keyword)
+        jobs = await run_in_threadpool(disability_job_service.get_disability_jobs, keyword)
         return JSONResponse(content={"jobs": jobs})
     except Exception as e:
         logger.error(f"장애인 채용 정보 검색 중 오류: {str(e)}")
@@ -236,10 +599,13 @@ async def get_disability_jobs(keyword: str):
 async def search_disability_videos(keyword: str):
     try:
         logger.info(f"장애인 관련 영상 검색 시작: {keyword}")
-        youtube_service.set_disability_search(True)
-        result = youtube_service.search_youtube_videos_by_category(keyword)
-        youtube_service.set_disability_search(False)
+        result = await run_in_threadpool(
+            youtube_service.search_youtube_videos_by_category, keyword, mode="disability"
+        )
         return result
+    except HTTPException as he:
+        logger.error(f"HTTP 오류: {str(he)}")
+        raise
     except Exception as e:
         logger.error(f"장애인 관련 영상 검색 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -251,10 +617,13 @@ async def search_disability_videos_by_category(keyword: str, max_results_per_cat
     """
     try:
         logger.info(f"장애인 관련 카테고리별 영상 검색 시작: {keyword}")
-        youtube_service.set_disability_search(True)
-        result = youtube_service.search_youtube_videos_by_category(keyword, max_results_per_category)
-        youtube_service.set_disability_search(False)
+        result = await run_in_threadpool(
+            youtube_service.search_youtube_videos_by_category, keyword, max_results_per_category, mode="disability"
+        )
         return result
+    except HTTPException as he:
+        logger.error(f"HTTP 오류: {str(he)}")
+        raise
     except Exception as e:
         logger.error(f"장애인 관련 카테고리별 영상 검색 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -265,10 +634,13 @@ async def search_senior_videos_by_category(keyword: str, max_results_per_categor
     """
     try:
         logger.info(f"고령자 관련 카테고리별 영상 검색 시작: {keyword}")
-        youtube_service.set_senior_search(True)
-        result = youtube_service.search_youtube_videos_by_category(keyword, max_results_per_category)
-        youtube_service.set_senior_search(False)
+        result = await run_in_threadpool(
+            youtube_service.search_youtube_videos_by_category, keyword, max_results_per_category, mode="senior"
+        )
         return result
+    except HTTPException as he:
+        logger.error(f"HTTP 오류: {str(he)}")
+        raise
     except Exception as e:
         logger.error(f"고령자 관련 카테고리별 영상 검색 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -344,7 +716,9 @@ def crawl_task_disabled_dynamic(index: int,task_id:str,target_url:str,keyword=No
         else:
             target_url = f"https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do?&srcKeyword={keyword}&disableEmpHopeGbn=Y%2CD&pageIndex=1"
 
-        data = scrape_data_disabled(progress_callback=update_progress_disabled, target_url=target_url)
+        data = scrape_data_disabled(progress_callback=update_progress_disabled, target_url=target_url,
+                                    crawler=work24_crawler, driver_pool=driver_pool, scheduler=crawl_scheduler,
+                                    waiter=page_waiter)
         # data= disability_job_service.get_disability_jobs(keyword)
         crawl_status_disabled[task_id]["data"]= data
         if crawl_status_disabled[task_id]["progress"] != 100:
@@ -432,7 +806,11 @@ def crawl_task_senior_dynamic(index: int, Keyword=None, task_id=None):
 
         data = scrape_data_senior(
             progress_callback=lambda p, msg: update_progress_senior(task_id, p, msg),
-            target_url=target_url
+            target_url=target_url,
+            crawler=work24_crawler,
+            driver_pool=driver_pool,
+            scheduler=crawl_scheduler,
+            waiter=page_waiter,
         )
         # data=seniorjob_service.get_senior_jobs(Keyword)
         status["data"] = data
@@ -1,13 +1,14 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from fastapi import HTTPException
-import time
 from typing import List, Dict
 import logging
+from driver_pool import DriverPoolTimeout, checkout_driver, return_driver
+from page_waits import PageWaiter
+from work24_crawler import crawl_pages_with_driver, extract_rows, page_url, search_url
 import re
 
 logging.basicConfig(level=logging.INFO)
@@ -65,7 +66,12 @@ def preprocess_job_data(data):
     return processed_data
 
 class SeniorJobService:
-    def __init__(self):
+    max_pages = 10
+
+    def __init__(self, driver_pool=None, scheduler=None, page_waiter=None):
+        self.driver_pool = driver_pool
+        self.scheduler = scheduler  # driver_pool과 함께 있으면 결과 페이지를 동시에 가져옴
+        self.page_waiter = page_waiter or PageWaiter()
         self.options = Options()
         self.options.add_argument("--headless")
         self.options.add_argument("--disable-gpu")
@@ -76,7 +82,10 @@ class SeniorJobService:
 
     def _setup_driver(self):
         try:
-            return webdriver.Chrome(options=self.options)
+            return checkout_driver(self.driver_pool, self.options)
+        except DriverPoolTimeout as e:
+            logger.error(f"No Chrome driver available: {str(e)}")
+            raise HTTPException(status_code=503, detail="All web drivers are busy")
         except Exception as e:
             logger.error(f"Failed to setup Chrome driver: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to initialize web driver")
@@ -99,14 +108,13 @@ class SeniorJobService:
             logger.warning(f"Timeout waiting for clickable element: {value}")
             return None
 
-    def _process_job_row(self, row) -> Dict:
+    def _process_job_row(self, row: Dict) -> Dict:
         try:
-            row_id = row.get_attribute("id")
+            row_id = row["id"]
             if not row_id:
                 return None
 
-            columns = row.find_elements(By.TAG_NAME, "td")
-            data = [col.text.strip() for col in columns]
+            data = list(row["cells"])
             
             location = "위치 정보 없음"
             if len(data) > 1:
@@ -115,8 +123,7 @@ class SeniorJobService:
                     location = position_info[-1]
                     data[1] = '\n'.join(position_info[:-1])
 
-            links = row.find_elements(By.TAG_NAME, "a")
-            detail_link = next((a.get_attribute("href") for a in links if a.get_attribute("href") and a.get_attribute("href").startswith("https://www.work24.go.kr/wk/a/b/1500/empDetailAuthView.do?")), "없음")
+            detail_link = next((href for href in row["links"] if href.startswith("https://www.work24.go.kr/wk/a/b/1500/empDetailAuthView.do?")), "없음")
             return {
                 "id": row_id,
                 "data":preprocess_job_data(data),
@@ -146,15 +153,34 @@ class SeniorJobService:
             if not search_button:
                 raise HTTPException(status_code=500, detail="Search button not found")
             
+            before = self.page_waiter.snapshot(driver)
             driver.execute_script("arguments[0].click();", search_button)
-            time.sleep(2)  
+            self.page_waiter.wait_for_results(driver, before, kind="search")
             
             return True
         except Exception as e:
             logger.error(f"Error performing search: {str(e)}")
             return False
 
+    def _crawl_pages_concurrently(self, keyword: str) -> List[Dict]:
+        """검색 조건을 pageIndex URL로 만들어 풀의 드라이버들로 결과 페이지를 동시에 가져옴"""
+        target_url = search_url(keyword, pfMatterPreferential="B")
+        urls = [page_url(target_url, page_index) for page_index in range(1, self.max_pages + 1)]
+        return crawl_pages_with_driver(
+            self.scheduler, self.driver_pool, urls, self._process_job_row, self.page_waiter
+        )
+
     def get_senior_jobs(self, keyword: str) -> List[Dict]:
+        if self.driver_pool is not None and self.scheduler is not None:
+            try:
+                return self._crawl_pages_concurrently(keyword)
+            except DriverPoolTimeout as e:
+                logger.error(f"No Chrome driver available: {str(e)}")
+                raise HTTPException(status_code=503, detail="All web drivers are busy")
+            except Exception as e:
+                logger.error(f"General error in get_senior_jobs: {str(e)}")
+                raise HTTPException(status_code=500, detail=str(e))
+
         driver = None
         try:
             driver = self._setup_driver()
@@ -162,26 +188,21 @@ class SeniorJobService:
             
             more_btn = self._wait_for_clickable(driver, By.XPATH, '//*[@id="moreBtn"]')
             if more_btn:
+                # 펼쳐진 상세 조건은 _perform_search에서 체크박스가 클릭 가능해질 때까지 기다림
                 driver.execute_script("arguments[0].click();", more_btn)
-                time.sleep(1)
 
             if not self._perform_search(driver, keyword):
                 return []
 
             all_data = []
             page_index = 2
+            before = None
 
             while True:
                 try:
-                    WebDriverWait(driver, 10).until_not(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.blockUI.blockOverlay"))
-                    )
-
-                    results_table = self._wait_for_element(driver, By.CLASS_NAME, "box_table.type_pd24")
-                    if not results_table:
-                        break
+                    results_table = self.page_waiter.wait_for_results(driver, before)
 
-                    rows = results_table.find_elements(By.TAG_NAME, "tr")
+                    rows = extract_rows(driver, results_table)
                     for row in rows:
                         job_data = self._process_job_row(row)
                         if job_data:
@@ -192,9 +213,9 @@ class SeniorJobService:
                     if not next_buttons:
                         return all_data
                         
+                    before = self.page_waiter.snapshot(driver)
                     driver.execute_script("arguments[0].click();", next_buttons[0])
                     page_index += 1
-                    time.sleep(2)
 
                 except TimeoutException:
                     logger.warning("Timeout occurred while processing page")
@@ -211,4 +232,4 @@ class SeniorJobService:
 
         finally:
             if driver:
-                driver.quit()
\ No newline at end of file
+                return_driver(driver, self.driver_pool)
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Selenium 크롤러의 페이지 전환 대기
+
+검색/페이지 버튼을 누른 뒤 time.sleep으로 고정 시간을 기다리지 않고 화면이 실제로 바뀌었는지 확인해서 바로 진행
+- 클릭 전에 snapshot()으로 현재 결과 표에 표시를 남기고 첫 행 id, 현재 페이지 버튼을 기록
+- wait_for_results()는 blockUI 오버레이가 없고 결과 표가 있으면서 이전 표가 교체되었거나(표시가 사라짐)
+  첫 행 id나 현재 페이지 버튼이 바뀌면 전환이 끝난 것으로 봄 (상태는 폴링마다 execute_script 한 번으로 읽음)
+- 제한 시간은 종류(load/search/page)별 최근 대기 시간의 p95 × multiplier를 최소/최대 값 사이로 맞춰 사용
+"""
+import itertools
+import logging
+import threading
+import time
+from collections import Counter, deque
+
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# 페이지 번호 버튼이 있는 영역 (크롤러의 다음 페이지 버튼 XPath와 같은 위치)
+PAGER_XPATH = "//*[@id='mForm']/div[2]/div/div[2]/div/div/div"
+
+# arguments[0]: 결과 표에 남길 표시 (None이면 읽기만 함), arguments[1]: PAGER_XPATH
+PAGE_STATE_SCRIPT = """
+const table = document.querySelector(".box_table.type_pd24");
+const firstRow = table ? table.querySelector("tr[id]") : null;
+const pager = document.evaluate(arguments[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const active = pager ? Array.from(pager.querySelectorAll("button, a, strong")).find((el) =>
+    el.getAttribute("aria-current") || el.getAttribute("title") === "현재 페이지" ||
+    /(^|\\s)(on|active|current)(\\s|$)/.test(el.getAttribute("class") || "")) : null;
+const marker = table && table.__pageWaitMark ? table.__pageWaitMark : null;
+if (table && arguments[0]) {
+    table.__pageWaitMark = arguments[0];
+}
+return {
+    table: table,
+    marker: marker,
+    overlay: document.querySelector("div.blockUI.blockOverlay") !== null,
+    first_row_id: firstRow ? firstRow.getAttribute("id") : null,
+    active_page: active ? active.textContent.trim() : null,
+};
+"""
+
+
+class AdaptiveTimeout:
+    """최근 window개 대기 시간의 p95 × multiplier를 [minimum, maximum]으로 맞춘 제한 시간 (기록이 min_samples개 미만이면 initial)"""
+
+    def __init__(self, initial=10.0, minimum=2.0, maximum=30.0, multiplier=3.0, window=20, min_samples=3):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction=0.95):
+        with self._lock:
+            ordered = sorted(self._samples)
+        if not ordered:
+            return 0.0
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+    def timeout(self):
+        with self._lock:
+            count = len(self._samples)
+        if count < self.min_samples:
+            return self.initial
+        return min(self.maximum, max(self.minimum, self.percentile() * self.multiplier))
+
+
+class PageWaiter:
+    """
+    결과 표 로드/전환 대기 (스레드 안전, 여러 크롤러가 하나를 공유해 대기 시간을 함께 학습)
+        before = waiter.snapshot(driver)
+        driver.execute_script("arguments[0].click();", next_button)
+        results_table = waiter.wait_for_results(driver, before)
+    """
+
+    def __init__(self, initial_timeout=10.0, min_timeout=2.0, max_timeout=30.0, poll_frequency=0.1, window=20):
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.poll_frequency = poll_frequency
+        self.window = window
+        self._lock = threading.Lock()
+        self._marks = itertools.count(1)
+        self._timeouts = {}  # kind -> AdaptiveTimeout
+        self._stats = {}  # kind -> {"waits", "timeouts", "seconds", "max_seconds"}
+        self._signals = Counter()
+
+    def snapshot(self, driver):
+        """클릭 직전에 호출: 현재 결과 표에 표시를 남기고 전환 여부를 비교할 상태를 반환"""
+        with self._lock:
+            mark = f"page-wait-{next(self._marks)}"
+        state = self._read_state(driver, mark)
+        state["marker"] = mark if state["table"] is not None else None
+        return state
+
+    def wait_for_results(self, driver, before=None, kind=None):
+        """
+        결과 표가 준비될 때까지 기다려 표(WebElement)를 반환
+        before(snapshot 결과)가 있으면 그 상태에서 바뀐 뒤까지 기다리며, 제한 시간 안에 바뀌지 않았지만 표가 준비되어 있으면
+        경고 후 현재 표를 반환 (표가 준비되지 않았으면 TimeoutException)
+        """
+        kind = kind or ("page" if before is not None else "load")
+        timeout = self._adaptive(kind).timeout()
+        started = time.monotonic()
+        last = {}
+
+        def settled(driver):
+            state = last["state"] = self._read_state(driver)
+            if state["overlay"] or state["table"] is None:
+                return False
+            signal = self._transition_signal(before, state)
+            if signal is None:
+                return False
+            last["signal"] = signal
+            return state
+
+        try:
+            state = WebDriverWait(
+                driver,
+                timeout,
+                poll_frequency=self.poll_frequency,
+                ignored_exceptions=(JavascriptException, StaleElementReferenceException),
+            ).until(settled)
+        except TimeoutException:
+            self._record(kind, time.monotonic() - started, timed_out=True)
+            state = last.get("state")
+            if state and not state["overlay"] and state["table"] is not None:
+                logger.warning(f"{kind} 전환을 {timeout:.1f}초 안에 확인하지 못해 현재 결과 표를 사용합니다.")
+                return state["table"]
+            raise
+
+        self._record(kind, time.monotonic() - started, signal=last["signal"])
+        return state["table"]
+
+    @staticmethod
+    def _read_state(driver, mark=None):
+        return driver.execute_script(PAGE_STATE_SCRIPT, mark, PAGER_XPATH)
+
+    @staticmethod
+    def _transition_signal(before, state):
+        if before is None:
+            return "ready"
+        if before["marker"] is None:
+            return "table_loaded"
+        if state["marker"] != before["marker"]:
+            return "table_replaced"
+        if state["first_row_id"] != before["first_row_id"]:
+            return "first_row_changed"
+        if state["active_page"] != before["active_page"]:
+            return "active_page_changed"
+        return None
+
+    def _adaptive(self, kind):
+        with self._lock:
+            adaptive = self._timeouts.get(kind)
+            if adaptive is None:
+                adaptive = self._timeouts[kind] = AdaptiveTimeout(
+                    initial=self.initial_timeout,
+                    minimum=self.min_timeout,
+                    maximum=self.max_timeout,
+                    window=self.window,
+                )
+            return adaptive
+
+    def _record(self, kind, seconds, signal=None, timed_out=False):
+        # 시간 초과는 제한 시간 학습에 넣지 않음 (넣으면 제한 시간이 계속 늘어남)
+        if not timed_out:
+            self._adaptive(kind).record(seconds)
+        with self._lock:
+            stats = self._stats.setdefault(kind, {"waits": 0, "timeouts": 0, "seconds": 0.0, "max_seconds": 0.0})
+            stats["waits"] += 1
+            stats["timeouts"] += int(timed_out)
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            if signal is not None:
+                self._signals[signal] += 1
+
+    def stats(self):
+        with self._lock:
+            kinds = {kind: dict(stats) for kind, stats in self._stats.items()}
+            signals = dict(self._signals)
+        for kind, stats in kinds.items():
+            adaptive = self._adaptive(kind)
+            stats.update({
+                "seconds": round(stats["seconds"], 3),
+                "max_seconds": round(stats["max_seconds"], 3),
+                "avg_seconds": round(stats["seconds"] / stats["waits"], 3) if stats["waits"] else 0.0,
+                "p95_seconds": round(adaptive.percentile(), 3),
+                "timeout_seconds": round(adaptive.timeout(), 3),
+            })
+        return {"kinds": kinds, "signals": signals}
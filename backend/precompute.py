@@ -0,0 +1,225 @@
+"""
+프리셋 직무 카테고리 요약 미리 계산 배치
+
+고령자/장애인 모드 타일(o_mode_url_mapping, d_mode_url_mapping)의 키워드는 매일 같으므로
+카테고리 영상 검색 → 자막 → 영상별 요약 → 카테고리 비교 요약을 미리 만들어 두고 엔드포인트에서 바로 반환
+- 결과 묶음은 DiskCache(precomputed 테이블)에 저장되어 GET /precomputed/{mode}/{category_id}로 제공
+- 검색 결과/자막/요약은 서버와 같은 캐시(디스크 계층)에도 저장되므로 기존 엔드포인트도 캐시 적중
+
+사용 예 (backend 디렉터리에서, 서버와 같은 환경 변수/캐시 경로 사용):
+    python precompute.py
+    python precompute.py --modes senior --ids 1 2 --workers 2
+서버에서 주기적으로 실행하려면 PRECOMPUTE_INTERVAL(초)을 설정
+"""
+import argparse
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
+from d_sup import d_mode_url_mapping
+from o_sup import o_mode_url_mapping
+
+logger = logging.getLogger(__name__)
+
+# 검색 모드별 프리셋 키워드 (모드 id → 키워드, 빈 키워드는 '검색' 타일)
+PRESET_KEYWORDS = {
+    "senior": o_mode_url_mapping,
+    "disability": d_mode_url_mapping,
+}
+
+
+def preset_targets(modes=None, ids=None):
+    """(모드, 카테고리 id, 키워드) 목록"""
+    return [
+        (mode, category_id, keyword)
+        for mode in (modes or PRESET_KEYWORDS)
+        for category_id, keyword in PRESET_KEYWORDS[mode].items()
+        if keyword and (not ids or category_id in ids)
+    ]
+
+
+def precomputed_key(mode, category_id):
+    return f"{mode}:{category_id}"
+
+
+class CategoryPrecomputer:
+    """
+    프리셋 키워드마다 카테고리 검색, 영상별 요약, 카테고리 비교 요약을 만들어 store에 저장
+    prepare_videos는 /compare-category와 같은 방식으로 자막과 비디오 정보를 채우는 함수 (요약 캐시 키가 같아지도록)
+    """
+
+    def __init__(self, youtube_service, summary_service, prepare_videos, store,
+                 max_results_per_category=3, workers=4, quota_tracker=None):
+        self.youtube_service = youtube_service
+        self.summary_service = summary_service
+        self.prepare_videos = prepare_videos
+        self.store = store
+        self.max_results_per_category = max_results_per_category
+        self.workers = workers
+        self.quota_tracker = quota_tracker
+        self._lock = threading.Lock()
+        self.last_report = None
+
+    def run(self, targets):
+        """targets를 workers개씩 동시에 처리하고 처리량/비용 보고서를 반환"""
+        started = time.perf_counter()
+        llm_before = self._llm_totals()
+        quota_before = self._quota_used()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="precompute") as executor:
+            results = list(executor.map(lambda target: self._run_target(*target), targets))
+
+        elapsed = time.perf_counter() - started
+        llm_after = self._llm_totals()
+        videos = sum(result["videos"] for result in results)
+        report = {
+            "finished_at": time.time(),
+            "elapsed_seconds": round(elapsed, 2),
+            "targets": len(targets),
+            "failed_targets": sum(1 for result in results if result["error"]),
+            "videos": videos,
+            "video_summaries": sum(result["video_summaries"] for result in results),
+            "comparisons": sum(result["comparisons"] for result in results),
+            "failures": sum(result["failures"] for result in results),
+            "videos_per_minute": round(videos / elapsed * 60, 1) if elapsed else 0.0,
+            "llm_requests": llm_after["requests"] - llm_before["requests"],
+            "llm_tokens": llm_after["tokens"] - llm_before["tokens"],
+            "llm_cost_usd": round(llm_after["cost_usd"] - llm_before["cost_usd"], 6),
+            "youtube_quota_used": self._quota_used() - quota_before if quota_before is not None else None,
+        }
+        with self._lock:
+            self.last_report = report
+        return report
+
+    def _run_target(self, mode, category_id, keyword):
+        counts = {"videos": 0, "video_summaries": 0, "comparisons": 0, "failures": 0, "error": None}
+        try:
+            search_results = self.youtube_service.search_youtube_videos_by_category(
+                keyword, self.max_results_per_category, mode=mode
+            )
+            categories = {}
+            for search_category_id, category in search_results.items():
+                categories[search_category_id] = self._precompute_category(
+                    keyword, search_category_id, category, counts
+                )
+            self.store.set(precomputed_key(mode, category_id), {
+                "mode": mode,
+                "category_id": category_id,
+                "keyword": keyword,
+                "generated_at": time.time(),
+                "categories": categories,
+            })
+            logger.info(
+                f"미리 계산 완료 [{mode}:{category_id}] {keyword}: 영상 {counts['videos']}개, "
+                f"영상 요약 {counts['video_summaries']}개, 비교 요약 {counts['comparisons']}개"
+            )
+        except Exception as e:
+            counts["error"] = str(e)
+            logger.error(f"미리 계산 실패 [{mode}:{category_id}] {keyword}: {str(e)}")
+        return counts
+
+    def _precompute_category(self, keyword, search_category_id, category, counts):
+        """검색 카테고리 하나의 영상별 요약과 비교 요약 (프론트엔드의 /compare-category 요청과 같은 입력)"""
+        video_data_list = [
+            {"video_id": video["video_id"], "keyword": keyword, "category": search_category_id}
+            for video in category["videos"]
+        ]
+        self.prepare_videos(video_data_list)
+        counts["videos"] += len(video_data_list)
+
+        videos = []
+        for video, video_data in zip(category["videos"], video_data_list):
+            summary = None
+            if video_data.get("transcript"):
+                try:
+                    summary = self.summary_service.summarize(
+                        video_data["transcript"], {"title": video["title"], "keyword": keyword}
+                    )
+                    counts["video_summaries"] += 1
+                except HTTPException as e:
+                    counts["failures"] += 1
+                    logger.warning(f"영상 요약 실패 {video['video_id']}: {e.detail}")
+            videos.append({**video, "summary": summary})
+
+        comparison = None
+        try:
+            comparison = self.summary_service.summarize_multiple_videos(video_data_list, search_category_id)
+            counts["comparisons"] += 1
+        except HTTPException as e:
+            counts["failures"] += 1
+            logger.warning(f"비교 요약 실패 {keyword}/{search_category_id}: {e.detail}")
+
+        return {"category_name": category["category_name"], "videos": videos, "comparison": comparison}
+
+    def _llm_totals(self):
+        totals = {"requests": 0, "tokens": 0, "cost_usd": 0.0}
+        for usage in self.summary_service.llm_client.stats()["usage_by_endpoint"].values():
+            totals["requests"] += usage["requests"]
+            totals["tokens"] += usage["prompt_tokens"] + usage["completion_tokens"]
+            totals["cost_usd"] += usage["cost_usd"]
+        return totals
+
+    def _quota_used(self):
+        return self.quota_tracker.stats()["used"] if self.quota_tracker is not None else None
+
+    def stats(self):
+        with self._lock:
+            return {"last_report": self.last_report}
+
+
+class PrecomputeScheduler:
+    """서버 안에서 interval초마다 미리 계산을 다시 실행하는 백그라운드 스레드"""
+
+    def __init__(self, precomputer, targets, interval):
+        self.precomputer = precomputer
+        self.targets = targets
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="precompute-scheduler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                report = self.precomputer.run(self.targets)
+                logger.info(f"카테고리 미리 계산 보고: {report}")
+            except Exception as e:
+                logger.error(f"카테고리 미리 계산 중 오류 발생: {str(e)}")
+            self._stop.wait(self.interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프리셋 직무 카테고리의 검색 결과와 요약을 미리 계산합니다.")
+    parser.add_argument("--modes", nargs="*", choices=list(PRESET_KEYWORDS), help="검색 모드 (기본: 전부)")
+    parser.add_argument("--ids", type=int, nargs="*", help="모드 id (기본: 검색 타일을 제외한 전부)")
+    parser.add_argument("--workers", type=int, default=None, help="동시에 처리할 키워드 수 (기본: PRECOMPUTE_WORKERS)")
+    args = parser.parse_args()
+
+    # 서버와 같은 설정/캐시를 쓰도록 main의 서비스를 그대로 사용
+    import main as server
+
+    precomputer = server.precomputer
+    if args.workers:
+        precomputer.workers = args.workers
+    targets = preset_targets(args.modes, args.ids)
+    report = precomputer.run(targets)
+
+    print(f"대상 {report['targets']}개 (실패 {report['failed_targets']}), {report['elapsed_seconds']}초")
+    print(
+        f"영상 {report['videos']}개 ({report['videos_per_minute']}개/분), 영상 요약 {report['video_summaries']}개, "
+        f"비교 요약 {report['comparisons']}개, 실패 {report['failures']}건"
+    )
+    print(
+        f"LLM 요청 {report['llm_requests']}회, 토큰 {report['llm_tokens']}, 비용 ${report['llm_cost_usd']:.4f}, "
+        f"YouTube 할당량 {report['youtube_quota_used']}단위"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import logging
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+# YouTube Data API 호출 종류별 할당량 단위 비용
+QUOTA_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+}
+
+# 할당량 상태 단계
+QUOTA_LEVEL_NORMAL = "normal"  # 모든 검색어 사용
+QUOTA_LEVEL_REDUCED = "reduced"  # 카테고리별 검색어 수를 줄여서 검색
+QUOTA_LEVEL_CACHED_ONLY = "cached_only"  # 새 검색 없이 캐시된 결과만 반환
+
+
+class QuotaTracker:
+    """
+    YouTube Data API 일일 할당량 사용량을 추적하고 호출 허용 여부를 결정
+    할당량은 태평양 표준시 자정에 초기화되며, 남은 양에 따라 normal → reduced → cached_only 순으로 단계를 낮춤
+    priority="high" 호출(단일 비디오 정보 조회 등)만 reserve_ratio 만큼 남겨둔 예비 할당량을 사용할 수 있음
+    """
+
+    def __init__(self, daily_budget=10000, reduced_ratio=0.3, reserve_ratio=0.1,
+                 reduced_terms_per_category=1, timezone="America/Los_Angeles"):
+        self.daily_budget = daily_budget
+        self.reduced_ratio = reduced_ratio
+        self.reserve_ratio = reserve_ratio
+        self.reduced_terms_per_category = reduced_terms_per_category
+        self._timezone = ZoneInfo(timezone)
+        self._lock = threading.Lock()
+        self._day = self._today()
+        self._used = 0
+        self._used_by_call = {}
+        self._denied_by_call = {}
+        self._exhausted = False
+
+    def _today(self):
+        return datetime.now(self._timezone).date()
+
+    def _roll_over(self):
+        # 날짜가 바뀌었으면 사용량 초기화 (lock을 잡은 상태에서 호출)
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._used = 0
+            self._used_by_call = {}
+            self._denied_by_call = {}
+            self._exhausted = False
+
+    def _remaining(self):
+        return 0 if self._exhausted else max(self.daily_budget - self._used, 0)
+
+    def try_acquire(self, call_type, priority="normal"):
+        """호출 비용만큼 할당량을 차감하고 허용 여부를 반환"""
+        cost = QUOTA_COSTS.get(call_type, 1)
+        with self._lock:
+            self._roll_over()
+            floor = 0 if priority == "high" else self.daily_budget * self.reserve_ratio
+            if self._remaining() - cost < floor:
+                self._denied_by_call[call_type] = self._denied_by_call.get(call_type, 0) + 1
+                return False
+
+            self._used += cost
+            self._used_by_call[call_type] = self._used_by_call.get(call_type, 0) + cost
+            return True
+
+    def mark_exhausted(self):
+        """API가 quotaExceeded를 응답한 경우 오늘 남은 할당량을 모두 소진한 것으로 처리"""
+        with self._lock:
+            self._roll_over()
+            if not self._exhausted:
+                logger.warning("YouTube API 일일 할당량 초과 응답을 받았습니다. 캐시된 결과만 제공합니다.")
+            self._exhausted = True
+
+    def level(self):
+        with self._lock:
+            self._roll_over()
+            return self._level()
+
+    def _level(self):
+        remaining = self._remaining()
+        if remaining - QUOTA_COSTS["search.list"] < self.daily_budget * self.reserve_ratio:
+            return QUOTA_LEVEL_CACHED_ONLY
+        if remaining <= self.daily_budget * self.reduced_ratio:
+            return QUOTA_LEVEL_REDUCED
+        return QUOTA_LEVEL_NORMAL
+
+    def search_terms_per_category(self):
+        """현재 단계에서 카테고리별로 사용할 검색어 수 (None이면 전부 사용)"""
+        return self.reduced_terms_per_category if self.level() == QUOTA_LEVEL_REDUCED else None
+
+    def stats(self):
+        with self._lock:
+            self._roll_over()
+            return {
+                "day": self._day.isoformat(),
+                "daily_budget": self.daily_budget,
+                "used": self._used,
+                "remaining": self._remaining(),
+                "level": self._level(),
+                "exhausted": self._exhausted,
+                "used_by_call": dict(self._used_by_call),
+                "denied_by_call": dict(self._denied_by_call),
+            }
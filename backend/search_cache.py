@@ -0,0 +1,127 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_keyword(keyword):
+    """캐시 키용 키워드 정규화 (앞뒤/중복 공백 제거, 소문자)"""
+    return " ".join((keyword or "").split()).lower()
+
+
+class SearchResultCache:
+    """
+    카테고리별 영상 검색 결과 캐시 (stale-while-revalidate)
+    fresh_ttl 안의 결과는 그대로 반환하고, stale_ttl 안의 오래된 결과는 즉시 반환하면서 백그라운드에서 새로 검색
+    disk_cache를 주면 결과를 디스크에도 저장하여 재시작 후나 다른 프로세스(precompute 배치)와 공유
+    """
+
+    def __init__(self, fresh_ttl=60 * 60, stale_ttl=24 * 60 * 60, max_entries=512, refresh_workers=2,
+                 disk_cache=None):
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.disk_cache = disk_cache
+        # 항목 수 기준으로 제한하기 위해 각 항목 크기를 1로 계산
+        self._cache = LRUCache(max_bytes=max_entries, ttl=stale_ttl, sizeof=lambda value: 1)
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="search-refresh")
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def get_or_compute(self, key, compute):
+        """캐시된 결과를 반환하거나 compute()로 새로 계산하여 저장"""
+        entry = self._get_entry(key)
+        if entry is not None:
+            result, created_at = entry
+            if time.monotonic() - created_at < self.fresh_ttl:
+                self._count("fresh_hits")
+                return result
+
+            self._count("stale_hits")
+            self._schedule_refresh(key, compute)
+            return result
+
+        self._count("misses")
+        result = compute()
+        self.store(key, result)
+        return result
+
+    def peek(self, key):
+        """신선도와 상관없이 캐시된 결과만 반환 (없으면 None, 갱신하지 않음)"""
+        entry = self._get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def store(self, key, result):
+        # 영상을 하나도 찾지 못한 결과(API 오류 등)는 저장하지 않음
+        if not any(category["videos"] for category in result.values()):
+            return
+        self._cache.set(key, (result, time.monotonic()))
+        if self.disk_cache is not None:
+            self.disk_cache.set(self._disk_key(key), {"result": result, "saved_at": time.time()})
+
+    def _get_entry(self, key):
+        """메모리에서 (결과, 생성 시각)을 찾고, 없으면 디스크에서 읽어 메모리에 올림"""
+        entry = self._cache.get(key)
+        if entry is not None or self.disk_cache is None:
+            return entry
+
+        stored = self.disk_cache.get(self._disk_key(key))
+        if stored is None:
+            return None
+        # 디스크에는 벽시계 시각으로 저장하므로 경과 시간만큼 앞선 monotonic 시각으로 바꾸고,
+        # 메모리에는 저장 시각 기준으로 남은 stale_ttl 동안만 둠 (지금부터 stale_ttl을 다시 주지 않음)
+        age = max(time.time() - stored["saved_at"], 0.0)
+        if age >= self.stale_ttl:
+            return None
+        entry = (stored["result"], time.monotonic() - age)
+        self._cache.set(key, entry, ttl=self.stale_ttl - age)
+        return entry
+
+    @staticmethod
+    def _disk_key(key):
+        return json.dumps(list(key), ensure_ascii=False)
+
+    def _schedule_refresh(self, key, compute):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._refresh, key, compute)
+
+    def _refresh(self, key, compute):
+        try:
+            self.store(key, compute())
+            self._count("refreshes")
+        except Exception as e:
+            self._count("refresh_failures")
+            logger.warning(f"검색 결과 백그라운드 갱신 실패 {key}: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self):
+        with self._lock:
+            stats = {
+                "entries": len(self._cache),
+                "fresh_hits": self.fresh_hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+                "refreshing": len(self._refreshing),
+            }
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.stats()
+        return stats
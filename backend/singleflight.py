@@ -0,0 +1,62 @@
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 작업을 한 번만 실행하고 결과를 공유
+    먼저 들어온 호출(leader)이 실제로 실행하고, 나중에 들어온 호출(waiter)은 그 결과나 예외를 그대로 받음
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {}  # group -> {"leaders": n, "waiters": n}
+
+    def do(self, group, key, fn):
+        """group 안에서 key가 같은 실행 중인 작업이 있으면 기다렸다가 결과를 받고, 없으면 fn()을 실행"""
+        call_key = (group, key)
+        with self._lock:
+            stats = self._stats.setdefault(group, {"leaders": 0, "waiters": 0})
+            call = self._calls.get(call_key)
+            if call is not None:
+                stats["waiters"] += 1
+                is_leader = False
+            else:
+                call = _Call()
+                self._calls[call_key] = call
+                stats["leaders"] += 1
+                is_leader = True
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[call_key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            in_flight = {}
+            for group, _ in self._calls:
+                in_flight[group] = in_flight.get(group, 0) + 1
+            return {
+                group: {**counts, "in_flight": in_flight.get(group, 0)}
+                for group, counts in self._stats.items()
+            }
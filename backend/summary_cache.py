@@ -0,0 +1,43 @@
+import hashlib
+import json
+from cache import LRUCache
+
+
+def make_summary_key(kind, content, model, prompt_version):
+    """요약 입력 내용, 모델, 프롬프트 버전으로 만든 내용 기반 캐시 키 (SHA-256)"""
+    source = json.dumps(
+        {"kind": kind, "content": content, "model": model, "prompt_version": prompt_version},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """
+    모델이 생성한 요약 원문을 저장하는 2단 캐시 (메모리 LRU + 선택적 디스크 캐시)
+    키에 입력 내용의 해시가 들어가므로 같은 자막/맥락/모델/프롬프트 버전이면 OpenAI를 다시 호출하지 않음
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024, ttl=7 * 24 * 60 * 60, disk_cache=None):
+        self.disk_cache = disk_cache
+        self._cache = LRUCache(max_bytes=max_bytes, ttl=ttl, sizeof=lambda text: len(text.encode("utf-8")))
+
+    def get(self, key):
+        summary = self._cache.get(key)
+        if summary is None and self.disk_cache is not None:
+            summary = self.disk_cache.get(key)
+            if summary is not None:
+                self._cache.set(key, summary)
+        return summary
+
+    def set(self, key, summary):
+        self._cache.set(key, summary)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, summary)
+
+    def stats(self):
+        stats = self._cache.stats()
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.stats()
+        return stats
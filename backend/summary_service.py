@@ -1,20 +1,214 @@
-import re
+import json
+import logging
+import math
+import time
 import openai
 from fastapi import HTTPException
-from bs4 import BeautifulSoup
+from extractive import (
+    EXTRACTIVE_COMPARE, EXTRACTIVE_MODES, EXTRACTIVE_OFF, ExtractiveStats,
+    extract_comparison, extract_sentences, render_flagged,
+)
+from llm_client import LLMClient, MODEL_PRICES_PER_1K
+from singleflight import SingleFlight
+from summary_cache import SummaryCache, make_summary_key
+from token_budget import chunk_sentences, load_token_counter, pack_sentences, pack_texts
+from transcript_pipeline import normalize_transcript
+from html_sanitizer import sanitize
+
+logger = logging.getLogger(__name__)
+
+SECTION_END_TAG = "</section>"
+
+# 요약 응답 형식
+SUMMARY_FORMAT_INLINE = "inline"  # 인라인 CSS + HTML (기존 형식)
+SUMMARY_FORMAT_HTML = "html"  # CSS 없는 HTML
+SUMMARY_FORMAT_SECTIONS = "sections"  # 섹션 목록 JSON
+SUMMARY_FORMATS = (SUMMARY_FORMAT_INLINE, SUMMARY_FORMAT_HTML, SUMMARY_FORMAT_SECTIONS)
+# CSS 없는 형식에서 클라이언트가 링크할 스타일시트 (main.py에서 /static으로 제공)
+SUMMARY_STYLESHEET = "/static/css/summary.css"
+
+INLINE_SUMMARY_CSS = """
+        <style>
+        .summary-container, .comparison-container {
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            font-family: 'Noto Sans KR', sans-serif;
+            line-height: 1.6;
+            color: #333;
+        }
+        .summary-section, .common-section, .unique-section, .conclusion-section {
+            margin-bottom: 35px;
+            padding: 25px;
+            background-color: #f8f9fa;
+            border-radius: 12px;
+            box-shadow: 0 3px 6px rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+        }
+        .summary-section:hover, .common-section:hover, .unique-section:hover, .conclusion-section:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
+        }
+        .section-title {
+            color: #1a73e8;
+            font-size: 1.5em;
+            margin-bottom: 20px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #e8eaed;
+            font-weight: 600;
+        }
+        .content-block {
+            margin: 20px 0;
+        }
+        .main-point, .key-point, .conclusion-point {
+            font-size: 1.1em;
+            line-height: 1.8;
+            margin-bottom: 15px;
+            color: #202124;
+        }
+        .detail-point, .unique-point {
+            font-size: 1.05em;
+            line-height: 1.7;
+            margin-bottom: 15px;
+            color: #3c4043;
+            padding-left: 15px;
+            border-left: 3px solid #1a73e8;
+        }
+        .supporting-info {
+            font-size: 1em;
+            line-height: 1.6;
+            color: #5f6368;
+            background-color: #fff;
+            padding: 15px;
+            border-radius: 8px;
+            margin-top: 15px;
+        }
+        .video-perspective {
+            margin-bottom: 25px;
+            padding: 15px;
+            background-color: #fff;
+            border-radius: 8px;
+        }
+        .video-title {
+            font-size: 1.2em;
+            color: #1a73e8;
+            margin-bottom: 12px;
+        }
+        b {
+            color: #202124;
+            background-color: #e8f0fe;
+            padding: 3px 6px;
+            border-radius: 4px;
+            font-weight: 600;
+        }
+        @media (max-width: 768px) {
+            .summary-container, .comparison-container {
+                padding: 10px;
+            }
+            .summary-section, .common-section, .unique-section, .conclusion-section {
+                padding: 15px;
+                margin-bottom: 25px;
+            }
+            .detail-point, .unique-point {
+                padding-left: 10px;
+            }
+        }
+        </style>
+        """
+
+
+def sse_event(event, data):
+    """Server-Sent Events 형식의 이벤트 문자열 생성 (data는 JSON으로 직렬화)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
 
 class SummaryService:
-    def __init__(self, openai_api_key):
+    MODEL = "gpt-3.5-turbo"
+    # 프롬프트나 요약 구조를 바꾸면 값을 올려서 기존 요약 캐시를 무효화
+    PROMPT_VERSION = 1
+
+    def __init__(self, openai_api_key, single_flight=None, summary_cache=None,
+                 map_reduce=True, map_concurrency=4, token_counter=None,
+                 summary_input_tokens=2000, comparison_input_tokens=3000,
+                 map_chunk_tokens=2500, reduce_input_tokens=3000, max_map_chunks=24, llm_client=None,
+                 extractive_mode=EXTRACTIVE_OFF):
         openai.api_key = openai_api_key
+        # 같은 자막에 대한 요약 요청이 동시에 들어오면 OpenAI 호출을 한 번만 수행
+        self.single_flight = single_flight or SingleFlight()
+        # 같은 입력에 대한 요약 결과를 재사용하기 위한 캐시
+        self.summary_cache = summary_cache or SummaryCache()
+        # 긴 자막은 잘라내지 않고 조각별 요약(map)을 동시에 만든 뒤 하나로 합침(reduce)
+        self.map_reduce = map_reduce
+        # 자막은 글자 수가 아니라 모델 토큰 예산 단위로 문장을 통째로 담음
+        self.token_counter = token_counter or load_token_counter()
+        self.summary_input_tokens = summary_input_tokens  # 단일 요약 요청에 넣을 자막 토큰 수
+        self.comparison_input_tokens = comparison_input_tokens  # 비교 요약 요청 하나에 넣을 전체 자막 토큰 수
+        self.map_chunk_tokens = map_chunk_tokens  # map 단계 조각 하나의 토큰 수
+        self.reduce_input_tokens = reduce_input_tokens  # reduce 단계에 넣을 조각별 메모 전체 토큰 수
+        self.max_map_chunks = max_map_chunks  # map-reduce로 읽을 최대 조각 수 (그 이후 자막은 읽지 않음)
+        # 요약 하나의 map 단계 동시 호출 수 상한 (전체 동시 호출 수는 llm_client가 429 응답에 맞춰 조절)
+        self.map_concurrency = map_concurrency
+        # OpenAI 호출은 비동기 클라이언트의 이벤트 루프에서 실행 (동시성 조절, 재시도, 토큰 사용량 기록)
+        self.llm_client = llm_client or LLMClient(
+            api_key=openai_api_key, model=self.MODEL, token_counter=self.token_counter
+        )
+        # 모델에 보내기 전에 자막에서 정보량이 많은 문장만 로컬에서 골라 입력 토큰을 줄임 (off/on/compare)
+        if extractive_mode not in EXTRACTIVE_MODES:
+            raise ValueError(f"지원하지 않는 추출 모드입니다: {extractive_mode}")
+        self.extractive_mode = extractive_mode
+        self.extractive_stats = ExtractiveStats(extractive_mode, MODEL_PRICES_PER_1K.get(self.MODEL, (0.0, 0.0))[0])
+
+    def _cached_completion(self, group, cache_key, generate):
+        """요약 캐시를 먼저 확인하고, 없으면 같은 요청을 묶어 한 번만 생성한 뒤 캐시에 저장"""
+        cached = self.summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        def compute():
+            summary = generate()
+            self.summary_cache.set(cache_key, summary)
+            return summary
+
+        return self.single_flight.do(group, cache_key, compute)
 
-    def preprocess_payload(self, payload, max_length=1200):
-        cleaned = re.sub(r'\s+', ' ', payload)
-        cleaned = re.sub(r'[^\w\s.,!?()\'\"가-힣]', '', cleaned)
-        sentences = re.split(r'(?<=[.!?]) +', cleaned)
-        return " ".join(sentences[:max_length // 15]) if len(cleaned) > max_length else cleaned
+    def _normalize(self, payload, budget):
+        """자막 문자열이나 세그먼트 목록을 budget 토큰을 채울 만큼만 읽어서 정리"""
+        return normalize_transcript(payload, budget, self.token_counter)
 
-    def summarize_multiple_videos(self, video_data_list, category_name):
+    def _read_budget(self):
+        # map-reduce나 추출 단계를 쓰면 조각 수 상한까지, 아니면 단일 요약 예산까지만 자막을 읽음
+        if self.map_reduce or self.extractive_mode != EXTRACTIVE_OFF:
+            return self.map_chunk_tokens * self.max_map_chunks
+        return self.summary_input_tokens
+
+    def preprocess_payload(self, payload, max_tokens=None):
+        """자막을 정리한 뒤 max_tokens(기본: 단일 요약 예산) 토큰까지 문장 단위로 담음"""
+        budget = max_tokens or self.summary_input_tokens
+        return pack_sentences(self._normalize(payload, budget), budget, self.token_counter)
+
+    def summarize_multiple_videos(self, video_data_list, category_name, summary_format=SUMMARY_FORMAT_INLINE):
         """여러 비디오의 자막을 비교하여 요약"""
+        self._check_summary_format(summary_format)
+        video_contents = self._prepare_video_contents(video_data_list)
+        cache_key = self._comparison_cache_key(video_contents, category_name)
+        summary = self._cached_completion(
+            "comparison", cache_key, lambda: self._generate_comparison(video_contents, category_name)
+        )
+        return self.render_summary(summary, summary_format)
+
+    def summarize_multiple_videos_stream(self, video_data_list, category_name, summary_format=SUMMARY_FORMAT_INLINE):
+        """비교 요약을 SSE 이벤트로 스트리밍 (입력 검증은 스트림을 시작하기 전에 수행)"""
+        self._check_summary_format(summary_format)
+        video_contents = self._prepare_video_contents(video_data_list)
+        cache_key = self._comparison_cache_key(video_contents, category_name)
+        messages = self._comparison_messages(video_contents, category_name)
+        return self._stream_completion(
+            cache_key, [messages], max_tokens=2000, error_label="비교 요약",
+            endpoint="comparison.stream", summary_format=summary_format
+        )
+
+    def _prepare_video_contents(self, video_data_list):
+        """비교 요약에 사용할 비디오별 제목/채널/전처리된 자막 목록 생성"""
         if not video_data_list or len(video_data_list) == 0:
             raise HTTPException(status_code=400, detail="요약할 비디오가 없습니다.")
         
@@ -27,48 +221,104 @@ class SummaryService:
                 
             video_info = video_data.get("video_info", {})
             
-            # 트랜스크립트 전처리
-            transcript = self.preprocess_payload(transcript, 1500)
-            
             video_contents.append({
                 "title": video_info.get("title", "").strip(),  # 공백 제거
                 "channel": video_info.get("channel", "").strip(),  # 공백 제거
-                "transcript": transcript[:1500],  # 길이 제한
+                "transcript": transcript,
                 "url": video_info.get("url", "")
             })
         
         if len(video_contents) == 0:
             raise HTTPException(status_code=400, detail="유효한 자막이 있는 비디오가 없습니다.")
-            
+
+        extracted = self._extract_comparison_input([content["transcript"] for content in video_contents])
+        if extracted is not None:
+            for content, transcript in zip(video_contents, extracted):
+                content["transcript"] = transcript
+                content["extractive"] = True
+            return video_contents
+
+        # 비교 요약 토큰 예산을 자막 길이에 비례하여 나누고 각 자막을 문장 단위로 담음
+        packed = pack_texts(
+            [self._normalize(content["transcript"], self.comparison_input_tokens) for content in video_contents],
+            self.comparison_input_tokens,
+            self.token_counter,
+        )
+        for content, transcript in zip(video_contents, packed):
+            content["transcript"] = transcript
+
+        return video_contents
+
+    def _extract_comparison_input(self, transcripts):
+        """
+        추출 단계가 켜져 있으면 영상별로 고른 문장에 공통/고유 표시를 붙인 자막 목록을 반환
+        꺼져 있거나 compare 모드이면 None (compare 모드는 기존 경로 대비 입력 토큰만 기록)
+        """
+        if self.extractive_mode == EXTRACTIVE_OFF:
+            return None
+
+        started = time.perf_counter()
+        # 앞부분만 담는 기존 경로와 달리 영상 전체에서 고르므로 조각 수 상한까지 읽음
+        cleaned = [self._normalize(transcript, self._read_budget()) for transcript in transcripts]
+        extracted = [
+            render_flagged(sentences)
+            for sentences in extract_comparison(cleaned, self.comparison_input_tokens, self.token_counter)
+        ]
+        elapsed = time.perf_counter() - started
+
+        baseline_tokens = min(sum(self.token_counter.count(text) for text in cleaned), self.comparison_input_tokens)
+        extractive_tokens = sum(self.token_counter.count(text) for text in extracted)
+        self.extractive_stats.record("comparison", baseline_tokens, 1, extractive_tokens, elapsed)
+        if self.extractive_mode == EXTRACTIVE_COMPARE:
+            logger.info(
+                f"추출 비교(비교 요약): 기존 입력 {baseline_tokens}토큰 → 추출 {extractive_tokens}토큰, "
+                f"영상 {len(cleaned)}개, 추출 {elapsed * 1000:.1f}ms"
+            )
+            return None
+        return extracted
+
+    def _comparison_cache_key(self, video_contents, category_name):
+        return make_summary_key(
+            "comparison",
+            {"videos": video_contents, "category_name": category_name},
+            self.MODEL,
+            self.PROMPT_VERSION,
+        )
+
+    def _comparison_messages(self, video_contents, category_name):
+        """비교 요약 요청 메시지 생성"""
+        prompt = self._create_comparison_prompt(video_contents, category_name)
+        return [
+            {"role": "system", "content": (
+                "You are a detailed content analysis expert that identifies common themes and differences "
+                "across multiple content pieces. Provide a comprehensive, well-structured analysis in Korean "
+                "that highlights both shared information and unique perspectives. For each video, provide "
+                "at least 4-5 detailed sentences explaining the unique perspectives and key insights."
+            )},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _generate_comparison(self, video_contents, category_name):
+        """OpenAI로 비교 요약 원문(HTML)을 생성"""
         try:
             # 비디오 컨텐츠를 기반으로 비교 요약 생성
-            prompt = self._create_comparison_prompt(video_contents, category_name)
-            
-            messages = [
-                {"role": "system", "content": (
-                    "You are a detailed content analysis expert that identifies common themes and differences "
-                    "across multiple content pieces. Provide a comprehensive, well-structured analysis in Korean "
-                    "that highlights both shared information and unique perspectives. For each video, provide "
-                    "at least 4-5 detailed sentences explaining the unique perspectives and key insights."
-                )},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
-                temperature=0.5,
-                max_tokens=2000
-            )
-            
-            summary = response.choices[0].message.content.strip()
-            return self.postprocess_summary(summary)
+            messages = self._comparison_messages(video_contents, category_name)
+
+            return self.llm_client.complete(messages, "comparison", temperature=0.5, max_tokens=2000)
             
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"비교 요약 중 오류 발생: {str(e)}")
 
     def _create_comparison_prompt(self, video_contents, category_name):
         """여러 비디오를 비교하는 프롬프트 생성"""
+        flag_note = ""
+        if any(content.get("extractive") for content in video_contents):
+            flag_note = (
+                "각 자막은 영상 전체에서 중요한 문장만 골라 순서대로 나열한 것이며, "
+                "[공통]은 다른 영상에도 나오는 내용, [고유]는 이 영상에만 나오는 내용으로 자동 분류한 표시입니다. "
+                "표시는 참고용이며 결과 HTML에는 넣지 마세요.\n"
+            )
+
         videos_text = ""
         for i, content in enumerate(video_contents):
             # 실제 제목을 사용하여 비디오 정보 추가
@@ -78,7 +328,8 @@ class SummaryService:
             
         return (
             f"다음은 '{category_name}'에 관한 {len(video_contents)}개의 YouTube 영상 자막입니다. "
-            "이 영상들의 내용을 비교 분석하여 공통된 정보와 각 영상의 고유한 관점을 정리해주세요.\n\n"
+            "이 영상들의 내용을 비교 분석하여 공통된 정보와 각 영상의 고유한 관점을 정리해주세요.\n"
+            f"{flag_note}\n"
             f"{videos_text}\n"
             "다음 HTML 구조로 정리해주세요:\n\n"
             "<div class='comparison-container'>\n"
@@ -123,214 +374,347 @@ class SummaryService:
             "8. HTML 코드 외의 메타설명은 포함하지 마세요."
         )
 
-    def summarize(self, payload, context=None):
-        """단일 비디오 요약(기존 기능)"""
+    def summarize(self, payload, context=None, summary_format=SUMMARY_FORMAT_INLINE):
+        """단일 비디오 요약(기존 기능), payload는 자막 문자열 또는 자막 세그먼트 목록"""
         if not payload:
             raise HTTPException(status_code=400, detail="요약할 텍스트가 없습니다.")
+        self._check_summary_format(summary_format)
 
-        max_length = 1200
-        payload = self.preprocess_payload(payload, max_length)
-        chunks = [payload[i:i+max_length] for i in range(0, len(payload), max_length)]
-        summaries = []
+        cleaned = self._normalize(payload, self._read_budget())
+        extracted = self._extract_summary_input(cleaned)
+        if extracted is None and self._use_map_reduce(cleaned):
+            chunks = chunk_sentences(cleaned, self.map_chunk_tokens, self.token_counter)
+            cache_key = self._map_reduce_cache_key(cleaned, context)
+            summary = self._cached_completion(
+                "summary", cache_key, lambda: self._generate_map_reduce_summary(chunks, context)
+            )
+            return self.render_summary(summary, summary_format)
+
+        payload = extracted if extracted is not None else pack_sentences(
+            cleaned, self.summary_input_tokens, self.token_counter
+        )
+
+        cache_key = self._summary_cache_key(payload, context)
+        summary = self._cached_completion(
+            "summary", cache_key, lambda: self._generate_summary(payload, context)
+        )
+        return self.render_summary(summary, summary_format)
+
+    def summarize_stream(self, payload, context=None, summary_format=SUMMARY_FORMAT_INLINE):
+        """단일 비디오 요약을 SSE 이벤트로 스트리밍 (입력 검증은 스트림을 시작하기 전에 수행)"""
+        if not payload:
+            raise HTTPException(status_code=400, detail="요약할 텍스트가 없습니다.")
+        self._check_summary_format(summary_format)
+
+        cleaned = self._normalize(payload, self._read_budget())
+        extracted = self._extract_summary_input(cleaned)
+        if extracted is None and self._use_map_reduce(cleaned):
+            chunks = chunk_sentences(cleaned, self.map_chunk_tokens, self.token_counter)
+            cache_key = self._map_reduce_cache_key(cleaned, context)
+            # map 단계는 캐시에 없을 때만 스트림 안에서 실행되고, reduce 결과를 스트리밍
+            message_batches = self._map_reduce_message_batches(chunks, context)
+            return self._stream_completion(
+                cache_key, message_batches, max_tokens=1500, error_label="요약",
+                endpoint="summary.stream", summary_format=summary_format
+            )
+
+        payload = extracted if extracted is not None else pack_sentences(
+            cleaned, self.summary_input_tokens, self.token_counter
+        )
+
+        cache_key = self._summary_cache_key(payload, context)
+        message_batches = [self._summary_messages(payload, context)]
+        return self._stream_completion(
+            cache_key, message_batches, max_tokens=1500, error_label="요약",
+            endpoint="summary.stream", summary_format=summary_format
+        )
+
+    def _extract_summary_input(self, cleaned):
+        """
+        추출 단계가 켜져 있으면 단일 요약 예산 안에서 고른 문장을 반환 (긴 자막도 map-reduce 없이 한 번에 요약)
+        꺼져 있거나 compare 모드이면 None (compare 모드는 기존 경로 대비 입력 토큰과 호출 수만 기록)
+        """
+        if self.extractive_mode == EXTRACTIVE_OFF:
+            return None
+
+        started = time.perf_counter()
+        cleaned_tokens = self.token_counter.count(cleaned)
+        extracted = extract_sentences(cleaned, self.summary_input_tokens, self.token_counter, cleaned_tokens)
+        elapsed = time.perf_counter() - started
 
+        # 기존 경로: 예산을 넘으면 map 단계에서 자막 전체를 조각별로 보내고 reduce 요청 한 번 (reduce 입력은 제외)
+        if self.map_reduce and cleaned_tokens > self.summary_input_tokens:
+            baseline_tokens = cleaned_tokens
+            baseline_calls = math.ceil(cleaned_tokens / self.map_chunk_tokens) + 1
+        else:
+            baseline_tokens = min(cleaned_tokens, self.summary_input_tokens)
+            baseline_calls = 1
+        extractive_tokens = self.token_counter.count(extracted)
+        self.extractive_stats.record("summary", baseline_tokens, baseline_calls, extractive_tokens, elapsed)
+        if self.extractive_mode == EXTRACTIVE_COMPARE:
+            logger.info(
+                f"추출 비교(요약): 기존 입력 {baseline_tokens}토큰/{baseline_calls}회 호출 → "
+                f"추출 {extractive_tokens}토큰/1회 호출, 추출 {elapsed * 1000:.1f}ms"
+            )
+            return None
+        return extracted
+
+    def _summary_cache_key(self, payload, context):
+        return make_summary_key(
+            "summary",
+            {
+                "transcript": payload,
+                "title": (context or {}).get("title") or "",
+                "keyword": (context or {}).get("keyword") or "",
+            },
+            self.MODEL,
+            self.PROMPT_VERSION,
+        )
+
+    def _map_reduce_cache_key(self, cleaned, context):
+        return make_summary_key(
+            "summary-map-reduce",
+            {
+                "transcript": cleaned,
+                "title": (context or {}).get("title") or "",
+                "keyword": (context or {}).get("keyword") or "",
+                "chunk_tokens": self.map_chunk_tokens,
+            },
+            self.MODEL,
+            self.PROMPT_VERSION,
+        )
+
+    def _use_map_reduce(self, cleaned):
+        """단일 요약 토큰 예산에 담기지 않아 잘라내야 하는 자막인지 확인"""
+        return self.map_reduce and self.token_counter.count(cleaned) > self.summary_input_tokens
+
+    def _generate_map_reduce_summary(self, chunks, context):
+        """조각별 요약을 동시에 만든 뒤 하나의 3섹션 요약 원문(HTML)으로 합침"""
         try:
-            for chunk in chunks:
-                context_prompt = ""
-                if context:
-                    context_prompt = (
-                        f"영상 제목: {context['title']}\n"
-                        f"검색 키워드: {context['keyword']}\n"
-                    )
-                
-                prompt = (
-                    f"{context_prompt}"
-                    "다음 텍스트의 내용을 상세하게 정리하여 아래 HTML 구조로 작성해주세요:\n\n"
-                    "<div class='summary-container'>\n"
-                    "  <section class='summary-section'>\n"
-                    "    <h3 class='section-title'>주요 맥락과 배경</h3>\n"
-                    "    <div class='content-block'>\n"
-                    "      <p class='main-point'>핵심 주제와 배경 (2-3문장)</p>\n"
-                    "      <p class='detail-point'>구체적인 상황 설명 (2-3문장)</p>\n"
-                    "      <p class='supporting-info'>관련된 맥락과 추가 정보 (2-3문장)</p>\n"
-                    "    </div>\n"
-                    "  </section>\n"
-                    "  <!-- 위 구조로 총 3개 섹션 작성 -->\n"
-                    "</div>\n\n"
-                    "요구사항:\n"
-                    "1. 정확히 3개의 섹션으로 구성 (주요 맥락/핵심 내용/결론)\n"
-                    "2. 각 섹션은 반드시 3개의 단락으로 구성\n"
-                    "3. 각 단락은 최소 2-3개의 완성된 문장으로 작성\n"
-                    "4. 요약하지 말고 원문의 중요한 내용을 상세하게 포함\n"
-                    "5. 중요한 수치는 <b> 태그로 강조\n"
-                    "6. 메타설명이나 불필요한 설명 제외\n\n"
-                    f"텍스트 내용:\n{chunk}"
-                )
-
-                messages = [
-                    {"role": "system", "content": (
-                        "You are a detailed content organization expert that creates "
-                        "comprehensive, well-structured content in Korean. Include "
-                        "sufficient detail and context while maintaining clear organization. "
-                        "Each section should have three distinct paragraphs with "
-                        "2-3 complete sentences each."
-                    )},
-                    {"role": "user", "content": prompt}
-                ]
-                
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=messages,
-                    temperature=0.5,
-                    max_tokens=1500
-                )
-                summary = response.choices[0].message.content.strip()
-                summaries.append(summary)
-
-            full_summary = "\n".join(summaries)
-            return self.postprocess_summary(full_summary)
+            return self.llm_client.complete(
+                self._reduce_messages(self._map_chunks(chunks, context), context),
+                "summary.reduce",
+                temperature=0.5,
+                max_tokens=1500
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"요약 중 오류 발생: {str(e)}")
+
+    def _map_reduce_message_batches(self, chunks, context):
+        # _stream_completion이 순회할 때 map 단계를 실행하도록 제너레이터로 제공
+        yield self._reduce_messages(self._map_chunks(chunks, context), context)
+
+    def _map_chunks(self, chunks, context):
+        """각 조각의 핵심 메모를 최대 map_concurrency개씩 동시에 생성 (결과는 조각 순서대로)"""
+        started = time.monotonic()
+        notes = self.llm_client.complete_many(
+            [self._chunk_notes_messages(index, len(chunks), chunk, context)
+             for index, chunk in enumerate(chunks, start=1)],
+            "summary.map",
+            concurrency=self.map_concurrency,
+            temperature=0.3,
+            max_tokens=600
+        )
+        logger.info(f"map 단계 완료: 조각 {len(chunks)}개, {time.monotonic() - started:.2f}초")
+        return notes
+
+    def _chunk_notes_messages(self, index, total, chunk, context):
+        """자막 조각 하나의 핵심 내용을 글머리표 메모로 정리하는 요청 메시지 생성"""
+        context_prompt = ""
+        if context:
+            context_prompt = (
+                f"영상 제목: {context['title']}\n"
+                f"검색 키워드: {context['keyword']}\n"
+            )
+        prompt = (
+            f"{context_prompt}"
+            f"다음은 긴 영상 자막을 순서대로 나눈 {total}개 부분 중 {index}번째 부분입니다.\n"
+            "이 부분의 핵심 내용을 중요한 수치, 고유명사, 예시를 살려 한국어 글머리표 5~8개로 정리해주세요.\n"
+            "HTML이나 메타설명은 포함하지 마세요.\n\n"
+            f"텍스트 내용:\n{chunk}"
+        )
+        return [
+            {"role": "system", "content": (
+                "You are a precise note-taker who extracts the key facts of a transcript "
+                "segment as concise Korean bullet points without losing important details."
+            )},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _reduce_messages(self, notes, context):
+        """조각별 메모를 합쳐 기존과 같은 3섹션 HTML 요약을 요청하는 메시지 생성"""
+        # 조각이 많아도 reduce 요청이 넘치지 않도록 메모 길이에 비례하여 예산을 나눔
+        notes = pack_texts(notes, self.reduce_input_tokens, self.token_counter)
+        merged_notes = "\n\n".join(
+            f"[부분 {index}/{len(notes)}]\n{note}" for index, note in enumerate(notes, start=1)
+        )
+        source_note = (
+            "아래 텍스트 내용은 긴 영상 자막을 순서대로 나눈 각 부분의 핵심 메모입니다. "
+            "부분별로 나누지 말고 영상 전체의 흐름을 하나로 통합해주세요.\n"
+        )
+        return self._summary_messages(merged_notes, context, source_note)
+
+    def _generate_summary(self, payload, context):
+        """토큰 예산에 맞춰 담은 자막으로 OpenAI 요약 원문(HTML)을 생성"""
+        try:
+            return self.llm_client.complete(
+                self._summary_messages(payload, context), "summary", temperature=0.5, max_tokens=1500
+            )
 
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"요약 중 오류 발생: {str(e)}")
 
-    def postprocess_summary(self, summary):
-        css_style = """
-        <style>
-        .summary-container, .comparison-container {
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            font-family: 'Noto Sans KR', sans-serif;
-            line-height: 1.6;
-            color: #333;
-        }
-        .summary-section, .common-section, .unique-section, .conclusion-section {
-            margin-bottom: 35px;
-            padding: 25px;
-            background-color: #f8f9fa;
-            border-radius: 12px;
-            box-shadow: 0 3px 6px rgba(0,0,0,0.1);
-            transition: all 0.3s ease;
-        }
-        .summary-section:hover, .common-section:hover, .unique-section:hover, .conclusion-section:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }
-        .section-title {
-            color: #1a73e8;
-            font-size: 1.5em;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e8eaed;
-            font-weight: 600;
-        }
-        .content-block {
-            margin: 20px 0;
-        }
-        .main-point, .key-point, .conclusion-point {
-            font-size: 1.1em;
-            line-height: 1.8;
-            margin-bottom: 15px;
-            color: #202124;
-        }
-        .detail-point, .unique-point {
-            font-size: 1.05em;
-            line-height: 1.7;
-            margin-bottom: 15px;
-            color: #3c4043;
-            padding-left: 15px;
-            border-left: 3px solid #1a73e8;
-        }
-        .supporting-info {
-            font-size: 1em;
-            line-height: 1.6;
-            color: #5f6368;
-            background-color: #fff;
-            padding: 15px;
-            border-radius: 8px;
-            margin-top: 15px;
-        }
-        .video-perspective {
-            margin-bottom: 25px;
-            padding: 15px;
-            background-color: #fff;
-            border-radius: 8px;
-        }
-        .video-title {
-            font-size: 1.2em;
-            color: #1a73e8;
-            margin-bottom: 12px;
-        }
-        b {
-            color: #202124;
-            background-color: #e8f0fe;
-            padding: 3px 6px;
-            border-radius: 4px;
-            font-weight: 600;
-        }
-        @media (max-width: 768px) {
-            .summary-container, .comparison-container {
-                padding: 10px;
-            }
-            .summary-section, .common-section, .unique-section, .conclusion-section {
-                padding: 15px;
-                margin-bottom: 25px;
-            }
-            .detail-point, .unique-point {
-                padding-left: 10px;
-            }
-        }
-        </style>
+    def _summary_messages(self, chunk, context, source_note=""):
+        """자막 조각 하나에 대한 요약 요청 메시지 생성"""
+        context_prompt = ""
+        if context:
+            context_prompt = (
+                f"영상 제목: {context['title']}\n"
+                f"검색 키워드: {context['keyword']}\n"
+            )
+
+        prompt = (
+            f"{context_prompt}"
+            f"{source_note}"
+            "다음 텍스트의 내용을 상세하게 정리하여 아래 HTML 구조로 작성해주세요:\n\n"
+            "<div class='summary-container'>\n"
+            "  <section class='summary-section'>\n"
+            "    <h3 class='section-title'>주요 맥락과 배경</h3>\n"
+            "    <div class='content-block'>\n"
+            "      <p class='main-point'>핵심 주제와 배경 (2-3문장)</p>\n"
+            "      <p class='detail-point'>구체적인 상황 설명 (2-3문장)</p>\n"
+            "      <p class='supporting-info'>관련된 맥락과 추가 정보 (2-3문장)</p>\n"
+            "    </div>\n"
+            "  </section>\n"
+            "  <!-- 위 구조로 총 3개 섹션 작성 -->\n"
+            "</div>\n\n"
+            "요구사항:\n"
+            "1. 정확히 3개의 섹션으로 구성 (주요 맥락/핵심 내용/결론)\n"
+            "2. 각 섹션은 반드시 3개의 단락으로 구성\n"
+            "3. 각 단락은 최소 2-3개의 완성된 문장으로 작성\n"
+            "4. 요약하지 말고 원문의 중요한 내용을 상세하게 포함\n"
+            "5. 중요한 수치는 <b> 태그로 강조\n"
+            "6. 메타설명이나 불필요한 설명 제외\n\n"
+            f"텍스트 내용:\n{chunk}"
+        )
+
+        return [
+            {"role": "system", "content": (
+                "You are a detailed content organization expert that creates "
+                "comprehensive, well-structured content in Korean. Include "
+                "sufficient detail and context while maintaining clear organization. "
+                "Each section should have three distinct paragraphs with "
+                "2-3 complete sentences each."
+            )},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _stream_completion(self, cache_key, message_batches, max_tokens, error_label,
+                           endpoint, summary_format=SUMMARY_FORMAT_INLINE):
+        """
+        OpenAI 스트리밍 응답을 SSE 이벤트로 변환하는 제너레이터
+        - token: 모델이 생성한 텍스트 조각을 받는 즉시 전달
+        - section: <section>이 닫힐 때마다 정제된 HTML 조각 전달 (같은 제목의 섹션은 한 번만)
+        - done: summary_format 형식의 전체 결과 (html 또는 sections/stylesheet)
+        - error: 생성 중 오류
+        캐시에 있는 요약이면 모델을 호출하지 않고 섹션과 완료 이벤트를 바로 보냄
         """
+        seen_titles = set()
+        cached = self.summary_cache.get(cache_key)
+        if cached is not None:
+            sections, _ = self._pop_closed_sections(cached, 0)
+            for section in sections:
+                event = self._section_event(section, seen_titles)
+                if event:
+                    yield event
+            yield sse_event("done", self._done_event_data(cached, summary_format, cached=True))
+            return
 
+        summaries = []
         try:
-            summary = re.sub(r"```html|```", "", summary)
-            summary = re.sub(r"위의 HTML.*$", "", summary, flags=re.MULTILINE)
-            summary = re.sub(r"이 HTML.*$", "", summary, flags=re.MULTILINE)
-            summary = re.sub(r"요약된 내용.*$", "", summary, flags=re.MULTILINE)
-            
-            soup = BeautifulSoup(summary, "html.parser")
-
-            # 중복 섹션 제거
-            seen_titles = set()
-            for section in soup.find_all(['section', 'div']):
-                title = section.find('h3')
-                if title:
-                    title_text = title.get_text().strip()
-                    if title_text in seen_titles:
-                        section.decompose()
-                    else:
-                        seen_titles.add(title_text)
-            
-            # 허용된 태그와 클래스 목록
-            allowed_tags = {
-                'div': ['summary-container', 'content-block', 'comparison-container', 'video-perspective'],
-                'section': ['summary-section', 'common-section', 'unique-section', 'conclusion-section'],
-                'h3': ['section-title'],
-                'h4': ['video-title'],
-                'p': ['main-point', 'detail-point', 'supporting-info', 'key-point', 'unique-point', 'conclusion-point'],
-                'b': []
-            }
-            
-            # 태그 정리
-            for tag in soup.find_all(True):
-                if tag.name not in allowed_tags:
-                    tag.unwrap()
-                else:
-                    if tag.get('class'):
-                        tag['class'] = [c for c in tag['class'] if c in allowed_tags[tag.name]]
-            
-            # 비디오 제목이 '비디오 1 제목' 형식인지 확인하고 수정
-            for video_title in soup.find_all('h4', class_='video-title'):
-                title_text = video_title.get_text().strip()
-                # '비디오 N 제목' 패턴 확인
-                if re.match(r'비디오\s*\d+\s*제목', title_text):
-                    # 이 경우 원래 제목을 복구할 수 없으므로 경고 메시지로 대체
-                    video_title.string = "영상 제목 형식 오류"
-            
-            final_html = css_style + str(soup.prettify())
-            final_html = re.sub(r'\n\s*\n', '\n', final_html)
-            
-            return final_html
+            for messages in message_batches:
+                buffer = ""
+                position = 0
+                for delta in self.llm_client.stream(messages, endpoint, temperature=0.5, max_tokens=max_tokens):
+                    buffer += delta
+                    yield sse_event("token", {"text": delta})
+
+                    sections, position = self._pop_closed_sections(buffer, position)
+                    for section in sections:
+                        event = self._section_event(section, seen_titles)
+                        if event:
+                            yield event
+                summaries.append(buffer.strip())
+
+            summary = "\n".join(summaries)
+            self.summary_cache.set(cache_key, summary)
+            yield sse_event("done", self._done_event_data(summary, summary_format, cached=False))
+
+        except Exception as e:
+            yield sse_event("error", {"detail": f"{error_label} 중 오류 발생: {str(e)}"})
+
+    def _done_event_data(self, summary, summary_format, cached):
+        rendered = self.render_summary(summary, summary_format)
+        data = dict(rendered) if isinstance(rendered, dict) else {"html": rendered}
+        data["cached"] = cached
+        return data
+
+    @staticmethod
+    def _pop_closed_sections(buffer, position):
+        """buffer의 position 이후에서 닫힌 <section> 조각들과 다음 탐색 위치를 반환"""
+        sections = []
+        while True:
+            end = buffer.find(SECTION_END_TAG, position)
+            if end == -1:
+                return sections, position
+            end += len(SECTION_END_TAG)
+            start = buffer.rfind("<section", position, end)
+            if start != -1:
+                sections.append(buffer[start:end])
+            position = end
+
+    def _section_event(self, section, seen_titles):
+        """섹션 조각을 정제하여 section 이벤트로 만들고, 이미 보낸 제목의 섹션이면 None"""
+        html, sections = self._sanitize(section)
+        title = sections[0]["title"] if sections else ""
+        if title:
+            if title in seen_titles:
+                return None
+            seen_titles.add(title)
+        return sse_event("section", {"html": html, "title": title})
+
+    def _check_summary_format(self, summary_format):
+        if summary_format not in SUMMARY_FORMATS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원하지 않는 요약 형식입니다: {summary_format} (가능한 값: {', '.join(SUMMARY_FORMATS)})"
+            )
+
+    def render_summary(self, summary, summary_format=SUMMARY_FORMAT_INLINE):
+        """
+        요약 원문을 응답 형식에 맞게 정제
+        - inline: 인라인 <style>을 앞에 붙인 HTML (기존 응답과 같은 형식)
+        - html: CSS 없는 HTML (/static/css/summary.css를 링크해서 사용)
+        - sections: 섹션별 제목/HTML 목록과 스타일시트 경로를 담은 dict
+        """
+        if summary_format == SUMMARY_FORMAT_INLINE:
+            return self.postprocess_summary(summary)
+        html, sections = self._sanitize(summary)
+        if summary_format == SUMMARY_FORMAT_HTML:
+            return html
+        return {"stylesheet": SUMMARY_STYLESHEET, "sections": sections}
 
+    def postprocess_summary(self, summary):
+        return INLINE_SUMMARY_CSS + self.sanitize_summary_html(summary)
+
+    def sanitize_summary_html(self, summary):
+        """모델이 생성한 HTML에서 메타설명, 중복 섹션, 허용되지 않은 태그/클래스를 정리 (CSS 제외)"""
+        return self._sanitize(summary)[0]
+
+    def _sanitize(self, summary):
+        try:
+            return sanitize(summary)
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"HTML 처리 중 오류 발생: {str(e)}")
\ No newline at end of file
+            raise HTTPException(status_code=500, detail=f"HTML 처리 중 오류 발생: {str(e)}")
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# backend 모듈들은 패키지가 아닌 평평한 모듈이므로 backend 디렉터리를 import 경로에 추가
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
@@ -0,0 +1,101 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from crawl_scheduler import CrawlScheduler
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = CrawlScheduler(max_workers=3)
+    yield scheduler
+    scheduler.close()
+
+
+def urls(count, prefix="page"):
+    return [f"http://example.test/{prefix}?pageIndex={index}" for index in range(1, count + 1)]
+
+
+def test_results_are_in_page_order_and_stop_at_terminal_page(scheduler):
+    def fetch(url):
+        page = int(url.rsplit("=", 1)[1])
+        time.sleep(0.01 * (5 - page % 5))
+        return [] if page >= 5 else [page]
+
+    result = scheduler.crawl(urls(8), fetch, is_terminal=lambda page, rows: not rows)
+    assert result == [[1], [2], [3], [4]]
+
+
+def test_first_page_error_is_raised_and_later_page_errors_end_the_crawl(scheduler):
+    def fetch_first_fails(url):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        scheduler.crawl(urls(4), fetch_first_fails)
+
+    def fetch_third_fails(url):
+        page = int(url.rsplit("=", 1)[1])
+        if page == 3:
+            raise RuntimeError("boom")
+        return page
+
+    assert scheduler.crawl(urls(6), fetch_third_fails) == [1, 2]
+
+
+def test_concurrent_crawls_share_one_bounded_pool(scheduler):
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+    threads = set()
+
+    def fetch(url):
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        with lock:
+            running["now"] -= 1
+        return url
+
+    with ThreadPoolExecutor(max_workers=4) as callers:
+        results = list(callers.map(lambda prefix: scheduler.crawl(urls(6, prefix), fetch), ["a", "b", "c", "d"]))
+
+    assert results == [urls(6, prefix) for prefix in ["a", "b", "c", "d"]]
+    # 동시에 들어온 크롤링을 합쳐도 스케줄러의 max_workers를 넘지 않고 같은 스레드들을 재사용
+    assert running["max"] <= 3
+    assert len(threads) <= 3
+
+
+def test_raise_errors_fail_the_crawl_instead_of_ending_it(scheduler):
+    class Busy(Exception):
+        pass
+
+    def fetch(url):
+        page = int(url.rsplit("=", 1)[1])
+        if page == 3:
+            raise Busy()
+        return page
+
+    # 일반 예외는 결과 끝으로 보지만 raise_errors에 속하면 잘린 결과 대신 예외를 전달
+    assert scheduler.crawl(urls(5), fetch) == [1, 2]
+    with pytest.raises(Busy):
+        scheduler.crawl(urls(5), fetch, raise_errors=(Busy,))
+
+
+def test_max_workers_limits_a_single_crawl(scheduler):
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+
+    def fetch(url):
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        time.sleep(0.01)
+        with lock:
+            running["now"] -= 1
+        return url
+
+    assert scheduler.crawl(urls(6), fetch, max_workers=1) == urls(6)
+    assert running["max"] == 1
@@ -0,0 +1,122 @@
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException, WebDriverException
+
+from driver_pool import DriverPool, DriverPoolTimeout
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.check()
+
+
+class FakeDriver:
+    """풀이 상태 확인/정리에 쓰는 명령만 흉내 내는 드라이버 (alive=False면 모든 명령이 실패)"""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.switch_to = FakeSwitchTo(self)
+
+    def check(self):
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+
+    @property
+    def window_handles(self):
+        self.check()
+        return ["main"]
+
+    def close(self):
+        self.check()
+
+    def delete_all_cookies(self):
+        self.check()
+
+    def execute_script(self, script, *args):
+        self.check()
+        return 1
+
+    def get(self, url):
+        self.check()
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool():
+    created = []
+
+    def factory():
+        created.append(FakeDriver())
+        return created[-1]
+
+    pool = DriverPool(size=1, max_uses=3, acquire_timeout=0.1, factory=factory)
+    pool.created = created
+    yield pool
+    pool.close()
+
+
+def test_page_timeout_keeps_the_driver(pool):
+    with pytest.raises(TimeoutException):
+        with pool.lease() as driver:
+            raise TimeoutException("결과 표를 기다리다 시간 초과")
+
+    with pool.lease() as again:
+        assert again is driver
+    assert len(pool.created) == 1
+    assert pool.stats()["discarded_unhealthy"] == 0
+
+
+def test_invalid_session_replaces_the_driver(pool):
+    with pytest.raises(InvalidSessionIdException):
+        with pool.lease() as driver:
+            raise InvalidSessionIdException("invalid session id")
+
+    assert driver.quit_called
+    with pool.lease() as again:
+        assert again is not driver
+    assert len(pool.created) == 2
+    assert pool.stats()["discarded_unhealthy"] == 1
+
+
+def test_page_error_on_dead_browser_replaces_the_driver(pool):
+    with pytest.raises(WebDriverException):
+        with pool.lease() as driver:
+            driver.alive = False
+            raise WebDriverException("chrome not reachable")
+
+    with pool.lease() as again:
+        assert again is not driver
+    assert pool.stats()["discarded_unhealthy"] == 1
+
+
+def test_unhealthy_idle_driver_is_replaced_on_acquire(pool):
+    with pool.lease() as driver:
+        pass
+    driver.alive = False
+
+    with pool.lease() as again:
+        assert again is not driver
+    assert driver.quit_called
+
+
+def test_driver_is_recycled_after_max_uses(pool):
+    drivers = []
+    for _ in range(4):
+        with pool.lease() as driver:
+            drivers.append(driver)
+
+    assert drivers[0] is drivers[1] is drivers[2]
+    assert drivers[3] is not drivers[0]
+    assert pool.stats()["recycled"] == 1
+
+
+def test_acquire_times_out_when_pool_is_exhausted(pool):
+    with pool.lease():
+        with pytest.raises(DriverPoolTimeout):
+            pool.acquire()
+    assert pool.stats()["timeouts"] == 1
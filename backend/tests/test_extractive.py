@@ -0,0 +1,56 @@
+import random
+
+from extractive import FLAG_LABELS, extract_comparison, render_flagged, split_units
+from token_budget import HeuristicTokenCounter
+
+WORDS = "요양 보호사 자격증 시험 필기 실기 합격 일자리 고용 검색 시급 지역 경비원 근무 시간 급여 복지 센터 상담 면접".split()
+
+
+def transcript(sentence_count, seed):
+    rnd = random.Random(seed)
+    return ". ".join(" ".join(rnd.choice(WORDS) for _ in range(8)) for _ in range(sentence_count)) + "."
+
+
+def test_comparison_keeps_every_unit_when_transcripts_fit_the_budget():
+    counter = HeuristicTokenCounter()
+    texts = [transcript(12, 1), transcript(10, 2), transcript(3, 3)]
+    result = extract_comparison(texts, 3000, counter)
+
+    assert [[sentence for sentence, _ in video] for video in result] == [split_units(text) for text in texts]
+    assert any(flag for video in result for _, flag in video)
+
+
+def test_comparison_keeps_short_korean_videos():
+    counter = HeuristicTokenCounter()
+    texts = [
+        "오늘은 요양보호사 자격증 시험에 대해 알아보겠습니다. 시험은 필기와 실기로 나뉩니다. "
+        "합격 기준은 60점 이상입니다. 네 맞습니다.",
+        "요양보호사 일자리는 어디서 찾을까요. 고용24에서 검색하면 됩니다. 요양보호사 자격증이 있으면 유리합니다.",
+    ]
+    result = extract_comparison(texts, 1000, counter)
+    assert [len(video) for video in result] == [len(split_units(text)) for text in texts]
+
+
+def test_comparison_counts_labels_against_each_video_budget():
+    counter = HeuristicTokenCounter()
+    texts = [transcript(40, 4), transcript(25, 5), transcript(5, 6)]
+    flagged_total = sum(
+        counter.count(render_flagged(video)) for video in extract_comparison(texts, 10 ** 6, counter)
+    )
+
+    for budget in (flagged_total - 50, 600, 300):
+        result = extract_comparison(texts, budget, counter)
+        rendered = [render_flagged(video) for video in result]
+        assert sum(counter.count(text) for text in rendered) <= budget
+        assert all(result[:2]), budget
+    # 라벨이 붙은 문장이 있어야 라벨 길이를 예산에 넣는지 확인할 수 있음
+    assert any(label in " ".join(rendered) for label in FLAG_LABELS.values())
+
+
+def test_comparison_without_terms_falls_back_to_truncation():
+    counter = HeuristicTokenCounter()
+    assert extract_comparison(["ㅋㅋㅋ ㅎㅎ"], 10, counter) == [[("ㅋㅋㅋ ㅎㅎ", None)]]
+
+    result = extract_comparison(["ㅋㅋㅋ ㅎㅎ. ㅠㅠ ㅠㅠ ㅠㅠ", ""], 3, counter)
+    assert counter.count(render_flagged(result[0])) <= 3
+    assert result[1] == []
@@ -0,0 +1,20 @@
+from html_sanitizer import sanitize
+
+
+def test_br_is_kept_as_line_break():
+    assert sanitize("<p>끝<br>줄</p>")[0] == "<p>끝<br>줄</p>"
+    assert sanitize("<p>끝<br/>줄</p>")[0] == "<p>끝<br>줄</p>"
+
+
+def test_whitespace_between_inline_tags_collapses_to_one_space():
+    assert sanitize("<p><b>a</b>\n<b>b</b></p>")[0] == "<p><b>a</b> <b>b</b></p>"
+    assert sanitize("<b>a</b>\n   <b>b</b>")[0] == "<b>a</b> <b>b</b>"
+
+
+def test_whitespace_between_block_tags_is_dropped():
+    html = "<div>\n  <p>x</p>\n  <p>y <b>z</b>\n</p>\n</div>"
+    assert sanitize(html)[0] == "<div><p>x</p><p>y <b>z</b></p></div>"
+
+
+def test_dropped_content_does_not_leave_br():
+    assert sanitize("<p>a<script>x<br>y</script>b</p>")[0] == "<p>ab</p>"
@@ -0,0 +1,62 @@
+import asyncio
+
+import openai
+import pytest
+
+from llm_client import LLMClient, StreamTimeoutError
+
+
+def fake_acreate(delays):
+    """delays[i]초 뒤에 i번째 조각을 내보내는 스트리밍 응답을 돌려주는 acreate 대체 함수"""
+
+    async def acreate(**kwargs):
+        async def chunks():
+            for index, delay in enumerate(delays):
+                await asyncio.sleep(delay)
+                yield {"choices": [{"delta": {"content": f"{index} "}}]}
+
+        return chunks()
+
+    return acreate
+
+
+@pytest.fixture
+def make_client():
+    clients = []
+
+    def make(**kwargs):
+        client = LLMClient(api_key="test", max_retries=0, **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def test_stream_yields_chunks_within_timeouts(monkeypatch, make_client):
+    monkeypatch.setattr(openai.ChatCompletion, "acreate", fake_acreate([0, 0.01, 0.01]))
+    client = make_client(stream_idle_timeout=1, stream_timeout=5)
+
+    assert list(client.stream([{"role": "user", "content": "x"}], "summary.stream")) == ["0 ", "1 ", "2 "]
+    assert client.usage.snapshot()["summary.stream"]["errors"] == 0
+
+
+def test_stream_raises_when_next_chunk_stalls(monkeypatch, make_client):
+    monkeypatch.setattr(openai.ChatCompletion, "acreate", fake_acreate([0, 5]))
+    client = make_client(stream_idle_timeout=0.1, stream_timeout=10)
+
+    received = []
+    with pytest.raises(StreamTimeoutError, match="멈췄습니다"):
+        for delta in client.stream([{"role": "user", "content": "x"}], "summary.stream"):
+            received.append(delta)
+    assert received == ["0 "]
+    assert client.usage.snapshot()["summary.stream"]["errors"] == 1
+
+
+def test_stream_raises_when_overall_deadline_passes(monkeypatch, make_client):
+    monkeypatch.setattr(openai.ChatCompletion, "acreate", fake_acreate([0.05] * 20))
+    client = make_client(stream_idle_timeout=1, stream_timeout=0.3)
+
+    with pytest.raises(StreamTimeoutError, match="끝나지 않았습니다"):
+        list(client.stream([{"role": "user", "content": "x"}], "summary.stream"))
@@ -0,0 +1,92 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from page_waits import PAGE_STATE_SCRIPT, AdaptiveTimeout, PageWaiter
+
+
+def state(table="table", marker=None, overlay=False, first_row_id="row1", active_page="1"):
+    return {"table": table, "marker": marker, "overlay": overlay,
+            "first_row_id": first_row_id, "active_page": active_page}
+
+
+class FakeDriver:
+    """PAGE_STATE_SCRIPT 호출마다 states를 차례로 돌려주고 마지막 상태를 계속 유지하는 드라이버"""
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.marks = []
+
+    def execute_script(self, script, mark, pager_xpath):
+        assert script == PAGE_STATE_SCRIPT
+        self.marks.append(mark)
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def test_adaptive_timeout_uses_initial_until_enough_samples():
+    adaptive = AdaptiveTimeout(initial=10, minimum=1, maximum=30, multiplier=3, window=5, min_samples=3)
+    adaptive.record(0.5)
+    adaptive.record(0.5)
+    assert adaptive.timeout() == 10
+    adaptive.record(2.0)
+    # p95 = 2.0 → 2.0 × 3
+    assert adaptive.timeout() == 6.0
+
+
+def test_adaptive_timeout_is_clamped_and_forgets_old_samples():
+    adaptive = AdaptiveTimeout(initial=10, minimum=1, maximum=30, multiplier=3, window=3, min_samples=3)
+    for seconds in (0.01, 0.01, 0.01):
+        adaptive.record(seconds)
+    assert adaptive.timeout() == 1
+    for seconds in (20, 20, 20):
+        adaptive.record(seconds)
+    assert adaptive.timeout() == 30
+    for seconds in (1, 1, 1):
+        adaptive.record(seconds)
+    assert adaptive.percentile() == 1
+    assert adaptive.timeout() == 3
+
+
+@pytest.mark.parametrize("before, after, signal", [
+    (None, state(), "ready"),
+    (state(table=None), state(), "table_loaded"),
+    (state(marker="m1"), state(marker=None), "table_replaced"),
+    (state(marker="m1"), state(marker="m1", first_row_id="row9"), "first_row_changed"),
+    (state(marker="m1"), state(marker="m1", active_page="2"), "active_page_changed"),
+    (state(marker="m1"), state(marker="m1"), None),
+])
+def test_transition_signal(before, after, signal):
+    assert PageWaiter._transition_signal(before, after) == signal
+
+
+def test_wait_for_results_waits_for_overlay_and_replaced_table():
+    waiter = PageWaiter(initial_timeout=2, poll_frequency=0.001)
+    driver = FakeDriver([
+        state(marker=None),  # snapshot: 표시를 남기기 전 상태
+        state(marker="page-wait-1", overlay=True),
+        state(marker="page-wait-1"),
+        state(table="new-table", marker=None, first_row_id="row11", active_page="2"),
+    ])
+
+    before = waiter.snapshot(driver)
+    assert before["marker"] == "page-wait-1"
+    assert waiter.wait_for_results(driver, before) == "new-table"
+    assert driver.marks[0] == "page-wait-1" and driver.marks[1:] == [None, None, None]
+    assert waiter.stats()["signals"] == {"table_replaced": 1}
+
+
+def test_wait_for_results_falls_back_to_ready_table_on_timeout():
+    waiter = PageWaiter(initial_timeout=0.05, poll_frequency=0.001)
+    before = state(marker="m1")
+    table = waiter.wait_for_results(FakeDriver([state(marker="m1")]), before)
+
+    assert table == "table"
+    stats = waiter.stats()["kinds"]["page"]
+    assert stats["timeouts"] == 1
+    # 시간 초과는 제한 시간 학습에 넣지 않음
+    assert stats["p95_seconds"] == 0.0
+
+
+def test_wait_for_results_raises_when_table_never_appears():
+    waiter = PageWaiter(initial_timeout=0.05, poll_frequency=0.001)
+    with pytest.raises(TimeoutException):
+        waiter.wait_for_results(FakeDriver([state(table=None)]))
@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+from selenium import webdriver
+
+import d_sup
+import o_sup
+from benchmarks.bench_work24_crawler import FIXTURE_DIR, fixture_pages, start_fixture_server, without_host
+from benchmarks.webdriver_stub import make_server
+from crawl_scheduler import CrawlScheduler
+from driver_pool import DriverPool, default_chrome_options
+from http_client import HttpClient
+from page_waits import PageWaiter
+from work24_crawler import (
+    EXTRACT_ROWS_SCRIPT, Work24CrawlError, Work24Crawler, crawl_pages_with_driver, extract_rows,
+    extract_rows_by_element, page_url, parse_job_rows,
+)
+
+SUP_MODULES = {"senior": o_sup, "disabled": d_sup}
+
+
+def expected_jobs(prefix):
+    with open(os.path.join(FIXTURE_DIR, f"expected_{prefix}.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def processed(rows, prefix):
+    preprocess_job_data = SUP_MODULES[prefix].preprocess_job_data
+    return without_host([{**row, "data": preprocess_job_data(row["data"])} for row in rows])
+
+
+@pytest.fixture(scope="module", params=sorted(SUP_MODULES))
+def fixture_site(request):
+    """(prefix, 저장된 목록 페이지를 pageIndex별로 돌려주는 로컬 서버의 1페이지 URL)"""
+    server, target_url = start_fixture_server(fixture_pages(request.param), 0)
+    yield request.param, target_url
+    server.shutdown()
+
+
+@pytest.fixture(scope="module")
+def webdriver_url():
+    """Chrome 대신 저장된 HTML을 파싱해 W3C WebDriver 명령에 답하는 스텁 서버 주소"""
+    server = make_server(port=0, command_latency=0, transition_latency=0.02)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def driver_pool(webdriver_url):
+    pool = DriverPool(size=3, factory=lambda: webdriver.Remote(command_executor=webdriver_url,
+                                                               options=default_chrome_options()))
+    yield pool
+    pool.close()
+
+
+def test_http_crawler_matches_expected_jobs(fixture_site):
+    prefix, target_url = fixture_site
+    crawler = Work24Crawler(HttpClient(max_retries=0), scheduler=CrawlScheduler(max_workers=3))
+    try:
+        assert processed(crawler.crawl(target_url), prefix) == expected_jobs(prefix)
+    finally:
+        crawler.scheduler.close()
+
+
+def test_page_without_result_table_raises():
+    with open(os.path.join(FIXTURE_DIR, "blocked.html"), "rb") as f:
+        with pytest.raises(Work24CrawlError):
+            parse_job_rows(f.read())
+
+
+def test_scrape_data_uses_http_crawler_and_preprocesses_rows(fixture_site):
+    prefix, target_url = fixture_site
+    scrape = {"senior": o_sup.scrape_data_senior, "disabled": d_sup.scrape_data_disabled}[prefix]
+    crawler = Work24Crawler(HttpClient(max_retries=0))
+    try:
+        assert without_host(scrape(target_url=target_url, crawler=crawler)) == expected_jobs(prefix)
+    finally:
+        crawler.scheduler.close()
+
+
+def test_bulk_extraction_matches_per_element_reads(fixture_site, driver_pool):
+    prefix, target_url = fixture_site
+    waiter = PageWaiter()
+    rows = []
+    with driver_pool.lease() as driver:
+        for page_index in range(1, len(fixture_pages(prefix)) + 1):
+            url = page_url(target_url, page_index)
+            driver.get(url)
+            table = waiter.wait_for_results(driver)
+            bulk = extract_rows(driver, table)
+            assert bulk == extract_rows_by_element(table)
+            page_rows = [SUP_MODULES[prefix]._row_job_data(row) for row in bulk]
+            # HTTP 크롤러와 Selenium 크롤러는 preprocess_job_data 전의 원시 행도 같아야 함
+            assert page_rows == parse_job_rows(fixture_pages(prefix)[page_index - 1], base_url=url)
+            rows.extend(page_rows)
+    assert processed(rows, prefix) == expected_jobs(prefix)
+
+
+def test_concurrent_selenium_crawl_matches_expected_jobs(fixture_site, driver_pool):
+    prefix, target_url = fixture_site
+    scheduler = CrawlScheduler(max_workers=3)
+    try:
+        urls = [page_url(target_url, page_index) for page_index in range(1, 11)]
+        rows = crawl_pages_with_driver(scheduler, driver_pool, urls, SUP_MODULES[prefix]._row_job_data, PageWaiter())
+    finally:
+        scheduler.close()
+    assert processed(rows, prefix) == expected_jobs(prefix)
+
+
+def test_sequential_selenium_crawl_matches_expected_jobs(fixture_site, driver_pool):
+    prefix, target_url = fixture_site
+    scrape = {"senior": o_sup._scrape_data_senior_selenium, "disabled": d_sup._scrape_data_disabled_selenium}[prefix]
+    # 페이지 버튼 클릭 → blockUI 오버레이 → 표 교체를 PageWaiter가 기다림 (마지막 페이지에서는 다음 버튼이 없어 종료)
+    rows = scrape(target_url=target_url, driver_pool=driver_pool, waiter=PageWaiter(poll_frequency=0.01))
+    assert without_host(rows) == expected_jobs(prefix)
+
+
+class SlowPageDriver:
+    """목록 페이지를 여는 데 load_seconds가 걸리고 페이지마다 다른 행 하나를 돌려주는 드라이버"""
+
+    def __init__(self, load_seconds):
+        self.load_seconds = load_seconds
+        self.url = None
+        self.window_handles = ["main"]
+        self.switch_to = type("SwitchTo", (), {"window": lambda self, handle: None})()
+
+    def get(self, url):
+        if url != "about:blank":
+            time.sleep(self.load_seconds)
+        self.url = url
+
+    def execute_script(self, script, *args):
+        if script == EXTRACT_ROWS_SCRIPT:
+            return [{"id": self.url, "cells": [self.url], "links": []}]
+        return 1
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class ReadyWaiter:
+    def wait_for_results(self, driver, before=None):
+        return "table"
+
+
+def test_driver_crawl_is_capped_at_pool_size_instead_of_ending_early():
+    # 스케줄러는 5개씩 요청하지만 드라이버는 2개뿐이고, 드라이버를 기다리는 시간(0.3초)은 페이지 두 개를 열기에 부족함
+    pool = DriverPool(size=2, acquire_timeout=0.3, factory=lambda: SlowPageDriver(0.25))
+    scheduler = CrawlScheduler(max_workers=5)
+    urls = [page_url("http://example.test/list?pageIndex=1", page_index) for page_index in range(1, 7)]
+    try:
+        rows = crawl_pages_with_driver(scheduler, pool, urls, lambda row: row, ReadyWaiter())
+    finally:
+        scheduler.close()
+        pool.close()
+    assert [row["id"] for row in rows] == urls
@@ -0,0 +1,132 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
+
+import pytest
+import requests
+
+import youtube_service
+from http_client import HttpClient
+from quota import QuotaTracker
+from youtube_service import SearchContext, YouTubeService
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self.text = ""
+        self.headers = {}
+        self._payload = payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code}")
+
+    def close(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeYouTubeHttpClient:
+    """
+    search.list는 검색어(q)를 담은 video_id를, videos.list는 그 video_id를 제목으로 돌려주는 스텁
+    응답마다 짧게 임의로 지연시켜 동시 호출이 서로 섞이도록 함
+    """
+
+    def __init__(self):
+        self._random = random.Random(7)
+        self._lock = threading.Lock()
+
+    def _delay(self):
+        with self._lock:
+            delay = self._random.uniform(0, 0.003)
+        time.sleep(delay)
+
+    def get(self, url, params=None, **kwargs):
+        self._delay()
+        if url.endswith("/search"):
+            return FakeResponse({
+                "items": [{"id": {"videoId": f"{params['q']}|{index}"}} for index in range(3)]
+            })
+        video_ids = params["id"].split(",")
+        return FakeResponse({
+            "items": [
+                {
+                    "id": video_id,
+                    "snippet": {"title": unquote(video_id), "channelTitle": "stub"},
+                    "statistics": {"viewCount": str(1000 - len(video_id) - int(video_id.rsplit("|", 1)[1]))},
+                }
+                for video_id in video_ids
+            ]
+        })
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(
+        youtube_service.YouTubeTranscriptApi, "get_transcript",
+        staticmethod(lambda video_id, languages=None: [{"text": "자막"}]),
+    )
+    service = YouTubeService(api_key="test", max_workers=8, http_client=FakeYouTubeHttpClient())
+    yield service
+    service._executor.shutdown(wait=True)
+
+
+def test_concurrent_mixed_mode_searches_keep_their_own_context(service):
+    keywords = ["간호사", "요양보호사", "바리스타", "장애인 사무보조", "고령자 경비원"]
+    calls = [(keyword, mode) for keyword in keywords for mode in ("general", "disability", "senior")] * 4
+    random.Random(3).shuffle(calls)
+
+    def search(call):
+        keyword, mode = call
+        return call, service.search_youtube_videos_by_category(keyword, mode=mode)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(search, calls))
+
+    for (keyword, mode), result in results:
+        base_keyword = SearchContext(keyword, mode).base_keyword
+        videos = [video for category in result.values() for video in category["videos"]]
+        assert videos, (keyword, mode)
+        for video in videos:
+            # 제목은 검색어에서 나온 video_id이므로 이 호출의 base_keyword로 시작해야 함
+            assert video["title"].startswith(f"{base_keyword} "), (keyword, mode, video["title"])
+            assert video["search_keyword"] == keyword
+            assert video["is_disability_content"] is (mode == "disability")
+
+
+def retrying_service(monkeypatch, statuses, quota_tracker):
+    """session.request가 statuses 순서대로 응답하는 HttpClient(재시도 대기 없음)를 쓰는 YouTubeService"""
+    http_client = HttpClient(max_retries=3, backoff_base=0)
+    responses = iter(statuses)
+    monkeypatch.setattr(
+        http_client.session, "request",
+        lambda method, url, **kwargs: FakeResponse({"items": [{"id": {"videoId": "v1"}}]}, next(responses)),
+    )
+    return YouTubeService(api_key="test", http_client=http_client, quota_tracker=quota_tracker), http_client
+
+
+def test_search_retries_are_charged_against_the_quota(monkeypatch):
+    tracker = QuotaTracker(daily_budget=10000)
+    service, http_client = retrying_service(monkeypatch, [503, 429, 200], tracker)
+
+    assert service._search_video_ids("간호사") == ["v1"]
+    assert http_client.stats.snapshot()["requests"] == 3
+    assert tracker.stats()["used_by_call"] == {"search.list": 300}
+
+
+def test_search_stops_retrying_when_quota_runs_out(monkeypatch):
+    # 예비 할당량(100)을 남겨야 하므로 이미 700을 쓴 뒤에는 search.list를 두 번(첫 요청 + 재시도 1번)만 보낼 수 있음
+    tracker = QuotaTracker(daily_budget=1000, reserve_ratio=0.1)
+    for _ in range(7):
+        tracker.try_acquire("search.list")
+    service, http_client = retrying_service(monkeypatch, [503, 503, 503, 200], tracker)
+
+    assert service._search_video_ids("간호사") is None
+    assert http_client.stats.snapshot()["requests"] == 2
+    assert tracker.stats()["used"] == 900
+    assert tracker.stats()["denied_by_call"] == {"search.list": 1}
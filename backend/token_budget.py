@@ -0,0 +1,178 @@
+import logging
+import math
+import re
+
+logger = logging.getLogger(__name__)
+
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?]) +')
+HANGUL_PATTERN = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+ASCII_PATTERN = re.compile(r'[\x21-\x7e]')
+
+
+class HeuristicTokenCounter:
+    """
+    토크나이저를 쓸 수 없을 때 사용하는 근사 토큰 계산기
+    cl100k_base 기준 한글은 음절당 1토큰 남짓, 영문/숫자/기호는 약 4글자당 1토큰이므로 조금 넉넉하게 셈
+    (예산을 넘기지 않는 쪽으로 과대 추정)
+    """
+
+    name = "heuristic"
+    HANGUL_TOKENS_PER_CHAR = 1.2
+    ASCII_CHARS_PER_TOKEN = 3.5
+
+    def count(self, text):
+        if not text:
+            return 0
+        hangul = len(HANGUL_PATTERN.findall(text))
+        ascii_chars = len(ASCII_PATTERN.findall(text))
+        other = len(text) - hangul - ascii_chars - text.count(" ")
+        return math.ceil(
+            hangul * self.HANGUL_TOKENS_PER_CHAR + ascii_chars / self.ASCII_CHARS_PER_TOKEN + max(other, 0)
+        )
+
+
+class TiktokenCounter:
+    """tiktoken 인코딩으로 실제 모델 토큰 수를 계산"""
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+        self.name = encoding.name
+
+    def count(self, text):
+        if not text:
+            return 0
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+def load_token_counter(encoding_name="cl100k_base"):
+    """
+    tiktoken 인코딩을 불러와 토큰 계산기를 생성 (실패하면 근사 계산기로 대체)
+    tiktoken은 인코딩 파일을 TIKTOKEN_CACHE_DIR에 캐시하므로, 오프라인 환경에서는
+    인터넷이 되는 곳에서 `python token_budget.py --warm`으로 받아 둔 캐시 디렉터리를 함께 배포하면 됨
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken이 설치되어 있지 않아 근사 토큰 계산을 사용합니다.")
+        return HeuristicTokenCounter()
+
+    try:
+        return TiktokenCounter(tiktoken.get_encoding(encoding_name))
+    except Exception as e:
+        logger.warning(f"토크나이저 인코딩({encoding_name})을 불러오지 못해 근사 토큰 계산을 사용합니다: {str(e)}")
+        return HeuristicTokenCounter()
+
+
+def split_sentences(text):
+    return [sentence for sentence in SENTENCE_SPLIT_PATTERN.split(text) if sentence]
+
+
+def truncate_to_tokens(text, budget, counter):
+    """문장 하나가 예산보다 길 때 앞부분을 예산 안에 들어가는 만큼만 남김 (글자 수 기준 이진 탐색)"""
+    if counter.count(text) <= budget:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if counter.count(text[:middle]) <= budget:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low]
+
+
+def pack_sentences(text, budget, counter):
+    """
+    문장을 자르지 않고 순서대로 budget 토큰까지 담음
+    첫 문장부터 예산을 넘으면 그 문장만 예산 길이로 잘라서 반환
+    """
+    if budget <= 0 or not text:
+        return ""
+    if counter.count(text) <= budget:
+        return text
+
+    packed = []
+    used = 0
+    for sentence in split_sentences(text):
+        tokens = counter.count(sentence) + (1 if packed else 0)  # 문장 사이 공백
+        if used + tokens > budget:
+            break
+        packed.append(sentence)
+        used += tokens
+
+    if not packed:
+        return truncate_to_tokens(text, budget, counter)
+    return " ".join(packed)
+
+
+def chunk_sentences(text, chunk_budget, counter):
+    """문장을 자르지 않고 chunk_budget 토큰 이내의 조각들로 나눔 (예산보다 긴 문장은 그 문장만 잘라서 조각 하나로)"""
+    chunks = []
+    current = []
+    used = 0
+    for sentence in split_sentences(text):
+        tokens = counter.count(sentence)
+        if tokens > chunk_budget:
+            sentence = truncate_to_tokens(sentence, chunk_budget, counter)
+            tokens = counter.count(sentence)
+        if current and used + 1 + tokens > chunk_budget:
+            chunks.append(" ".join(current))
+            current = []
+            used = 0
+        used += tokens + (1 if current else 0)
+        current.append(sentence)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def allocate_budget(token_counts, total_budget):
+    """
+    전체 토큰 예산을 각 항목의 길이(토큰 수)에 비례하여 나눔
+    자기 몫보다 짧은 항목은 필요한 만큼만 받고, 남은 예산은 아직 더 필요한 항목들에 다시 비례 배분
+    """
+    allocations = [0] * len(token_counts)
+    remaining_budget = total_budget
+    pending = [index for index, count in enumerate(token_counts) if count > 0]
+
+    while pending and remaining_budget > 0:
+        pending_total = sum(token_counts[index] for index in pending)
+        satisfied = [
+            index for index in pending
+            if token_counts[index] <= remaining_budget * token_counts[index] / pending_total
+        ]
+        if not satisfied:
+            # 남은 항목은 모두 몫보다 길므로 비례 배분하고 끝냄 (내림으로 생긴 나머지는 긴 항목부터 1씩)
+            shares = [remaining_budget * token_counts[index] / pending_total for index in pending]
+            for index, share in zip(pending, shares):
+                allocations[index] = int(share)
+            leftover = remaining_budget - sum(int(share) for share in shares)
+            for index in sorted(pending, key=lambda i: token_counts[i], reverse=True)[:leftover]:
+                allocations[index] += 1
+            break
+
+        for index in satisfied:
+            allocations[index] = token_counts[index]
+            remaining_budget -= token_counts[index]
+        pending = [index for index in pending if index not in satisfied]
+
+    return allocations
+
+
+def pack_texts(texts, total_budget, counter):
+    """여러 텍스트가 전체 예산을 길이에 비례하여 나눠 쓰도록 각각 문장 단위로 담음"""
+    allocations = allocate_budget([counter.count(text) for text in texts], total_budget)
+    return [pack_sentences(text, budget, counter) for text, budget in zip(texts, allocations)]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="tiktoken 인코딩 파일을 TIKTOKEN_CACHE_DIR에 미리 받아 둡니다.")
+    parser.add_argument("--warm", action="store_true", help="인코딩을 내려받아 캐시")
+    parser.add_argument("--encoding", default="cl100k_base")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    counter = load_token_counter(args.encoding) if args.warm else HeuristicTokenCounter()
+    print(f"토큰 계산기: {counter.name}")
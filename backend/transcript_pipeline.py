@@ -0,0 +1,68 @@
+import re
+from collections import deque
+
+# 자막 정리에 쓰는 정규식 (세그먼트마다 다시 컴파일하지 않도록 미리 컴파일)
+ANNOTATION_PATTERN = re.compile(r'\[[^\]]*\]')  # [음악], [박수] 같은 자동 자막 효과음 표기
+DISALLOWED_CHARS_PATTERN = re.compile(r'[^\w\s.,!?()\'\"가-힣]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# 이미 이어 붙인 문자열이 들어오면 문장 단위로 나누어 세그먼트처럼 처리
+SENTENCE_PIECE_PATTERN = re.compile(r'\S.*?(?:[.!?](?=\s)|$)', re.DOTALL)
+
+
+def clean_segments(segments):
+    """자막 세그먼트에서 효과음 표기와 허용하지 않는 문자를 지우고 공백을 정리 (빈 세그먼트는 버림)"""
+    for segment in segments:
+        text = ANNOTATION_PATTERN.sub(' ', segment)
+        text = DISALLOWED_CHARS_PATTERN.sub('', text)
+        text = WHITESPACE_PATTERN.sub(' ', text).strip()
+        if text:
+            yield text
+
+
+def drop_repeated_segments(texts, window=3, min_overlap_words=2, max_overlap_words=30):
+    """
+    자동 생성 자막에서 반복되거나 겹치는 부분을 제거
+    - 최근 window개 세그먼트와 똑같거나 직전 세그먼트 안에 통째로 들어 있는 세그먼트는 버림
+    - 직전 세그먼트의 끝 단어들이 다음 세그먼트 앞에 다시 나오면(롤링 자막) 겹치는 앞부분을 잘라냄
+    """
+    recent = deque(maxlen=window)
+    previous_words = []
+    for text in texts:
+        if text in recent:
+            continue
+        words = text.split(' ')
+        if previous_words and f" {text} " in f" {' '.join(previous_words)} ":
+            continue
+
+        overlap = 0
+        for size in range(min(len(previous_words), len(words) - 1, max_overlap_words), min_overlap_words - 1, -1):
+            if previous_words[-size:] == words[:size]:
+                overlap = size
+                break
+
+        recent.append(text)
+        previous_words = words
+        yield ' '.join(words[overlap:]) if overlap else text
+
+
+def take_until_budget(texts, budget, counter):
+    """텍스트를 앞에서부터 이어 붙이다가 budget 토큰을 넘으면 더 읽지 않고 멈춤 (budget이 None이면 전부)"""
+    pieces = []
+    used = 0
+    for text in texts:
+        pieces.append(text)
+        if budget is not None:
+            used += counter.count(text) + 1
+            if used > budget:
+                break
+    return ' '.join(pieces)
+
+
+def normalize_transcript(segments, budget=None, counter=None):
+    """
+    자막 세그먼트(또는 문자열 하나)를 필요한 만큼만 읽어서 정리된 텍스트로 만듦
+    정리 → 반복 제거 → 예산까지 담기가 세그먼트 단위로 이어지므로 예산을 채우면 나머지 세그먼트는 건드리지 않음
+    """
+    if isinstance(segments, str):
+        segments = (match.group() for match in SENTENCE_PIECE_PATTERN.finditer(segments))
+    return take_until_budget(drop_repeated_segments(clean_segments(segments)), budget, counter)
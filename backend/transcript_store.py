@@ -0,0 +1,63 @@
+import threading
+from cache import LRUCache
+
+# "자막 없음" 결과를 기억하기 위한 표시값
+NO_TRANSCRIPT = object()
+
+
+def _segments_size(segments):
+    if segments is NO_TRANSCRIPT:
+        return 64
+    return sum(len(text.encode("utf-8")) for text in segments)
+
+
+class TranscriptStore:
+    """
+    검색 중 자막 확인 결과와 자막 엔드포인트가 함께 사용하는 프로세스 공용 자막 저장소
+    자막은 세그먼트 텍스트 튜플로 저장하고, 자막이 없는 비디오도 짧은 TTL로 기억
+    disk_cache(DiskCache)를 넘기면 메모리에 없는 자막을 디스크에서 찾고, 새 자막은 디스크에도 저장
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttl=6 * 60 * 60, negative_ttl=30 * 60, disk_cache=None):
+        self.negative_ttl = negative_ttl
+        self.disk_cache = disk_cache
+        self._cache = LRUCache(max_bytes=max_bytes, ttl=ttl, sizeof=_segments_size)
+        self._lock = threading.Lock()
+        self.negative_hits = 0
+
+    @staticmethod
+    def _key(video_id, languages):
+        return f"{video_id}:{','.join(languages)}"
+
+    def get(self, video_id, languages=("ko", "en")):
+        """자막 세그먼트 튜플, NO_TRANSCRIPT(자막 없음) 또는 None(캐시 없음) 반환"""
+        key = self._key(video_id, languages)
+        segments = self._cache.get(key)
+        if segments is NO_TRANSCRIPT:
+            with self._lock:
+                self.negative_hits += 1
+            return segments
+
+        if segments is None and self.disk_cache is not None:
+            stored = self.disk_cache.get(key)
+            if stored is not None:
+                segments = tuple(stored)
+                self._cache.set(key, segments)
+        return segments
+
+    def put(self, video_id, segments, languages=("ko", "en")):
+        key = self._key(video_id, languages)
+        segments = tuple(segments)
+        self._cache.set(key, segments)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, list(segments))
+
+    def put_missing(self, video_id, languages=("ko", "en")):
+        self._cache.set(self._key(video_id, languages), NO_TRANSCRIPT, ttl=self.negative_ttl)
+
+    def stats(self):
+        stats = self._cache.stats()
+        stats["negative_hits"] = self.negative_hits
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.stats()
+        return stats
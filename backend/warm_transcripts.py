@@ -0,0 +1,80 @@
+"""
+자막 디스크 캐시 미리 채우기 스크립트
+
+사용 예:
+    python warm_transcripts.py VIDEO_ID1 VIDEO_ID2
+    python warm_transcripts.py --file video_ids.txt --workers 8
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from cache import DiskCache
+from transcript_store import TranscriptStore
+from youtube_service import YouTubeService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def read_video_ids(args):
+    video_ids = list(args.video_ids)
+    if args.file:
+        source = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+        with source:
+            video_ids.extend(line.strip() for line in source if line.strip() and not line.startswith("#"))
+    return list(dict.fromkeys(video_ids))
+
+
+def warm_transcripts(youtube_service, video_ids, workers=4):
+    """video_id 목록의 자막을 받아 캐시에 저장하고 결과 건수를 반환"""
+    counts = {"cached": 0, "no_transcript": 0, "failed": 0}
+
+    def warm(video_id):
+        try:
+            youtube_service.get_transcript(video_id)
+            return "cached"
+        except Exception as e:
+            if getattr(e, "status_code", None) == 404:
+                return "no_transcript"
+            logger.warning(f"비디오 {video_id} 자막 처리 중 오류: {str(e)}")
+            return "failed"
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(warm, video_ids):
+            counts[result] += 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자막 디스크 캐시를 video_id 목록으로 미리 채웁니다.")
+    parser.add_argument("video_ids", nargs="*", help="미리 받아둘 YouTube video_id")
+    parser.add_argument("--file", help="한 줄에 video_id 하나씩 적힌 파일 ('-'이면 표준 입력)")
+    parser.add_argument("--db", default=os.getenv("TRANSCRIPT_CACHE_PATH", "transcript_cache.sqlite3"))
+    parser.add_argument("--ttl", type=int, default=int(os.getenv("TRANSCRIPT_CACHE_TTL", str(7 * 24 * 60 * 60))))
+    parser.add_argument("--max-bytes", type=int, default=int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(512 * 1024 * 1024))))
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    video_ids = read_video_ids(args)
+    if not video_ids:
+        parser.error("video_id를 하나 이상 지정해주세요.")
+
+    disk_cache = DiskCache(args.db, ttl=args.ttl, max_bytes=args.max_bytes, table="transcripts")
+    youtube_service = YouTubeService(api_key=None, transcript_store=TranscriptStore(disk_cache=disk_cache))
+
+    started = time.perf_counter()
+    counts = warm_transcripts(youtube_service, video_ids, args.workers)
+    elapsed = time.perf_counter() - started
+
+    logger.info(
+        f"자막 캐시 채우기 완료: {len(video_ids)}개 중 저장 {counts['cached']}, "
+        f"자막 없음 {counts['no_transcript']}, 실패 {counts['failed']} ({elapsed:.1f}초)"
+    )
+    logger.info(f"디스크 캐시 상태: {disk_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+고용24(work24) 채용 목록 HTTP 크롤러
+
+retriveDtlEmpSrchList.do 목록 페이지는 서버에서 결과 표(box_table type_pd24)까지 렌더링해서 내려주므로
+헤드리스 Chrome 없이 pageIndex만 바꿔 가며 HTML을 받아 lxml로 파싱
+- 행 텍스트는 Selenium WebElement.text(화면에 보이는 텍스트)와 같은 규칙으로 만들어 preprocess_job_data 결과가 동일
+- 결과 표가 없는 응답(차단, 점검 페이지 등)은 Work24CrawlError로 알려 호출하는 쪽에서 Selenium으로 대체
+- 페이지들은 CrawlScheduler로 동시에 요청하고 (Selenium 크롤러도 crawl_pages_with_driver로 같은 방식 사용)
+  빈 페이지나 앞 페이지를 반복하는 페이지(마지막 페이지 이후)에서 멈춘 뒤 페이지 순서대로 합침
+- Selenium 크롤러는 extract_rows로 결과 표의 행/열 텍스트/링크를 execute_script 한 번에 가져옴
+  (요소마다 get_attribute/.text를 부르면 WebDriver 왕복이 페이지당 수백 번 생김)
+"""
+import logging
+import re
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import lxml.html
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+
+from crawl_scheduler import CrawlScheduler
+from driver_pool import DriverPoolTimeout
+from page_waits import PageWaiter
+
+logger = logging.getLogger(__name__)
+
+WORK24_LIST_URL = "https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do"
+
+RESULT_TABLE_XPATH = (
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' box_table ')"
+    " and contains(concat(' ', normalize-space(@class), ' '), ' type_pd24 ')]"
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+# 줄을 바꾸는 블록 요소 (Selenium 텍스트 규칙과 동일하게 table-cell은 제외)
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset", "figcaption",
+    "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main",
+    "nav", "ol", "p", "pre", "section", "table", "tbody", "thead", "tfoot", "tr", "ul",
+}
+SKIP_TAGS = {"script", "style", "template", "noscript", "head", "title", "meta", "link"}
+
+# 결과 표에서 id가 있는 행마다 {"id", "cells"(열별 화면 텍스트), "links"(href가 있는 a의 절대 URL)}를 반환
+# cells는 WebElement.text처럼 줄마다 공백을 정리하고 빈 줄을 뺀 innerText
+EXTRACT_ROWS_SCRIPT = """
+const clean = (text) => (text || "").replace(/\\u00a0/g, " ").split("\\n")
+    .map((line) => line.replace(/[ \\t\\r\\f\\v]+/g, " ").trim())
+    .filter((line) => line)
+    .join("\\n");
+return Array.from(arguments[0].getElementsByTagName("tr"))
+    .filter((row) => row.getAttribute("id"))
+    .map((row) => ({
+        id: row.getAttribute("id"),
+        cells: Array.from(row.getElementsByTagName("td")).map((cell) => clean(cell.innerText)),
+        links: Array.from(row.getElementsByTagName("a")).filter((a) => a.hasAttribute("href")).map((a) => a.href),
+    }));
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+_HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.IGNORECASE)
+
+
+class Work24CrawlError(Exception):
+    """결과 표를 찾지 못했거나 응답이 비정상이라 HTTP 크롤링을 이어갈 수 없음"""
+
+
+def page_url(target_url, page_index):
+    """목록 URL의 pageIndex/currentPageNo만 바꾼 URL (#scrollLoc 같은 fragment는 제거)"""
+    parts = urlsplit(target_url)
+    params = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in ("pageIndex", "currentPageNo")
+    ]
+    params += [("currentPageNo", str(page_index)), ("pageIndex", str(page_index))]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(params), ""))
+
+
+def search_url(keyword, **params):
+    """키워드와 검색 조건(disableEmpHopeGbn="Y", pfMatterPreferential="B" 등)으로 만든 목록 URL"""
+    return f"{WORK24_LIST_URL}?{urlencode({'srcKeyword': keyword, **params, 'pageIndex': 1})}"
+
+
+def crawl_pages(scheduler, urls, fetch_rows, max_workers=None, raise_errors=()):
+    """
+    scheduler로 urls(1페이지부터)를 가져와 행을 페이지 순서대로 합침
+    행이 없는 페이지나 다른 페이지와 행 id가 모두 같은 페이지(마지막 페이지를 넘어 반복되는 경우)를 끝으로 보고,
+    합칠 때도 새 행이 없는 페이지에서 멈춤 (max_workers, raise_errors는 CrawlScheduler.crawl에 전달)
+    """
+    seen_pages = {}
+    lock = threading.Lock()
+
+    def is_terminal(page_index, rows):
+        if not rows:
+            logger.info(f"페이지 {page_index}: 데이터 행이 없습니다. 루프 종료")
+            return True
+        signature = tuple(row["id"] for row in rows)
+        with lock:
+            # 같은 결과가 여러 페이지에 있으면 가장 앞 페이지만 살림 (뒤 페이지가 먼저 끝나 이미 받아졌어도 합칠 때 제외됨)
+            first_page = seen_pages.get(signature)
+            repeated = first_page is not None and first_page < page_index
+            if not repeated:
+                seen_pages[signature] = page_index
+        if repeated:
+            logger.info(f"페이지 {page_index}: 앞 페이지와 같은 결과입니다. 루프 종료")
+        return repeated
+
+    all_rows = []
+    seen = set()
+    pages = scheduler.crawl(urls, fetch_rows, is_terminal, max_workers=max_workers, raise_errors=raise_errors)
+    for page_index, rows in enumerate(pages, start=1):
+        new_rows = [row for row in rows if row["id"] not in seen]
+        if not new_rows:
+            break
+        seen.update(row["id"] for row in new_rows)
+        all_rows.extend(new_rows)
+        logger.info(f"페이지 {page_index} 크롤링 완료. 데이터 수: {len(all_rows)}")
+    return all_rows
+
+
+def extract_rows(driver, table):
+    """
+    결과 표(WebElement)의 id가 있는 행들을 EXTRACT_ROWS_SCRIPT 한 번으로 가져옴
+    [{"id", "cells", "links"}, ...] (스크립트 실행이 실패하면 extract_rows_by_element로 대체)
+    """
+    try:
+        rows = driver.execute_script(EXTRACT_ROWS_SCRIPT, table)
+        if isinstance(rows, list):
+            return rows
+        logger.warning(f"행 추출 스크립트 결과가 목록이 아닙니다: {type(rows).__name__}")
+    except JavascriptException as e:
+        logger.warning(f"행 추출 스크립트 실패, 요소별로 읽습니다: {e.msg}")
+    return extract_rows_by_element(table)
+
+
+def extract_rows_by_element(table):
+    """extract_rows와 같은 결과를 요소마다 WebDriver를 호출해 만듦 (행당 열/링크 수만큼 왕복)"""
+    rows = []
+    for row in table.find_elements(By.TAG_NAME, "tr"):
+        row_id = row.get_attribute("id")
+        if not row_id:
+            continue
+        hrefs = [a.get_attribute("href") for a in row.find_elements(By.TAG_NAME, "a")]
+        rows.append({
+            "id": row_id,
+            "cells": [cell.text.strip() for cell in row.find_elements(By.TAG_NAME, "td")],
+            "links": [href for href in hrefs if href],
+        })
+    return rows
+
+
+def load_rows_with_driver(driver_pool, url, process_row, waiter=None):
+    """풀에서 빌린 드라이버로 목록 페이지 하나를 열어 extract_rows로 읽은 각 행을 process_row로 변환 (None인 행은 제외)"""
+    waiter = waiter or PageWaiter()
+    with driver_pool.lease() as driver:
+        driver.get(url)
+        results_table = waiter.wait_for_results(driver)
+        rows = (process_row(row) for row in extract_rows(driver, results_table))
+        return [row for row in rows if row]
+
+
+def crawl_pages_with_driver(scheduler, driver_pool, urls, process_row, waiter=None):
+    """
+    풀의 드라이버로 urls를 동시에 열어 crawl_pages로 합침 (load_rows_with_driver 사용)
+    동시 요청 수는 풀 크기까지로 줄이고, 드라이버를 빌리지 못한 페이지(DriverPoolTimeout)는 결과 끝이 아니므로 예외를 그대로 전달
+    """
+    return crawl_pages(
+        scheduler, urls, lambda url: load_rows_with_driver(driver_pool, url, process_row, waiter),
+        max_workers=driver_pool.size, raise_errors=(DriverPoolTimeout,),
+    )
+
+
+def _is_hidden(element):
+    if element.get("hidden") is not None:
+        return True
+    if element.tag == "input" and (element.get("type") or "").lower() == "hidden":
+        return True
+    return bool(_HIDDEN_STYLE.search(element.get("style") or ""))
+
+
+def _append_text(lines, text):
+    text = _WHITESPACE.sub(" ", text)
+    if not text:
+        return
+    if lines[-1].endswith(" ") or not lines[-1]:
+        text = text.lstrip(" ")
+    lines[-1] += text
+
+
+def _new_line(lines):
+    if lines[-1].strip():
+        lines.append("")
+
+
+def _collect_lines(element, lines):
+    if not isinstance(element.tag, str) or element.tag in SKIP_TAGS or _is_hidden(element):
+        return
+    if element.tag == "br":
+        lines.append("")
+        return
+    is_block = element.tag in BLOCK_TAGS
+    if is_block:
+        _new_line(lines)
+    if element.text:
+        _append_text(lines, element.text)
+    for child in element:
+        _collect_lines(child, lines)
+        if child.tail:
+            _append_text(lines, child.tail)
+    if is_block:
+        _new_line(lines)
+
+
+def visible_text(element):
+    """Selenium WebElement.text와 같은 규칙의 텍스트 (블록 요소마다 줄바꿈, 공백 정리, 숨김 요소 제외)"""
+    lines = [""]
+    _collect_lines(element, lines)
+    return "\n".join(line.strip(" ") for line in lines if line.strip(" ")).strip()
+
+
+def parse_job_rows(html, base_url=WORK24_LIST_URL):
+    """
+    목록 페이지 HTML에서 id가 있는 행을 Selenium 크롤러와 같은 형태로 반환
+    {"id", "data"(열 텍스트 목록, preprocess_job_data 적용 전), "second_link", "source", "location"}
+    결과 표가 없으면 Work24CrawlError
+    """
+    document = lxml.html.fromstring(html, base_url=base_url)
+    document.make_links_absolute(base_url, resolve_base_href=True)
+    tables = document.xpath(RESULT_TABLE_XPATH)
+    if not tables:
+        raise Work24CrawlError("결과 표(box_table type_pd24)를 찾을 수 없습니다.")
+
+    rows = []
+    for row in tables[0].iter("tr"):
+        row_id = row.get("id")
+        if not row_id:
+            continue
+        data = [visible_text(column) for column in row.iter("td")]
+
+        location = "위치 정보 없음"
+        if len(data) > 1:
+            position_info = data[1].split("\n")
+            if len(position_info) > 3:
+                location = position_info[-1]
+                data[1] = "\n".join(position_info[:-1])
+
+        links = [a.get("href") for a in row.iter("a") if a.get("href")]
+        rows.append({
+            "id": row_id,
+            "data": data,
+            "second_link": links[1] if len(links) > 1 else "없음",
+            "source": "worknet",
+            "location": location,
+        })
+    return rows
+
+
+class Work24Crawler:
+    """
+    목록 URL의 pageIndex 1..max_pages를 scheduler(CrawlScheduler, 기본은 한 페이지씩)로 요청해 결과 행을 모음
+    첫 페이지가 실패하면 Work24CrawlError, 이후 페이지가 실패하면 Selenium 크롤러처럼 그 앞 페이지까지의 행을 반환
+    """
+
+    def __init__(self, http_client, timeout=(3.05, 10), headers=None, scheduler=None):
+        self.http_client = http_client
+        self.timeout = timeout
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.scheduler = scheduler or CrawlScheduler(max_workers=1)
+        self._lock = threading.Lock()
+        self._stats = {"crawls": 0, "rows": 0, "errors": 0, "seconds": 0.0}
+
+    def fetch_page(self, url):
+        response = self.http_client.get(url, headers=self.headers, timeout=self.timeout)
+        if response.status_code != 200:
+            raise Work24CrawlError(f"HTTP {response.status_code}: {url}")
+        return response.content
+
+    def fetch_rows(self, url):
+        return parse_job_rows(self.fetch_page(url), base_url=url)
+
+    def crawl(self, target_url, max_pages=10):
+        """원시 행 목록 (data에 preprocess_job_data를 적용하기 전)"""
+        started = time.perf_counter()
+        urls = [page_url(target_url, page_index) for page_index in range(1, max_pages + 1)]
+        try:
+            all_rows = crawl_pages(self.scheduler, urls, self.fetch_rows)
+        except Exception as e:
+            self._record(0, time.perf_counter() - started, error=True)
+            if isinstance(e, Work24CrawlError):
+                raise
+            raise Work24CrawlError(str(e)) from e
+        self._record(len(all_rows), time.perf_counter() - started)
+        return all_rows
+
+    def _record(self, rows, seconds, error=False):
+        with self._lock:
+            self._stats["crawls"] += 1
+            self._stats["rows"] += rows
+            self._stats["errors"] += int(error)
+            self._stats["seconds"] += seconds
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats["seconds"] = round(stats["seconds"], 3)
+        stats["avg_seconds_per_crawl"] = round(stats["seconds"] / stats["crawls"], 3) if stats["crawls"] else 0.0
+        stats["scheduler"] = self.scheduler.stats()
+        return stats
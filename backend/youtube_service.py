@@ -1,25 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from fastapi import HTTPException
 import requests
 from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled
+from transcript_store import TranscriptStore, NO_TRANSCRIPT
+from search_cache import normalize_keyword
+from http_client import HttpClient
+from quota import QUOTA_LEVEL_CACHED_ONLY
+from singleflight import SingleFlight
+from category_allocator import allocate_videos
+
+SEARCH_MODES = ("general", "disability", "senior")
+
+
+@dataclass(frozen=True)
+class SearchContext:
+    """
+    검색 한 번에 필요한 키워드와 검색 모드 (general / disability / senior)
+    요청마다 새로 만들어 전달하므로 여러 요청이 동시에 검색해도 서로 영향을 주지 않음
+    """
+    keyword: str
+    mode: str = "general"
+
+    def __post_init__(self):
+        if self.mode not in SEARCH_MODES:
+            raise ValueError(f"지원하지 않는 검색 모드입니다: {self.mode}")
+
+    @property
+    def base_keyword(self):
+        """검색 모드에 맞게 대상(장애인/고령자)을 붙인 기본 검색어"""
+        if self.mode == "disability" and "장애인" not in self.keyword:
+            return f"장애인 {self.keyword}"
+        if self.mode == "senior" and "고령자" not in self.keyword:
+            return f"고령자 {self.keyword}"
+        return self.keyword
 
-class YouTubeService:
-    def __init__(self, api_key):
-        self.API_KEY = api_key
-        self._latest_keyword = None
-        self._is_disability_search = False
-        self._is_senior_search = False
 
-    def set_senior_search(self, is_senior: bool):
-        """고령자 전용 검색 모드 설정"""
-        self._is_senior_search = is_senior
+class YouTubeService:
+    # videos.list 한 번에 조회할 수 있는 최대 video_id 수
+    VIDEOS_BATCH_SIZE = 50
+    # 자막 요청 시 우선순위 언어 (자막 캐시 키에도 사용)
+    TRANSCRIPT_LANGUAGES = ("ko", "en")
 
-    def set_disability_search(self, is_disability: bool):
-        """장애인 전용 검색 모드 설정"""
-        self._is_disability_search = is_disability
+    def __init__(self, api_key, max_workers=8, transcript_store=None, search_cache=None, http_client=None,
+                 quota_tracker=None, single_flight=None):
+        self.API_KEY = api_key
+        # googleapis.com 호출에 사용하는 keep-alive 연결 풀 클라이언트
+        self.http_client = http_client or HttpClient()
+        # 검색 중 확인한 자막을 자막/비교 엔드포인트에서 재사용하기 위한 공용 저장소
+        self.transcript_store = transcript_store or TranscriptStore()
+        # 카테고리 검색 결과 캐시 (None이면 매번 새로 검색)
+        self.search_cache = search_cache
+        # YouTube Data API 일일 할당량 추적기 (None이면 할당량을 따지지 않음)
+        self.quota_tracker = quota_tracker
+        # 같은 검색/자막 요청이 동시에 들어오면 한 번만 실행하도록 묶음
+        self.single_flight = single_flight or SingleFlight()
+        # 검색어/비디오 확인 요청을 동시에 처리할 스레드 풀 (max_workers로 동시 실행 수 제한)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="youtube")
 
-    def generate_category_keywords(self, keyword):
+    def generate_category_keywords(self, context):
         """키워드를 세 가지 카테고리로 확장"""
-        base_keyword = f"장애인 {keyword}" if self._is_disability_search and "장애인" not in keyword else f"고령자 {keyword}" if self._is_senior_search and "고령자" not in keyword else keyword
+        base_keyword = context.base_keyword
         categories = [
             {"id": "pros_cons", "name": "장단점", "search_terms": [f"{base_keyword} 장단점", f"{base_keyword} 특징", f"{base_keyword} 어려움"]},
             {"id": "how_to", "name": "준비방법", "search_terms": [f"{base_keyword} 되는법", f"{base_keyword} 준비", f"{base_keyword} 자격증", f"{base_keyword} 공부"]},
@@ -28,116 +69,261 @@ class YouTubeService:
         
         return categories
 
-    def get_video_info(self, video_id, keyword=None, category=None):
-        """
-        비디오 정보를 가져오는 메서드
-        keyword 파라미터와 category 파라미터 추가
-        """
+    def _build_video_info(self, video_id, item, keyword=None, category=None, context=None):
+        """videos.list 응답 항목을 비디오 정보 딕셔너리로 변환"""
+        snippet = item.get("snippet", {})
+        statistics = item.get("statistics", {})
+
+        search_keyword = keyword or (context.keyword if context else None)
+
+        return {
+            "video_id": video_id,
+            "title": snippet.get("title", ""),
+            "channel": snippet.get("channelTitle", ""),
+            "published_at": snippet.get("publishedAt", ""),
+            "description": snippet.get("description", ""),
+            "thumbnails": snippet.get("thumbnails", {}),
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+            "view_count": int(statistics.get("viewCount", 0)),
+            "like_count": int(statistics.get("likeCount", 0)),
+            "tags": snippet.get("tags", []),
+            "search_keyword": search_keyword,
+            "category": category,
+            "is_disability_content": context is not None and context.mode == "disability"
+        }
+
+    def _acquire_quota(self, call_type, priority="normal"):
+        return self.quota_tracker is None or self.quota_tracker.try_acquire(call_type, priority)
+
+    def _quota_retry_hook(self, call_type, priority="normal"):
+        # HttpClient가 429/5xx를 재시도하면 API도 요청마다 할당량을 차감하므로 재시도마다 다시 차감 (부족하면 재시도 중단)
+        return lambda: self._acquire_quota(call_type, priority)
+
+    def _check_quota_exceeded(self, response):
+        # 할당량을 모두 쓰면 API가 403 quotaExceeded를 응답
+        if self.quota_tracker is not None and response.status_code == 403 and "quotaExceeded" in response.text:
+            self.quota_tracker.mark_exhausted()
+
+    def _fetch_video_items(self, video_ids):
+        """videos.list 한 번의 호출로 최대 50개 비디오의 원본 항목을 가져옴"""
+        # videos.list는 1단위로 저렴하므로 예비 할당량까지 사용 가능
+        if not self._acquire_quota("videos.list", priority="high"):
+            raise HTTPException(status_code=503, detail="YouTube API 일일 할당량을 모두 사용했습니다.")
+
         videos_url = "https://www.googleapis.com/youtube/v3/videos"
         videos_params = {
             "part": "snippet,statistics",
-            "id": video_id,
+            "id": ",".join(video_ids),
             "key": self.API_KEY,
         }
-        
+
         try:
-            videos_response = requests.get(videos_url, params=videos_params)
+            videos_response = self.http_client.get(
+                videos_url, params=videos_params, before_retry=self._quota_retry_hook("videos.list", priority="high")
+            )
+            self._check_quota_exceeded(videos_response)
             videos_response.raise_for_status()
             videos_data = videos_response.json()
-
-            if not videos_data.get("items"):
-                raise HTTPException(status_code=404, detail="비디오를 찾을 수 없습니다.")
-
-            item = videos_data["items"][0]
-            snippet = item.get("snippet", {})
-            statistics = item.get("statistics", {})
-
-            search_keyword = keyword or self._latest_keyword
-
-            return {
-                "video_id": video_id,
-                "title": snippet.get("title", ""),
-                "channel": snippet.get("channelTitle", ""),
-                "published_at": snippet.get("publishedAt", ""),
-                "description": snippet.get("description", ""),
-                "thumbnails": snippet.get("thumbnails", {}),
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-                "view_count": int(statistics.get("viewCount", 0)),
-                "like_count": int(statistics.get("likeCount", 0)),
-                "tags": snippet.get("tags", []),
-                "search_keyword": search_keyword,
-                "category": category,
-                "is_disability_content": self._is_disability_search
-            }
-
         except requests.exceptions.RequestException as e:
             raise HTTPException(status_code=500, detail=f"YouTube API 호출 중 오류 발생: {str(e)}")
 
-    def search_youtube_videos_by_category(self, keyword, max_results_per_category=3):
-        """카테고리별로 YouTube 비디오를 검색하는 메서드"""
-        self._latest_keyword = keyword
-        categories = self.generate_category_keywords(keyword)
-        
+        return {item["id"]: item for item in videos_data.get("items", []) if "id" in item}
+
+    def get_video_infos(self, video_ids, keyword=None, category=None, raise_errors=True, context=None):
+        """
+        여러 비디오 정보를 videos.list 배치 호출로 한꺼번에 가져오는 메서드
+        video_id를 키로 하는 딕셔너리를 반환하며, 찾을 수 없는 비디오는 결과에서 빠짐
+        raise_errors=False이면 실패한 배치만 건너뛰고 나머지 결과를 반환
+        context(SearchContext)를 넘기면 검색 키워드와 장애인 콘텐츠 여부를 함께 기록
+        """
+        unique_ids = list(dict.fromkeys(video_id for video_id in video_ids if video_id))
+        batches = [
+            unique_ids[i:i + self.VIDEOS_BATCH_SIZE]
+            for i in range(0, len(unique_ids), self.VIDEOS_BATCH_SIZE)
+        ]
+
+        def fetch_batch(batch):
+            try:
+                return self._fetch_video_items(batch)
+            except HTTPException:
+                if raise_errors:
+                    raise
+                return {}
+
+        if len(batches) == 1:
+            batch_items = [fetch_batch(batches[0])]
+        else:
+            batch_items = list(self._executor.map(fetch_batch, batches))
+
+        items = {}
+        for batch_result in batch_items:
+            items.update(batch_result)
+
+        return {
+            video_id: self._build_video_info(video_id, items[video_id], keyword, category, context)
+            for video_id in unique_ids
+            if video_id in items
+        }
+
+    def get_video_info(self, video_id, keyword=None, category=None):
+        """
+        비디오 정보를 가져오는 메서드
+        keyword 파라미터와 category 파라미터 추가
+        """
+        video_info = self.get_video_infos([video_id], keyword, category).get(video_id)
+        if not video_info:
+            raise HTTPException(status_code=404, detail="비디오를 찾을 수 없습니다.")
+        return video_info
+
+    def _search_video_ids(self, search_term):
+        """검색어 하나로 YouTube를 검색하여 video_id 목록 반환 (실패하거나 할당량이 부족하면 None)"""
+        if not self._acquire_quota("search.list"):
+            return None
+
+        search_url = "https://www.googleapis.com/youtube/v3/search"
+        search_params = {
+            "part": "snippet",
+            "q": search_term,
+            "type": "video",
+            "videoDuration": "medium",
+            "maxResults": 10,
+            "key": self.API_KEY,
+        }
+
+        try:
+            search_response = self.http_client.get(
+                search_url, params=search_params, before_retry=self._quota_retry_hook("search.list")
+            )
+            self._check_quota_exceeded(search_response)
+            search_response.raise_for_status()
+            search_data = search_response.json()
+        except requests.exceptions.RequestException:
+            return None
+
+        if "items" not in search_data:
+            return None
+
+        return [item["id"]["videoId"] for item in search_data["items"] if "videoId" in item["id"]]
+
+    def _load_transcript_segments(self, video_id):
+        """
+        자막 저장소를 거쳐 자막 세그먼트 텍스트 목록을 가져오는 메서드
+        자막이 없으면 None을 반환하고 그 결과도 저장소에 기억
+        """
+        languages = self.TRANSCRIPT_LANGUAGES
+        cached = self.transcript_store.get(video_id, languages)
+        if cached is NO_TRANSCRIPT:
+            return None
+        if cached is not None:
+            return cached
+
+        return self.single_flight.do(
+            "transcript", (video_id, languages),
+            lambda: self._download_transcript_segments(video_id, languages)
+        )
+
+    def _download_transcript_segments(self, video_id, languages):
+        """YouTube에서 자막을 받아 저장소에 기록 (자막이 없으면 None)"""
+        try:
+            transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=list(languages))
+        except (NoTranscriptFound, TranscriptsDisabled):
+            self.transcript_store.put_missing(video_id, languages)
+            return None
+
+        if not transcript:
+            self.transcript_store.put_missing(video_id, languages)
+            return None
+
+        segments = tuple(entry["text"] for entry in transcript)
+        self.transcript_store.put(video_id, segments, languages)
+        return segments
+
+    def _has_transcript(self, video_id):
+        """자막이 있는 비디오인지 확인 (받아온 자막은 저장소에 보관)"""
+        try:
+            return self._load_transcript_segments(video_id) is not None
+        except Exception:
+            return False
+
+    def search_youtube_videos_by_category(self, keyword, max_results_per_category=3, mode="general"):
+        """
+        카테고리별로 YouTube 비디오를 검색하는 메서드 (검색 결과 캐시가 있으면 캐시를 거침)
+        mode는 general / disability / senior 중 하나이며, 공유 상태 없이 호출마다 전달
+        """
+        context = SearchContext(keyword, mode)
+        cache_key = (normalize_keyword(keyword), mode, max_results_per_category)
+
+        # 할당량이 거의 남지 않았으면 새로 검색하지 않고 캐시된 결과만 반환
+        if self.quota_tracker is not None and self.quota_tracker.level() == QUOTA_LEVEL_CACHED_ONLY:
+            cached = self.search_cache.peek(cache_key) if self.search_cache is not None else None
+            if cached is None:
+                raise HTTPException(status_code=503, detail="YouTube API 할당량이 부족하여 새 검색을 할 수 없습니다. 잠시 후 다시 시도해주세요.")
+            return cached
+
+        def search():
+            return self.single_flight.do(
+                "search", cache_key,
+                lambda: self._search_by_category(context, max_results_per_category)
+            )
+
+        if self.search_cache is None:
+            return search()
+
+        return self.search_cache.get_or_compute(cache_key, search)
+
+    def _search_by_category(self, context, max_results_per_category):
+        """캐시 없이 카테고리별 검색을 수행"""
+        categories = self.generate_category_keywords(context)
+
+        # 할당량이 줄어들면 카테고리별 앞쪽 검색어만 사용
+        terms_per_category = self.quota_tracker.search_terms_per_category() if self.quota_tracker is not None else None
+
+        # (카테고리 ID, 검색어) 쌍을 직렬 실행 때와 같은 순서로 나열
+        search_jobs = [
+            (category["id"], search_term)
+            for category in categories
+            for search_term in category["search_terms"][:terms_per_category]
+        ]
+
+        # 1단계: 모든 검색어를 동시에 검색
+        search_results = list(self._executor.map(
+            self._search_video_ids, [search_term for _, search_term in search_jobs]
+        ))
+
+        # 2단계: 발견된 비디오마다 자막 유무를 한 번씩 동시에 확인
+        unique_video_ids = list(dict.fromkeys(
+            video_id for video_ids in search_results if video_ids for video_id in video_ids
+        ))
+        transcript_flags = self._executor.map(self._has_transcript, unique_video_ids)
+        captioned_ids = [video_id for video_id, has_transcript in zip(unique_video_ids, transcript_flags) if has_transcript]
+
+        # 자막이 있는 비디오의 정보는 배치 호출로 한꺼번에 조회
+        probed_videos = self.get_video_infos(captioned_ids, raise_errors=False, context=context)
+
         # 모든 검색된 비디오를 저장할 딕셔너리 (video_id를 키로 사용)
         all_discovered_videos = {}
-        
-        # 각 카테고리별 검색 결과 수집 (중복 제거 전)
-        for category in categories:
-            category_id = category["id"]
-            
-            for search_term in category["search_terms"]:
-                try:
-                    # 각 검색어로 검색 수행
-                    search_url = "https://www.googleapis.com/youtube/v3/search"
-                    search_params = {
-                        "part": "snippet",
-                        "q": search_term,
-                        "type": "video",
-                        "videoDuration": "medium",
-                        "maxResults": 10,
-                        "key": self.API_KEY,
-                    }
-                    
-                    search_response = requests.get(search_url, params=search_params)
-                    search_response.raise_for_status()
-                    search_data = search_response.json()
-                    
-                    if "items" not in search_data:
-                        continue
-
-                    # 비디오 정보 가져오기
-                    video_ids = [item["id"]["videoId"] for item in search_data["items"] if "videoId" in item["id"]]
-                    
-                    for video_id in video_ids:
-                        # 이미 처리한 비디오는 건너뛰기
-                        if video_id in all_discovered_videos:
-                            # 이미 알고 있는 비디오라면 이 카테고리와 매칭 점수 업데이트
-                            all_discovered_videos[video_id]["category_matches"].append(category_id)
-                            continue
-                            
-                        try:
-                            # 자막이 있는지 확인
-                            try:
-                                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=["ko", "en"])
-                                if not transcript:
-                                    continue
-                            except Exception:
-                                continue
-                                
-                            # 비디오 정보 가져오기
-                            video_info = self.get_video_info(video_id, keyword)
-                            
-                            # 비디오 정보에 추가 정보 설정
-                            video_info["category_matches"] = [category_id]  # 이 비디오가 매칭된 카테고리들
-                            
-                            # 전체 비디오 목록에 추가
-                            all_discovered_videos[video_id] = video_info
-                            
-                        except HTTPException:
-                            continue
-                        
-                except requests.exceptions.RequestException:
+
+        # 3단계: 검색 순서대로 병합하여 직렬 실행과 동일한 결과 유지
+        for (category_id, _), video_ids in zip(search_jobs, search_results):
+            if not video_ids:
+                continue
+
+            for video_id in video_ids:
+                # 이미 처리한 비디오는 건너뛰기
+                if video_id in all_discovered_videos:
+                    # 이미 알고 있는 비디오라면 이 카테고리와 매칭 점수 업데이트
+                    all_discovered_videos[video_id]["category_matches"].append(category_id)
                     continue
+
+                video_info = probed_videos.get(video_id)
+                if video_info is None:
+                    continue
+
+                # 비디오 정보에 추가 정보 설정
+                video_info["category_matches"] = [category_id]  # 이 비디오가 매칭된 카테고리들
+
+                # 전체 비디오 목록에 추가
+                all_discovered_videos[video_id] = video_info
         
         # 비디오를 조회수 기준으로 정렬
         sorted_videos = sorted(
@@ -146,73 +332,22 @@ class YouTubeService:
             reverse=True
         )
         
-        # 결과 딕셔너리 초기화
+        # 카테고리별로 비디오 배정 (각 비디오는 한 카테고리에만 배정되므로 복사 없이 category만 설정)
+        assignments = allocate_videos(sorted_videos, [cat["id"] for cat in categories], max_results_per_category)
+
         result = {}
         for category in categories:
-            result[category["id"]] = {
+            category_id = category["id"]
+            videos = []
+            for index in assignments[category_id]:
+                video = sorted_videos[index]
+                video["category"] = category_id  # 할당된 카테고리 설정
+                videos.append(video)
+            result[category_id] = {
                 "category_name": category["name"],
-                "videos": []
+                "videos": videos
             }
-        
-        # 이미 할당된 비디오 ID를 추적
-        used_video_ids = set()
-        
-        # 1단계: 각 카테고리에만 고유하게 일치하는 비디오 할당
-        for video in sorted_videos:
-            # 이 비디오가 매칭된 카테고리가 정확히 하나뿐이라면
-            if len(video["category_matches"]) == 1 and len(result[video["category_matches"][0]]["videos"]) < max_results_per_category:
-                category_id = video["category_matches"][0]
-                video_copy = video.copy()
-                video_copy["category"] = category_id  # 할당된 카테고리 설정
-                result[category_id]["videos"].append(video_copy)
-                used_video_ids.add(video["video_id"])
-        
-        # 2단계: 카테고리 우선순위에 따라 남은 비디오 할당
-        # 부족한 카테고리 확인
-        for category_id in [cat["id"] for cat in categories]:
-            # 카테고리에 필요한 추가 비디오 수
-            needed_videos = max_results_per_category - len(result[category_id]["videos"])
-            
-            if needed_videos <= 0:
-                continue
-                
-            # 아직 할당되지 않은 비디오 중 이 카테고리와 일치하는 것 찾기
-            matching_videos = [
-                video for video in sorted_videos 
-                if video["video_id"] not in used_video_ids and category_id in video["category_matches"]
-            ]
-            
-            # 필요한 만큼 비디오 할당
-            for i, video in enumerate(matching_videos):
-                if i >= needed_videos:
-                    break
-                    
-                video_copy = video.copy()
-                video_copy["category"] = category_id  # 할당된 카테고리 설정
-                result[category_id]["videos"].append(video_copy)
-                used_video_ids.add(video["video_id"])
-        
-        # 3단계: 여전히 부족한 카테고리가 있다면 아직 사용되지 않은 비디오 할당
-        for category_id in [cat["id"] for cat in categories]:
-            # 카테고리에 필요한 추가 비디오 수
-            needed_videos = max_results_per_category - len(result[category_id]["videos"])
-            
-            if needed_videos <= 0:
-                continue
-                
-            # 아직 할당되지 않은 비디오
-            unused_videos = [video for video in sorted_videos if video["video_id"] not in used_video_ids]
-            
-            # 필요한 만큼 비디오 할당
-            for i, video in enumerate(unused_videos):
-                if i >= needed_videos:
-                    break
-                    
-                video_copy = video.copy()
-                video_copy["category"] = category_id  # 할당된 카테고리 설정
-                result[category_id]["videos"].append(video_copy)
-                used_video_ids.add(video["video_id"])
-        
+
         # 각 카테고리 내에서 조회수 기준으로 다시 정렬
         for category_id in result:
             result[category_id]["videos"].sort(key=lambda x: x["view_count"], reverse=True)
@@ -220,12 +355,15 @@ class YouTubeService:
         return result
 
     def get_transcript(self, video_id):
+        return " ".join(self.get_transcript_segments(video_id))
+
+    def get_transcript_segments(self, video_id):
+        """자막 세그먼트 텍스트 목록 (요약처럼 앞부분만 필요한 곳에서 전체 문자열을 만들지 않도록 사용)"""
         try:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=["ko", "en"])
-            if not transcript:
-                raise HTTPException(status_code=404, detail="자막이 없습니다.")
-            return " ".join([entry["text"] for entry in transcript])
-        except (NoTranscriptFound, TranscriptsDisabled) as e:
-            raise HTTPException(status_code=404, detail="자막을 사용할 수 없습니다.")
+            segments = self._load_transcript_segments(video_id)
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"자막 처리 중 오류 발생: {str(e)}")
\ No newline at end of file
+            raise HTTPException(status_code=500, detail=f"자막 처리 중 오류 발생: {str(e)}")
+
+        if segments is None:
+            raise HTTPException(status_code=404, detail="자막을 사용할 수 없습니다.")
+        return segments